@@ -1,11 +1,44 @@
-from .fpl_adapter import FPLAdapter, FPLError
-from .aws import S3Downloader, DynamoDB, S3Uploader, StateMachine, SSM
+from .fpl_adapter import FPLAdapter, FPLError, collect_pages
+from .response_cache import ResponseCache, CachePolicy
+from .scheduler import (
+    RequestScheduler,
+    RequestPriority,
+    SchedulerMetrics,
+    request_priority,
+)
+from .resilience import (
+    RetryPolicy,
+    HedgePolicy,
+    CircuitBreaker,
+    CircuitState,
+    RequestStats,
+    track_request_stats,
+)
+from .transport import RecordingTransport, ReplayTransport, FaultInjection
+from .aws import S3Downloader, DynamoDB, AsyncDynamoDB, S3Uploader, StateMachine, SSM
 
 __all__ = [
     "FPLAdapter",
     "FPLError",
+    "collect_pages",
+    "ResponseCache",
+    "CachePolicy",
+    "RequestScheduler",
+    "RequestPriority",
+    "SchedulerMetrics",
+    "request_priority",
+    "RetryPolicy",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "CircuitState",
+    "RequestStats",
+    "track_request_stats",
+    "RecordingTransport",
+    "ReplayTransport",
+    "FaultInjection",
     "S3Downloader",
     "DynamoDB",
+    "AsyncDynamoDB",
     "S3Uploader",
     "StateMachine",
     "SSM",
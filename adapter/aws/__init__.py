@@ -1,6 +1,14 @@
 from .s3 import S3Downloader, S3Uploader
 from .dynamodb import DynamoDB
+from .async_dynamodb import AsyncDynamoDB
 from .statemachine import StateMachine
 from .ssm import SSM
 
-__all__ = ["S3Downloader", "DynamoDB", "S3Uploader", "StateMachine", "SSM"]
+__all__ = [
+    "S3Downloader",
+    "DynamoDB",
+    "AsyncDynamoDB",
+    "S3Uploader",
+    "StateMachine",
+    "SSM",
+]
@@ -0,0 +1,195 @@
+import asyncio
+import functools
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+import aioboto3
+from botocore.exceptions import ClientError
+from loguru import logger
+from .dynamodb import (
+    DynamoDB,
+    _INCREMENT_UPDATE,
+    _backoff_delay,
+    _chunks,
+    _expiry_update,
+    _is_conditional_check_failure,
+    _item,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session() -> aioboto3.Session:
+    # loading the botocore service models is the slow part of a session
+    return aioboto3.Session()
+
+
+async def _client_lifetime(session: aioboto3.Session, endpoint_url: Optional[str]):
+    # left suspended on the loop that opened the client, the generator is
+    # finalized by loop.shutdown_asyncgens, which asyncio.run calls before
+    # closing the loop, so the client is closed on its own loop
+    async with session.client("dynamodb", endpoint_url=endpoint_url) as client:
+        yield client
+
+
+class AsyncDynamoDB:
+    def __init__(
+        self,
+        table_name: str,
+        session: Optional[aioboto3.Session] = None,
+        endpoint_url: Optional[str] = None,
+    ):
+        """
+        DynamoDB with the operations of adapter.aws.DynamoDB, awaited on the
+        event loop instead of blocking it.
+
+        Parameters:
+        - table_name (str): Table keyed by the string hash key KEY.
+        - session (Optional[aioboto3.Session]): Session the client is created
+          from. A session shared by the process by default.
+        - endpoint_url (Optional[str]): Endpoint of a local DynamoDB stand-in.
+        """
+        self.table_name = table_name
+        self.__session = session if session is not None else _shared_session()
+        self.__endpoint_url = endpoint_url
+        # one client per event loop, the connections of a client are bound to
+        # the loop it was opened on
+        self.__clients: Dict[asyncio.AbstractEventLoop, Tuple[Any, AsyncGenerator]] = {}
+        # concurrent first calls on a loop share one client
+        self.__opening: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+    async def open(self):
+        """
+        Open the client shared by every call on the running event loop.
+
+        A client is closed by close(), or when asyncio.run finishes its loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop in self.__clients:
+            return self.__clients[loop][0]
+        for other in [other for other in self.__clients if other.is_closed()]:
+            _, lifetime = self.__clients.pop(other)
+            if lifetime.ag_frame is not None:
+                # the loop was closed without finalizing its async generators
+                logger.warning("DynamoDB client of a closed event loop left unclosed")
+            self.__opening.pop(other, None)
+        opening = self.__opening.setdefault(loop, asyncio.Lock())
+        async with opening:
+            if loop in self.__clients:
+                return self.__clients[loop][0]
+            lifetime = _client_lifetime(self.__session, self.__endpoint_url)
+            client = await lifetime.__anext__()
+            self.__clients[loop] = (client, lifetime)
+            return client
+
+    async def close(self):
+        """
+        Close the clients of every event loop, each on its own loop. Clients
+        of loops that are not running are closed when their loop finishes.
+        """
+        loop = asyncio.get_running_loop()
+        closing = []
+        for other, (_, lifetime) in list(self.__clients.items()):
+            if other is loop:
+                closing.append(lifetime.aclose())
+            elif other.is_running():
+                future = asyncio.run_coroutine_threadsafe(lifetime.aclose(), other)
+                closing.append(asyncio.wrap_future(future))
+            else:
+                continue
+            del self.__clients[other]
+            self.__opening.pop(other, None)
+        await asyncio.gather(*closing)
+
+    async def get_item_by_hash_key(self, key: str):
+        client = await self.open()
+        return await client.get_item(TableName=self.table_name, Key={"KEY": {"S": key}})
+
+    async def put_item(self, key: str, data: Any, expires_in: Optional[float] = None):
+        """
+        Put bytes as a binary attribute and other values as JSON.
+        """
+        client = await self.open()
+        return await client.put_item(
+            TableName=self.table_name, Item=_item(key, data, expires_in)
+        )
+
+    async def increment_counter(self, key: str) -> int:
+        client = await self.open()
+        response = await client.update_item(
+            TableName=self.table_name, Key={"KEY": {"S": key}}, **_INCREMENT_UPDATE
+        )
+        return int(response["Attributes"]["DATA"]["N"])
+
+    async def delete_item_by_hash_key(self, key: str):
+        client = await self.open()
+        return await client.delete_item(
+            TableName=self.table_name, Key={"KEY": {"S": key}}
+        )
+
+    async def batch_get_items_by_hash_keys(self, keys: List[str]) -> Dict[str, dict]:
+        """
+        Like DynamoDB.batch_get_items_by_hash_keys, with the requests of
+        every chunk of 100 keys sent concurrently.
+        """
+        client = await self.open()
+        items: Dict[str, dict] = {}
+
+        async def get_chunk(chunk: List[str]):
+            request = {self.table_name: {"Keys": [{"KEY": {"S": k}} for k in chunk]}}
+            for attempt in range(DynamoDB.MAX_BATCH_ATTEMPTS):
+                if attempt > 0:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                response = await client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    items[item["KEY"]["S"]] = item
+                request = response.get("UnprocessedKeys") or {}
+                if len(request) == 0:
+                    return
+            unprocessed = len(request[self.table_name]["Keys"])
+            logger.warning(f"{unprocessed} keys of {self.table_name} unprocessed")
+
+        chunks = _chunks(list(dict.fromkeys(keys)), DynamoDB.BATCH_GET_SIZE)
+        await asyncio.gather(*[get_chunk(chunk) for chunk in chunks])
+        return items
+
+    async def __batch_write(self, requests: List[Dict[str, Any]]):
+        client = await self.open()
+
+        async def write_chunk(chunk: List[Dict[str, Any]]):
+            request = {self.table_name: chunk}
+            for attempt in range(DynamoDB.MAX_BATCH_ATTEMPTS):
+                if attempt > 0:
+                    await asyncio.sleep(_backoff_delay(attempt))
+                response = await client.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or {}
+                if len(request) == 0:
+                    return
+            raise RuntimeError(
+                f"{len(request[self.table_name])} writes to {self.table_name} "
+                f"unprocessed after {DynamoDB.MAX_BATCH_ATTEMPTS} attempts"
+            )
+
+        chunks = _chunks(requests, DynamoDB.BATCH_WRITE_SIZE)
+        await asyncio.gather(*[write_chunk(chunk) for chunk in chunks])
+
+    async def batch_put_items(
+        self, items: Dict[str, Any], expires_in: Optional[float] = None
+    ):
+        await self.__batch_write(
+            [
+                {"PutRequest": {"Item": _item(key, data, expires_in)}}
+                for key, data in items.items()
+            ]
+        )
+
+    async def refresh_expiry(self, key: str, expires_in: float) -> bool:
+        client = await self.open()
+        try:
+            await client.update_item(
+                TableName=self.table_name,
+                Key={"KEY": {"S": key}},
+                **_expiry_update(expires_in),
+            )
+        except ClientError as e:
+            if not _is_conditional_check_failure(e):
+                raise
+            return False
+        return True
@@ -1,12 +1,84 @@
 import json
+import time
+import random
+from typing import Any, Dict, List, Optional
+from loguru import logger
 from boto3 import client
+from botocore.exceptions import ClientError
 from boto3_type_annotations.dynamodb import Client as DynamoDBClient
 
 
+def _chunks(items: list, size: int) -> List[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _attribute(data: Any) -> Dict[str, Any]:
+    # bytes are stored as binary attributes and other values as JSON
+    return {"B": data} if isinstance(data, bytes) else {"S": json.dumps(data)}
+
+
+def _item(key: str, data: Any, expires_in: Optional[float]) -> Dict[str, Any]:
+    item = {"KEY": {"S": key}, "DATA": _attribute(data)}
+    if expires_in is not None:
+        item[DynamoDB.EXPIRES_AT] = {"N": str(int(time.time() + expires_in))}
+    return item
+
+
+def _backoff_delay(attempt: int) -> float:
+    return random.uniform(0, DynamoDB.BATCH_BASE_DELAY * 2**attempt)
+
+
+# UpdateItem arguments of DynamoDB.increment_counter
+_INCREMENT_UPDATE = {
+    "UpdateExpression": "ADD #data :one",
+    "ExpressionAttributeNames": {"#data": "DATA"},
+    "ExpressionAttributeValues": {":one": {"N": "1"}},
+    "ReturnValues": "UPDATED_NEW",
+}
+
+
+def _expiry_update(expires_in: float) -> Dict[str, Any]:
+    # UpdateItem arguments of DynamoDB.refresh_expiry, existing items only
+    return {
+        "UpdateExpression": "SET #expires_at = :expires_at",
+        "ConditionExpression": "attribute_exists(#key)",
+        "ExpressionAttributeNames": {"#expires_at": DynamoDB.EXPIRES_AT, "#key": "KEY"},
+        "ExpressionAttributeValues": {
+            ":expires_at": {"N": str(int(time.time() + expires_in))}
+        },
+    }
+
+
+def _is_conditional_check_failure(e: ClientError) -> bool:
+    return e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
 class DynamoDB:
-    def __init__(self, table_name: str):
+    # request limits of BatchGetItem and BatchWriteItem
+    BATCH_GET_SIZE = 100
+    BATCH_WRITE_SIZE = 25
+    MAX_BATCH_ATTEMPTS = 5
+    BATCH_BASE_DELAY = 0.05
+    # epoch seconds after which the table's TTL deletes an item
+    EXPIRES_AT = "EXPIRES_AT"
+
+    def __init__(self, table_name: str, endpoint_url: Optional[str] = None):
+        """
+        Parameters:
+        - table_name (str): Table keyed by the string hash key KEY.
+        - endpoint_url (Optional[str]): Endpoint of a local DynamoDB stand-in.
+        """
         self.table_name = table_name
-        self.dynamodb: DynamoDBClient = client("dynamodb")
+        self.dynamodb: DynamoDBClient = client("dynamodb", endpoint_url=endpoint_url)
+
+    @staticmethod
+    def is_expired(item: dict) -> bool:
+        """
+        Whether the TTL of an item passed. Expired items are returned until
+        DynamoDB gets to delete them, which may take days.
+        """
+        expires_at = item.get(DynamoDB.EXPIRES_AT)
+        return expires_at is not None and float(expires_at["N"]) <= time.time()
 
     def get_item_by_hash_key(self, key: str):
         item = self.dynamodb.get_item(
@@ -14,16 +86,114 @@ class DynamoDB:
         )
         return item
 
-    def put_json_item(self, key: str, data: dict):
+    def put_json_item(self, key: str, data: dict, expires_in: Optional[float] = None):
         item = self.dynamodb.put_item(
             TableName=self.table_name,
-            Item={"KEY": {"S": key}, "DATA": {"S": json.dumps(data)}},
+            Item=_item(key, data, expires_in),
         )
         return item
 
+    def put_binary_item(
+        self, key: str, data: bytes, expires_in: Optional[float] = None
+    ):
+        item = self.dynamodb.put_item(
+            TableName=self.table_name,
+            Item=_item(key, data, expires_in),
+        )
+        return item
+
+    def increment_counter(self, key: str) -> int:
+        """
+        Atomically add one to the number stored at `key`, starting from 0.
+
+        Returns:
+        - int: The incremented number.
+        """
+        response = self.dynamodb.update_item(
+            TableName=self.table_name,
+            Key={"KEY": {"S": key}},
+            **_INCREMENT_UPDATE,
+        )
+        return int(response["Attributes"]["DATA"]["N"])
+
     def delete_item_by_hash_key(self, key: str):
         response = self.dynamodb.delete_item(
             TableName=self.table_name,
             Key={"KEY": {"S": key}},
         )
         return response
+
+    def batch_get_items_by_hash_keys(self, keys: List[str]) -> Dict[str, dict]:
+        """
+        Get items with BatchGetItem, 100 keys per request. Unprocessed keys
+        are retried with backoff.
+
+        Returns:
+        - Dict[str, dict]: Items by key. Missing keys are left out, as are
+          keys still unprocessed after the last attempt.
+        """
+        items: Dict[str, dict] = {}
+        for chunk in _chunks(list(dict.fromkeys(keys)), DynamoDB.BATCH_GET_SIZE):
+            request = {self.table_name: {"Keys": [{"KEY": {"S": k}} for k in chunk]}}
+            for attempt in range(DynamoDB.MAX_BATCH_ATTEMPTS):
+                if attempt > 0:
+                    time.sleep(_backoff_delay(attempt))
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    items[item["KEY"]["S"]] = item
+                request = response.get("UnprocessedKeys") or {}
+                if len(request) == 0:
+                    break
+            else:
+                unprocessed = len(request[self.table_name]["Keys"])
+                logger.warning(f"{unprocessed} keys of {self.table_name} unprocessed")
+        return items
+
+    def __batch_write(self, requests: List[Dict[str, Any]]):
+        for chunk in _chunks(requests, DynamoDB.BATCH_WRITE_SIZE):
+            request = {self.table_name: chunk}
+            for attempt in range(DynamoDB.MAX_BATCH_ATTEMPTS):
+                if attempt > 0:
+                    time.sleep(_backoff_delay(attempt))
+                response = self.dynamodb.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or {}
+                if len(request) == 0:
+                    break
+            else:
+                raise RuntimeError(
+                    f"{len(request[self.table_name])} writes to {self.table_name} "
+                    f"unprocessed after {DynamoDB.MAX_BATCH_ATTEMPTS} attempts"
+                )
+
+    def batch_put_items(
+        self, items: Dict[str, Any], expires_in: Optional[float] = None
+    ):
+        """
+        Put items with BatchWriteItem, 25 per request. Bytes are stored as
+        binary attributes and other values as JSON.
+        """
+        requests = [
+            {"PutRequest": {"Item": _item(key, data, expires_in)}}
+            for key, data in items.items()
+        ]
+        self.__batch_write(requests)
+
+    def refresh_expiry(self, key: str, expires_in: float) -> bool:
+        """
+        Make the item of `key` expire `expires_in` seconds from now, without
+        reading or rewriting its data.
+
+        Returns:
+        - bool: Whether the item exists.
+        """
+        try:
+            self.dynamodb.update_item(
+                TableName=self.table_name,
+                Key={"KEY": {"S": key}},
+                **_expiry_update(expires_in),
+            )
+        except ClientError as e:
+            if not _is_conditional_check_failure(e):
+                raise
+            return False
+        return True
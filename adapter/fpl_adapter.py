@@ -1,9 +1,49 @@
-from dataclasses import fields
+import json
+import time
+import asyncio
+import contextlib
+from collections import OrderedDict, deque
 from http import HTTPStatus
-from typing import List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 import httpx
+from loguru import logger
 import models
 import util
+from .scheduler import (
+    RequestScheduler,
+    SchedulerMetrics,
+    SharedPriority,
+    current_request_priority,
+    shared_request_priority,
+)
+from .response_cache import ResponseCache, CachedResponse, find_cache_policy
+from .json_stream import BootstrapStream, SectionItem
+from .resilience import (
+    CircuitBreaker,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+    current_request_stats,
+    parse_retry_after,
+)
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# body of the 503 FPL serves between gameweeks
+GAME_UPDATING_MESSAGE = b"the game is being updated"
 
 
 class FPLError(Exception):
@@ -19,22 +59,526 @@ def urljoin(base, path):
     return base + path
 
 
+async def collect_pages(
+    pages: AsyncIterator[T], get_items: Callable[[T], List[U]]
+) -> List[U]:
+    """
+    Concatenate the items of every page. Pages are requested with the
+    bounded prefetch of the iterator.
+    """
+    items: List[U] = []
+    async for page in pages:
+        items.extend(get_items(page))
+    return items
+
+
 class FPLAdapter:
     BASE_URL = "https://fantasy.premierleague.com"
     TIMEOUT = 10
+    MAX_CONNECTIONS = 20
+    MAX_KEEPALIVE_CONNECTIONS = 10
+    KEEPALIVE_EXPIRY = 60
+    FINISHED_GAMEWEEK_META_KEY = "finished_gameweek"
+    # a season runs from August to May, a persisted finished gameweek of an
+    # older season would cache the new season's live gameweeks as finished
+    SEASON_LENGTH = 300 * 24 * 3600
+    # finished gameweek data does not change for the rest of the season, but
+    # its urls do not name the season, so it expires well before the next
+    # season reuses them
+    FINISHED_GAMEWEEK_TTL = 30 * 24 * 3600
+    MAX_DECODED_RESPONSES = 64
+    STREAM_CHUNK_SIZE = 65536
+    PAGE_PREFETCH = 2
 
-    def __init__(self, cookies: str):
+    def __init__(
+        self,
+        cookies: str,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        scheduler: Optional[RequestScheduler] = None,
+        response_cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_url: str = BASE_URL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Parameters:
+        - base_url (str): Root of the FPL API, e.g. a local stand-in server.
+        - transport (Optional[httpx.AsyncBaseTransport]): Transport of the
+          http client, e.g. to record or replay responses. Connection limits
+          and http2 only apply to the default transport.
+        """
         self.__cookies = cookies
+        self.__base_url = base_url
+        self.__transport = transport
+        self.__scheduler = (
+            scheduler if scheduler is not None else RequestScheduler.from_env()
+        )
+        self.__limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.__http2 = http2
+        self.__client: Optional[httpx.AsyncClient] = None
+        self.__client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # key -> (shared call, priority of its requests)
+        self.__in_flight: Dict[str, Tuple[asyncio.Future, SharedPriority]] = {}
+        self.__response_cache = response_cache
+        self.__retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.__hedge_policy = (
+            hedge_policy if hedge_policy is not None else HedgePolicy()
+        )
+        self.__circuit_breaker = (
+            circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        )
+        self.__latencies: Dict[str, LatencyTracker] = {}
+        self.__finished_gameweek: Optional[int] = None
+        # url -> (stored_at of the cached body, decoded result)
+        self.__decoded: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        if response_cache is not None:
+            finished_gameweek = response_cache.get_meta(
+                FPLAdapter.FINISHED_GAMEWEEK_META_KEY
+            )
+            # "<first deadline of the season>:<finished gameweek>", values
+            # without a season are ignored
+            if finished_gameweek is not None and ":" in finished_gameweek:
+                season, gameweek = (int(v) for v in finished_gameweek.split(":"))
+                if time.time() - season < FPLAdapter.SEASON_LENGTH:
+                    self.__finished_gameweek = gameweek
+
+    async def open(self) -> httpx.AsyncClient:
+        """
+        Open the shared connection pool for the running event loop.
+
+        The pool is bound to the loop it was created on, so a new pool is
+        created when the adapter is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self.__client is not None
+            and not self.__client.is_closed
+            and self.__client_loop is loop
+        ):
+            return self.__client
+
+        if self.__client is not None and not self.__client.is_closed:
+            # connections of a pool created on another loop cannot be reused
+            logger.warning("discarding FPL http client bound to another event loop")
 
-    async def __get_request(self, url: str):
-        async with httpx.AsyncClient() as client:
+        self.__client = httpx.AsyncClient(
+            limits=self.__limits,
+            http2=self.__http2,
+            transport=self.__transport,
+            timeout=FPLAdapter.TIMEOUT,
+            follow_redirects=True,
+        )
+        self.__client_loop = loop
+        return self.__client
+
+    async def close(self):
+        if self.__client is None:
+            return
+        client = self.__client
+        self.__client = None
+        self.__client_loop = None
+        if not client.is_closed:
+            await client.aclose()
+
+    def get_scheduler_metrics(self) -> Dict[str, SchedulerMetrics]:
+        return self.__scheduler.metrics()
+
+    async def __send(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        started: Optional[asyncio.Event] = None,
+    ) -> httpx.Response:
+        client = await self.open()
+        host = httpx.URL(url).host
+        async with self.__scheduler.slot(host):
+            if started is not None:
+                started.set()
+            started_at = time.monotonic()
             response = await client.get(
-                url,
-                params={"cookies": self.__cookies},
-                timeout=FPLAdapter.TIMEOUT,
-                follow_redirects=True,
+                url, params={"cookies": self.__cookies}, headers=headers
+            )
+        latency = time.monotonic() - started_at
+        current_request_stats().latencies.append(latency)
+        if response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.__latencies.setdefault(host, LatencyTracker()).record(latency)
+        return response
+
+    def __hedge_delay(self, host: str) -> Optional[float]:
+        policy = self.__hedge_policy
+        tracker = self.__latencies.get(host)
+        if not policy.enabled or tracker is None or len(tracker) < policy.min_samples:
+            return None
+        return min(
+            policy.max_delay, max(policy.min_delay, tracker.quantile(policy.quantile))
+        )
+
+    async def __send_hedged(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send the request and, if it is still running after the hedge delay of
+        its host, a duplicate. The first successful response wins.
+        """
+        delay = self.__hedge_delay(httpx.URL(url).host)
+        if delay is None:
+            return await self.__send(url, headers=headers)
+        stats = current_request_stats()
+        started = asyncio.Event()
+        primary = asyncio.ensure_future(
+            self.__send(url, headers=headers, started=started)
+        )
+        pending = {primary}
+        try:
+            # time spent queued in the scheduler does not count
+            started_waiter = asyncio.ensure_future(started.wait())
+            try:
+                await asyncio.wait(
+                    {primary, started_waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                started_waiter.cancel()
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if len(done) == 0:
+                stats.hedges += 1
+                pending.add(asyncio.ensure_future(self.__send(url, headers=headers)))
+            error: Optional[BaseException] = None
+            while True:
+                for future in done:
+                    if future.exception() is None:
+                        if future is not primary:
+                            stats.hedge_wins += 1
+                        return future.result()
+                    error = future.exception()
+                if len(pending) == 0:
+                    raise error
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def __retrying(
+        self,
+        url: str,
+        attempt: Callable[[], Awaitable[T]],
+        response_of: Callable[[T], httpx.Response] = lambda result: result,
+    ) -> T:
+        """
+        Run `attempt` until it returns a non-retryable response. Transport
+        errors and retryable statuses are retried with backoff, or after
+        Retry-After. The last response is returned when attempts run out.
+        """
+        policy = self.__retry_policy
+        breaker = self.__circuit_breaker
+        stats = current_request_stats()
+        result: Optional[T] = None
+        for i in range(policy.max_attempts):
+            if not breaker.allow():
+                stats.rejected += 1
+                raise FPLError(f"FPL is unavailable, circuit breaker is open: {url}")
+            stats.requests += 1
+            is_last_attempt = i + 1 == policy.max_attempts
+            try:
+                result = await attempt()
+            except httpx.TransportError as e:
+                stats.failures += 1
+                breaker.record_failure()
+                if is_last_attempt:
+                    raise FPLError(f"request failed with error: {e}") from e
+                delay = policy.backoff(i)
+                reason = type(e).__name__
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception:
+                # e.g. a body that cannot be decoded, the probe must not stay
+                # in flight
+                stats.failures += 1
+                breaker.record_failure()
+                raise
+            else:
+                response = response_of(result)
+                if response.status_code not in policy.retry_statuses:
+                    breaker.record_success()
+                    return result
+                stats.failures += 1
+                if GAME_UPDATING_MESSAGE in response.content.lower():
+                    # FPL is down until the update is over, stop calling it
+                    breaker.trip()
+                    return result
+                breaker.record_failure()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if is_last_attempt or (
+                    retry_after is not None and retry_after > policy.max_retry_after
+                ):
+                    return result
+                delay = policy.backoff(i) if retry_after is None else retry_after
+                reason = f"status {response.status_code}"
+            stats.retries += 1
+            logger.warning(f"retrying {url} in {delay:.2f}s after {reason}")
+            await asyncio.sleep(delay)
+        return result
+
+    async def __get_request(self, url: str, headers: Optional[Dict[str, str]] = None):
+        return await self.__retrying(
+            url, lambda: self.__send_hedged(url, headers=headers)
+        )
+
+    async def __stream_request(
+        self,
+        url: str,
+        stream: Callable[[], Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[httpx.Response, bytes, Any]:
+        """
+        GET `url` feeding each chunk of a 200 body to a decoder created by
+        `stream` as it arrives. Every attempt starts a new decoder.
+
+        Returns:
+        - Tuple[httpx.Response, bytes, Any]: The response, its whole body,
+          which is also read for other statuses, and the decoder.
+        """
+
+        async def attempt():
+            body_stream = stream()
+            client = await self.open()
+            async with self.__scheduler.slot(httpx.URL(url).host):
+                started_at = time.monotonic()
+                async with client.stream(
+                    "GET", url, params={"cookies": self.__cookies}, headers=headers
+                ) as response:
+                    if response.status_code != HTTPStatus.OK:
+                        return response, await response.aread(), body_stream
+                    chunks = []
+                    async for chunk in response.aiter_bytes():
+                        body_stream.feed(chunk)
+                        chunks.append(chunk)
+            current_request_stats().latencies.append(time.monotonic() - started_at)
+            return response, b"".join(chunks), body_stream
+
+        return await self.__retrying(url, attempt, lambda result: result[0])
+
+    async def __single_flight(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Share one in-flight call between concurrent callers of the same key.
+        Its requests run at the most urgent priority of the callers.
+        """
+        loop = asyncio.get_running_loop()
+        priority = current_request_priority()
+        in_flight = self.__in_flight.get(key)
+        if in_flight is None or in_flight[0].get_loop() is not loop:
+            shared = SharedPriority(priority)
+
+            async def call() -> T:
+                with shared_request_priority(shared):
+                    return await factory()
+
+            future = asyncio.ensure_future(call())
+            self.__in_flight[key] = (future, shared)
+
+            def _forget(f: asyncio.Future):
+                in_flight = self.__in_flight.get(key)
+                if in_flight is not None and in_flight[0] is f:
+                    del self.__in_flight[key]
+
+            future.add_done_callback(_forget)
+        else:
+            future, shared = in_flight
+            # the shared request is as urgent as its most urgent caller
+            shared.raise_to(priority)
+        # shield so that one cancelled caller does not cancel the others
+        return await asyncio.shield(future)
+
+    async def __iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[T]],
+        has_next: Callable[[T], bool],
+        prefetch: int,
+    ) -> AsyncIterator[T]:
+        """
+        Yield pages in order from page 1 until one has no next page. Page 1
+        is requested alone. Once a page is known to have a next page, up to
+        `prefetch` pages after it are requested while it is consumed, so at
+        most `prefetch - 1` requests go past the last page. Those are not
+        awaited, but as requests are shared between callers they still run
+        to completion.
+        """
+        pending: Deque[asyncio.Future] = deque()
+        next_page = 1
+
+        def schedule(count: int):
+            nonlocal next_page
+            while len(pending) < count:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+
+        try:
+            schedule(1)
+            while len(pending) > 0:
+                page = await pending.popleft()
+                if not has_next(page):
+                    yield page
+                    break
+                # the next page exists, the ones after it are speculative
+                schedule(max(1, prefetch))
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            # errors of pages past the last one are expected, do not log them
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def purge_response_cache(self, url_prefix: Optional[str] = None) -> int:
+        if self.__response_cache is None:
+            return 0
+        return self.__response_cache.purge(url_prefix)
+
+    def __update_finished_gameweek(self, bootstrap: models.Bootstrap):
+        if len(bootstrap.events) == 0:
+            return
+        # 0 until the first gameweek of the season is finished
+        self.__finished_gameweek = max(
+            [
+                event.id
+                for event in bootstrap.events
+                if event.finished and event.data_checked
+            ],
+            default=0,
+        )
+        if self.__response_cache is not None:
+            season = min(event.deadline_time_epoch for event in bootstrap.events)
+            self.__response_cache.put_meta(
+                FPLAdapter.FINISHED_GAMEWEEK_META_KEY,
+                f"{season}:{self.__finished_gameweek}",
             )
-            return response
+
+    async def __get_finished_gameweek(self) -> Optional[int]:
+        if self.__finished_gameweek is None:
+            # decoding bootstrap updates the finished gameweek
+            await self.get_bootstrap()
+        return self.__finished_gameweek
+
+    async def __resolve_cache_ttl(self, url: str) -> Tuple[bool, Optional[float]]:
+        """
+        Returns:
+        - Tuple[bool, Optional[float]]: Whether the response is cacheable and
+          its TTL (None never expires).
+        """
+        path = url[len(self.__base_url) :]
+        policy = find_cache_policy(path)
+        if policy is None or policy.ttl == 0:
+            return False, 0
+        ttl = policy.ttl
+        if policy.gameweek_group is not None:
+            gameweek = int(policy.pattern.search(path).group(policy.gameweek_group))
+            finished_gameweek = await self.__get_finished_gameweek()
+            if finished_gameweek is not None and gameweek <= finished_gameweek:
+                ttl = FPLAdapter.FINISHED_GAMEWEEK_TTL
+        return True, ttl
+
+    def __remember_decoded(self, url: str, stored_at: float, result: Any):
+        self.__decoded[url] = (stored_at, result)
+        self.__decoded.move_to_end(url)
+        while len(self.__decoded) > FPLAdapter.MAX_DECODED_RESPONSES:
+            self.__decoded.popitem(last=False)
+
+    def __decode_cached(
+        self,
+        url: str,
+        entry: CachedResponse,
+        decode: Callable[[Any], T],
+        stream: Optional[Callable[[], Any]] = None,
+    ) -> T:
+        decoded = self.__decoded.get(url)
+        if decoded is not None and decoded[0] == entry.stored_at:
+            # same body as last decoded, skip parsing
+            self.__decoded.move_to_end(url)
+            return decoded[1]
+        if stream is None:
+            result = decode(json.loads(entry.body))
+        else:
+            body_stream = stream()
+            body = entry.body
+            for i in range(0, len(body), FPLAdapter.STREAM_CHUNK_SIZE):
+                body_stream.feed(body[i : i + FPLAdapter.STREAM_CHUNK_SIZE])
+            result = decode(body_stream.close())
+        self.__remember_decoded(url, entry.stored_at, result)
+        return result
+
+    async def __get(
+        self,
+        url: str,
+        decode: Callable[[Any], T],
+        stream: Optional[Callable[[], Any]] = None,
+    ) -> T:
+        """
+        Parameters:
+        - decode (Callable[[Any], T]): Builds the result from the parsed body.
+        - stream (Optional[Callable[[], Any]]): Creates an incremental decoder
+          with feed(bytes) and close(). When given, the body is decoded as it
+          arrives and decode receives what close() returns.
+        """
+
+        async def fetch():
+            entry: Optional[CachedResponse] = None
+            headers: Dict[str, str] = {}
+            if self.__response_cache is not None:
+                entry = self.__response_cache.get_entry(url)
+                if entry is not None and entry.is_fresh:
+                    return self.__decode_cached(url, entry, decode, stream)
+                if entry is not None and entry.etag is not None:
+                    headers["If-None-Match"] = entry.etag
+                if entry is not None and entry.last_modified is not None:
+                    headers["If-Modified-Since"] = entry.last_modified
+
+            if stream is None:
+                response = await self.__get_request(url, headers=headers)
+                content = response.content
+                body_stream = None
+            else:
+                response, content, body_stream = await self.__stream_request(
+                    url, stream, headers=headers
+                )
+            if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+                _, ttl = await self.__resolve_cache_ttl(url)
+                self.__response_cache.touch(url, ttl)
+                return self.__decode_cached(url, entry, decode, stream)
+            if response.status_code != HTTPStatus.OK:
+                raise FPLError(
+                    f"unexpected http status code: {response.status_code} with response data: {content}"
+                )
+            if body_stream is None:
+                result = decode(response.json())
+            else:
+                result = decode(body_stream.close())
+            if self.__response_cache is None:
+                return result
+            cacheable, ttl = await self.__resolve_cache_ttl(url)
+            if cacheable:
+                stored = self.__response_cache.put(
+                    url,
+                    content,
+                    ttl,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+                self.__remember_decoded(url, stored.stored_at, result)
+            return result
+
+        return await self.__single_flight(url, fetch)
 
     @staticmethod
     def get_team_badge_image_url(team_code: str):
@@ -45,215 +589,245 @@ class FPLAdapter:
         return f"https://resources.premierleague.com/premierleague/photos/players/{width}x{height}/p{element_code}.png"
 
     @util.time_track(description="Get FPL Bootstrap")
-    async def get_bootstrap(self):
-        url = urljoin(FPLAdapter.BASE_URL, "/api/bootstrap-static")
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: dict = response.json()
-        bootstrap_elem_fields = [f.name for f in fields(models.BootstrapElement)]
-        elements: list[models.BootstrapElement] = []
-        for d in data.get("elements"):
-            new_data = {}
-            for k in d:
-                if k not in bootstrap_elem_fields:
-                    continue
-                new_data[k] = d[k]
-            elements.append(models.BootstrapElement(**new_data))
-
-        bootstrap = models.Bootstrap(
-            events=[models.BootstrapGameweek(**d) for d in data.get("events")],
-            elements=elements,
-            teams=[models.BootstrapTeam(**d) for d in data.get("teams")],
-        )
-        return bootstrap
+    async def get_bootstrap(self) -> models.Bootstrap:
+        url = urljoin(self.__base_url, "/api/bootstrap-static")
+
+        def decode(bootstrap: models.Bootstrap):
+            self.__update_finished_gameweek(bootstrap)
+            return bootstrap
+
+        # the largest payload, decoded into models while it downloads
+        return await self.__get(url, decode, stream=BootstrapStream)
+
+    async def stream_bootstrap(
+        self,
+        sections: Optional[Sequence[str]] = None,
+        fields: Optional[Dict[str, Sequence[str]]] = None,
+    ) -> AsyncIterator[SectionItem]:
+        """
+        Yield (section, model) of bootstrap-static as soon as each model is
+        downloaded. The response cache is not used.
+
+        Parameters:
+        - sections (Optional[Sequence[str]]): Any of "events", "elements" and
+          "teams". All by default.
+        - fields (Optional[Dict[str, Sequence[str]]]): Fields to keep per
+          section, the other fields of its models are left unset.
+        """
+        url = urljoin(self.__base_url, "/api/bootstrap-static")
+
+        async def attempt() -> Tuple[httpx.Response, contextlib.AsyncExitStack]:
+            # the request slot and the response stay open for the caller
+            client = await self.open()
+            stack = contextlib.AsyncExitStack()
+            try:
+                await stack.enter_async_context(
+                    self.__scheduler.slot(httpx.URL(url).host)
+                )
+                response = await stack.enter_async_context(
+                    client.stream("GET", url, params={"cookies": self.__cookies})
+                )
+                if response.status_code != HTTPStatus.OK:
+                    await response.aread()
+                    await stack.aclose()
+            except BaseException:
+                await stack.aclose()
+                raise
+            return response, stack
+
+        # retried until the body starts, models already yielded are not
+        response, stack = await self.__retrying(url, attempt, lambda result: result[0])
+        async with stack:
+            if response.status_code != HTTPStatus.OK:
+                raise FPLError(
+                    f"unexpected http status code: {response.status_code} with response data: {response.content}"
+                )
+            body_stream = BootstrapStream(sections=sections, fields=fields)
+            try:
+                # the request slot is held until the body is consumed
+                async for chunk in response.aiter_bytes():
+                    for item in body_stream.feed(chunk):
+                        yield item
+            except (httpx.TransportError, ValueError):
+                self.__circuit_breaker.record_failure()
+                raise
+        for item in body_stream.flush():
+            yield item
 
     @util.time_track(description="")
     async def get_league_entries(self, league_id: int) -> List[models.FPLLeagueEntry]:
-        url = urljoin(FPLAdapter.BASE_URL, f"/api/league/{league_id}/entries")
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data = response.json()
-        return [models.FPLLeagueEntry(**d) for d in data]
+        url = urljoin(self.__base_url, f"/api/league/{league_id}/entries")
+
+        def decode(data: List[dict]):
+            return models.decode_list(models.FPLLeagueEntry, data)
+
+        return await self.__get(url, decode)
 
     @util.time_track(description="FPLAdapter.get_gameweek_event_status")
     async def get_gameweek_event_status(self):
-        url = urljoin(FPLAdapter.BASE_URL, "/api/event-status")
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: dict = response.json()
+        url = urljoin(self.__base_url, "/api/event-status")
 
-        return models.FPLEventStatusResponse(
-            leagues=data.get("leagues"),
-            status=[models.FPLEventStatus(**d) for d in data.get("status")],
-        )
+        def decode(data: dict):
+            return models.decode(models.FPLEventStatusResponse, data)
+
+        return await self.__get(url, decode)
 
     @util.time_track(description="FPLAdapter.get_h2h_league_standing")
-    async def get_h2h_league_standing(self, league_id: int):
+    async def get_h2h_league_standing(
+        self, league_id: int, page: int = 1
+    ) -> models.FPLLeagueStandings:
         url = urljoin(
-            FPLAdapter.BASE_URL,
-            f"/api/leagues-h2h/{league_id}/standings/?page_new_entries=1&page_standings=1",
+            self.__base_url,
+            f"/api/leagues-h2h/{league_id}/standings/?page_new_entries=1&page_standings={page}",
         )
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
+
+        def decode(data: dict):
+            standings = data.get("standings")
+            return models.FPLLeagueStandings(
+                league_id=data.get("league").get("id"),
+                league_name=data.get("league").get("name"),
+                standings=models.decode_list(
+                    models.FPLTeamStanding, standings.get("results")
+                ),
+                page=standings.get("page", page),
+                has_next=standings.get("has_next", False),
             )
-        data: dict = response.json()
-
-        return models.FPLLeagueStandings(
-            league_id=data.get("league").get("id"),
-            league_name=data.get("league").get("name"),
-            standings=[
-                models.FPLTeamStanding(**d)
-                for d in data.get("standings").get("results")
-            ],
+
+        return await self.__get(url, decode)
+
+    def iter_h2h_league_standings(
+        self, league_id: int, prefetch: int = PAGE_PREFETCH
+    ) -> AsyncIterator[models.FPLLeagueStandings]:
+        return self.__iter_pages(
+            lambda page: self.get_h2h_league_standing(league_id, page=page),
+            lambda standings: standings.has_next,
+            prefetch,
         )
 
-    async def get_classic_league_standings(self, league_id: int):
+    async def list_h2h_league_standings(
+        self, league_id: int, max_concurrency: int = PAGE_PREFETCH + 1
+    ) -> List[models.FPLTeamStanding]:
+        pages = self.iter_h2h_league_standings(league_id, prefetch=max_concurrency - 1)
+        return await collect_pages(pages, lambda standings: standings.standings)
+
+    async def get_classic_league_standings(
+        self, league_id: int, page: int = 1
+    ) -> models.FPLClassicLeagueStandingData:
         url = urljoin(
-            FPLAdapter.BASE_URL,
-            f"/api/leagues-classic/{league_id}/standings",
+            self.__base_url,
+            f"/api/leagues-classic/{league_id}/standings/?page_standings={page}",
         )
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: dict = response.json()
-        standings = data.get("standings")
-        standing_result_fields = [
-            f.name for f in fields(models.FPLClassicLeagueStandingResult)
-        ]
-        standing_results: list[models.FPLClassicLeagueStandingResult] = []
-        for s in standings.get("results"):
-            d = {}
-            for k in s:
-                if k not in standing_result_fields:
-                    continue
-                d[k] = s[k]
-            standing_results.append(models.FPLClassicLeagueStandingResult(**d))
-
-        result = models.FPLClassicLeagueStandingData(
-            league=models.FPLClassicLeagueInfo(**data.get("league")),
-            standings=models.FPLClassicLeagueStandings(
-                has_next=standings.get("has_next"),
-                page=standings.get("page"),
-                results=standing_results,
-            ),
+
+        def decode(data: dict):
+            return models.decode(models.FPLClassicLeagueStandingData, data)
+
+        return await self.__get(url, decode)
+
+    def iter_classic_league_standings(
+        self, league_id: int, prefetch: int = PAGE_PREFETCH
+    ) -> AsyncIterator[models.FPLClassicLeagueStandingData]:
+        return self.__iter_pages(
+            lambda page: self.get_classic_league_standings(league_id, page=page),
+            lambda data: data.standings.has_next,
+            prefetch,
         )
-        return result
+
+    async def list_classic_league_standings(
+        self, league_id: int, max_concurrency: int = PAGE_PREFETCH + 1
+    ) -> List[models.FPLClassicLeagueStandingResult]:
+        pages = self.iter_classic_league_standings(
+            league_id, prefetch=max_concurrency - 1
+        )
+        return await collect_pages(pages, lambda data: data.standings.results)
 
     @util.time_track(description="FPLAdapter.get_h2h_results")
-    async def get_h2h_results(self, gameweek: int, league_id: int):
+    async def get_h2h_results(self, gameweek: int, league_id: int, page: int = 1):
         url = urljoin(
-            FPLAdapter.BASE_URL,
-            f"/api/leagues-h2h-matches/league/{league_id}/?page=1&event={gameweek}",
+            self.__base_url,
+            f"/api/leagues-h2h-matches/league/{league_id}/?page={page}&event={gameweek}",
         )
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
 
-        data = response.json()
+        def decode(data: dict):
+            return models.decode(models.FPLH2HResponse, data)
 
-        return models.FPLH2HResponse(
-            has_next=data.get("has_next"),
-            page=data.get("page"),
-            results=[models.FPLH2HData(**d) for d in data.get("results")],
+        return await self.__get(url, decode)
+
+    def iter_h2h_results(
+        self, gameweek: int, league_id: int, prefetch: int = PAGE_PREFETCH
+    ) -> AsyncIterator[models.FPLH2HResponse]:
+        return self.__iter_pages(
+            lambda page: self.get_h2h_results(gameweek, league_id, page=page),
+            lambda response: response.has_next,
+            prefetch,
         )
 
+    async def list_h2h_results(
+        self, gameweek: int, league_id: int, max_concurrency: int = PAGE_PREFETCH + 1
+    ) -> List[models.FPLH2HData]:
+        pages = self.iter_h2h_results(gameweek, league_id, prefetch=max_concurrency - 1)
+        return await collect_pages(pages, lambda response: response.results)
+
     @util.time_track(description="FPLAdapter.get_player_gameweek_picks")
     async def get_player_gameweek_picks(self, gameweek: int, player_id: int):
         url = urljoin(
-            FPLAdapter.BASE_URL, f"/api/entry/{player_id}/event/{gameweek}/picks/"
-        )
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data = response.json()
-
-        return models.FPLPlayerGameweekPicksData(
-            active_chip=data.get("active_chip"),
-            entry_history=models.FPLPlayerGameweekPickEntryHistory(
-                **data.get("entry_history"),
-            ),
-            picks=[models.FPLPlayerGameweekPick(**d) for d in data.get("picks")],
+            self.__base_url, f"/api/entry/{player_id}/event/{gameweek}/picks/"
         )
 
+        def decode(data: dict):
+            return models.decode(models.FPLPlayerGameweekPicksData, data)
+
+        return await self.__get(url, decode)
+
     @util.time_track(description="FPLAdapter.get_player_gameweek_info")
     async def get_player_gameweek_info(
         self, gameweek: int, player_id: int
     ) -> Optional[models.FPLPlayerHistory]:
-        url = urljoin(FPLAdapter.BASE_URL, f"/api/element-summary/{player_id}")
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: dict = response.json()
-        player_data = models.FPLPlayerData(
-            history=[models.FPLPlayerHistory(**d) for d in data.get("history")],
-            history_past=[
-                models.FPLPlayerSeasonHistory(**d) for d in data.get("history_past")
-            ],
-        )
+        url = urljoin(self.__base_url, f"/api/element-summary/{player_id}")
+
+        def decode(data: dict):
+            return models.decode(models.FPLPlayerData, data)
+
+        player_data: models.FPLPlayerData = await self.__get(url, decode)
         history: models.FPLPlayerHistory = None
         for h in player_data.history:
             if h.round == gameweek:
                 history = h
         return history
 
+    @util.time_track(description="FPLAdapter.get_entry_history")
+    async def get_entry_history(self, player_id: int) -> models.FPLEntrySeasonHistory:
+        url = urljoin(self.__base_url, f"/api/entry/{player_id}/history/")
+
+        def decode(data: dict):
+            return models.decode(models.FPLEntrySeasonHistory, data)
+
+        return await self.__get(url, decode)
+
     @util.time_track(description="FPLAdapter.get_player_team_by_id")
     async def get_player_team_by_id(self, player_id: int, gameweek: int):
-        url = urljoin(
-            FPLAdapter.BASE_URL, f"/api/entry/{player_id}/event/{gameweek}/picks"
-        )
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: dict = response.json()
-        return models.FPLFantasyTeam(
-            active_chip=data.get("active_chip"),
-            automatic_subs=data.get("automatic_subs"),
-            entry_history=models.FPLEntryHistory(**data.get("entry_history")),
-            picks=[models.FPLPick(**d) for d in data.get("picks")],
-        )
+        url = urljoin(self.__base_url, f"/api/entry/{player_id}/event/{gameweek}/picks")
+
+        def decode(data: dict):
+            return models.decode(models.FPLFantasyTeam, data)
+
+        return await self.__get(url, decode)
 
     @util.time_track(description="FPLAdapter.list_gameweek_fixtures")
     async def list_gameweek_fixtures(
         self, gameweek: int
     ) -> List[models.FPLMatchFixture]:
-        url = urljoin(FPLAdapter.BASE_URL, f"/api/fixtures?event={gameweek}")
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: List[dict] = response.json()
-        results = [models.FPLMatchFixture(**d) for d in data]
-        return results
+        url = urljoin(self.__base_url, f"/api/fixtures?event={gameweek}")
+
+        def decode(data: List[dict]):
+            return models.decode_list(models.FPLMatchFixture, data)
+
+        return await self.__get(url, decode)
 
     @util.time_track(description="FPLAdapter.get_gameweek_live_score")
     async def get_gameweek_live_event(self, gameweek: int):
-        url = urljoin(FPLAdapter.BASE_URL, f"/api/event/{gameweek}/live")
-        response = await self.__get_request(url)
-        if response.status_code != HTTPStatus.OK:
-            raise FPLError(
-                f"unexpected http status code: {response.status_code} with response data: {response.content}"
-            )
-        data: dict = response.json()
-        return models.FPLLiveEventResponse.create_from_dict(data=data.get("elements"))
+        url = urljoin(self.__base_url, f"/api/event/{gameweek}/live")
+
+        def decode(data: dict):
+            return models.decode(models.FPLLiveEventResponse, data)
+
+        return await self.__get(url, decode)
@@ -0,0 +1,223 @@
+import re
+import json
+import codecs
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import models
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+SectionItem = Tuple[str, Any]
+
+
+class _State(Enum):
+    START = 0
+    KEY = 1
+    COLON = 2
+    VALUE = 3
+    ARRAY_ITEM = 4
+    AFTER_ARRAY_ITEM = 5
+    AFTER_VALUE = 6
+    END = 7
+
+
+class JSONSectionStream:
+    """
+    Incremental decoder of a JSON object whose values are mostly arrays, such
+    as bootstrap-static.
+
+    Bytes are fed as they arrive. Items of the requested sections are
+    decoded one by one and passed to the section's handler as soon as they
+    are complete, so the whole document is never held as a dict tree. Items
+    and values of other sections are parsed one at a time and dropped.
+    A section that is not an array is handed to its handler as one item.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[Any], Any]]):
+        self.__handlers = handlers
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__state = _State.START
+        self.__key: Optional[str] = None
+        self.__eof = False
+
+    @property
+    def done(self) -> bool:
+        return self.__state == _State.END
+
+    def feed(self, chunk: bytes) -> List[SectionItem]:
+        """
+        Returns:
+        - List[Tuple[str, Any]]: (section, handled item) of every item
+          completed by the chunk.
+        """
+        self.__buffer = self.__buffer[self.__pos :] + self.__text_decoder.decode(chunk)
+        self.__pos = 0
+        return self.__parse()
+
+    def close(self) -> List[SectionItem]:
+        self.__eof = True
+        items = self.feed(b"")
+        self.__text_decoder.decode(b"", final=True)
+        if self.__state != _State.END:
+            raise ValueError("incomplete JSON document")
+        if _WHITESPACE.match(self.__buffer, self.__pos).end() != len(self.__buffer):
+            raise ValueError("extra data after JSON document")
+        return items
+
+    def __skip_whitespace(self) -> Optional[str]:
+        self.__pos = _WHITESPACE.match(self.__buffer, self.__pos).end()
+        if self.__pos >= len(self.__buffer):
+            return None
+        return self.__buffer[self.__pos]
+
+    def __decode_value(self) -> Tuple[bool, Any]:
+        """
+        Decode one value at the current position. Returns (False, None) when
+        the buffer ends inside the value.
+        """
+        try:
+            value, end = self.__json_decoder.raw_decode(self.__buffer, self.__pos)
+        except json.JSONDecodeError:
+            if self.__eof:
+                raise
+            return False, None
+        if end == len(self.__buffer) and not self.__eof:
+            # a number may continue in the next chunk
+            return False, None
+        self.__pos = end
+        return True, value
+
+    def __expect(self, char: str, expected: str):
+        if char != expected:
+            raise ValueError(
+                f"expected {expected!r} at offset {self.__pos}, found {char!r}"
+            )
+        self.__pos += 1
+
+    def __parse(self) -> List[SectionItem]:
+        items: List[SectionItem] = []
+        while self.__state != _State.END:
+            char = self.__skip_whitespace()
+            if char is None:
+                break
+            state = self.__state
+            if state == _State.START:
+                self.__expect(char, "{")
+                self.__state = _State.KEY
+            elif state == _State.KEY:
+                if char == "}":
+                    self.__pos += 1
+                    self.__state = _State.END
+                    continue
+                ok, key = self.__decode_value()
+                if not ok:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError(f"expected an object key, found {key!r}")
+                self.__key = key
+                self.__state = _State.COLON
+            elif state == _State.COLON:
+                self.__expect(char, ":")
+                self.__state = _State.VALUE
+            elif state == _State.VALUE:
+                if char == "[":
+                    self.__pos += 1
+                    self.__state = _State.ARRAY_ITEM
+                    continue
+                ok, value = self.__decode_value()
+                if not ok:
+                    break
+                self.__emit(value, items)
+                self.__state = _State.AFTER_VALUE
+            elif state in (_State.ARRAY_ITEM, _State.AFTER_ARRAY_ITEM):
+                if char == "]":
+                    self.__pos += 1
+                    self.__state = _State.AFTER_VALUE
+                    continue
+                if state == _State.AFTER_ARRAY_ITEM:
+                    self.__expect(char, ",")
+                    self.__state = _State.ARRAY_ITEM
+                    continue
+                ok, value = self.__decode_value()
+                if not ok:
+                    break
+                self.__emit(value, items)
+                self.__state = _State.AFTER_ARRAY_ITEM
+            elif state == _State.AFTER_VALUE:
+                if char == "}":
+                    self.__pos += 1
+                    self.__state = _State.END
+                    continue
+                self.__expect(char, ",")
+                self.__state = _State.KEY
+        return items
+
+    def __emit(self, value: Any, items: List[SectionItem]):
+        handler = self.__handlers.get(self.__key)
+        if handler is not None:
+            items.append((self.__key, handler(value)))
+
+
+class BootstrapStream:
+    """
+    Decodes a bootstrap-static body fed in chunks straight into models.
+
+    Parameters:
+    - sections (Optional[Sequence[str]]): Sections to decode, others are
+      skipped and left empty on the Bootstrap. All by default.
+    - fields (Optional[Dict[str, Sequence[str]]]): Fields to keep per section.
+      Models of a restricted section only have those fields set.
+    """
+
+    SECTIONS = {
+        "events": models.BootstrapGameweek,
+        "elements": models.BootstrapElement,
+        "teams": models.BootstrapTeam,
+    }
+
+    def __init__(
+        self,
+        sections: Optional[Sequence[str]] = None,
+        fields: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        sections = list(BootstrapStream.SECTIONS) if sections is None else sections
+        fields = {} if fields is None else fields
+        handlers: Dict[str, Callable[[Any], Any]] = {}
+        for section in sections:
+            cls = BootstrapStream.SECTIONS[section]
+            only = fields.get(section)
+            handlers[section] = (
+                models.decoder_for(cls)
+                if only is None
+                # ids are kept for the Bootstrap lookups
+                else models.partial_decoder_for(cls, frozenset(only) | {"id"})
+            )
+        self.__stream = JSONSectionStream(handlers)
+        self.__items: Dict[str, List[Any]] = {s: [] for s in BootstrapStream.SECTIONS}
+        self.__flushed = False
+
+    def feed(self, chunk: bytes) -> List[SectionItem]:
+        items = self.__stream.feed(chunk)
+        self.__collect(items)
+        return items
+
+    def flush(self) -> List[SectionItem]:
+        """
+        Mark the end of the body. Returns the items completed by it.
+        """
+        items = self.__stream.close()
+        self.__collect(items)
+        self.__flushed = True
+        return items
+
+    def close(self) -> models.Bootstrap:
+        if not self.__flushed:
+            self.flush()
+        return models.Bootstrap(**self.__items)
+
+    def __collect(self, items: List[SectionItem]):
+        for section, item in items:
+            self.__items[section].append(item)
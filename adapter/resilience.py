@@ -0,0 +1,218 @@
+import time
+import random
+import contextlib
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Deque, FrozenSet, Iterable, Iterator, List, Optional
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retries of idempotent GETs on transport errors and retryable statuses.
+    Delays use exponential backoff with full jitter unless the response has
+    a Retry-After header.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+    # a longer Retry-After is not waited for, the response is returned
+    max_retry_after: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before retrying after the 0-based `attempt`.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Send a duplicate of a request still running after the `quantile` latency
+    of its host and take whichever response comes first.
+    """
+
+    enabled: bool = False
+    quantile: float = 0.95
+    min_delay: float = 0.2
+    max_delay: float = 5.0
+    # latencies recorded before hedging starts
+    min_samples: int = 20
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header, given in seconds or as an
+    HTTP date.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _quantile(values: Iterable[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class LatencyTracker:
+    WINDOW = 256
+
+    def __init__(self, window: int = WINDOW):
+        self.__latencies: Deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self.__latencies)
+
+    def record(self, latency: float):
+        self.__latencies.append(latency)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if len(self.__latencies) == 0:
+            return None
+        return _quantile(self.__latencies, q)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    FAILURE_THRESHOLD = 5
+    RESET_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+    ):
+        """
+        Fail requests fast while FPL is down.
+
+        Parameters:
+        - failure_threshold (int): Consecutive failures that open the circuit.
+        - reset_timeout (float): Seconds the circuit stays open before one
+          probe request is let through. The circuit closes when it succeeds.
+        """
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout
+        self.__state = CircuitState.CLOSED
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        return self.__state
+
+    def allow(self) -> bool:
+        if self.__state == CircuitState.CLOSED:
+            return True
+        if self.__state == CircuitState.OPEN:
+            if time.monotonic() - self.__opened_at < self.__reset_timeout:
+                return False
+            self.__state = CircuitState.HALF_OPEN
+            self.__probing = False
+        if self.__probing:
+            return False
+        self.__probing = True
+        return True
+
+    def record_success(self):
+        self.__state = CircuitState.CLOSED
+        self.__failures = 0
+        self.__probing = False
+
+    def record_failure(self):
+        self.__failures += 1
+        if (
+            self.__state == CircuitState.HALF_OPEN
+            or self.__failures >= self.__failure_threshold
+        ):
+            self.trip()
+
+    def release(self):
+        """
+        Let another request probe after one that ended without an outcome,
+        e.g. a cancelled one.
+        """
+        self.__probing = False
+
+    def trip(self):
+        """
+        Open the circuit now, e.g. when FPL reports the game is being updated.
+        """
+        self.__state = CircuitState.OPEN
+        self.__opened_at = time.monotonic()
+        self.__probing = False
+
+
+@dataclass
+class RequestStats:
+    requests: int = 0
+    retries: int = 0
+    hedges: int = 0
+    # hedged duplicates that answered before the original request
+    hedge_wins: int = 0
+    # requests failed fast by an open circuit
+    rejected: int = 0
+    failures: int = 0
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    def latency_quantile(self, q: float) -> float:
+        if len(self.latencies) == 0:
+            return 0.0
+        return _quantile(self.latencies, q)
+
+    def summary(self) -> str:
+        return (
+            f"requests={self.requests} retries={self.retries} hedges={self.hedges} "
+            f"hedge_wins={self.hedge_wins} rejected={self.rejected} "
+            f"failures={self.failures} p95={self.latency_quantile(0.95):.2f}s "
+            f"p99={self.latency_quantile(0.99):.2f}s"
+        )
+
+
+_REQUEST_STATS: ContextVar[Optional[RequestStats]] = ContextVar(
+    "fpl_request_stats", default=None
+)
+
+
+@contextlib.contextmanager
+def track_request_stats() -> Iterator[RequestStats]:
+    """
+    Count retries, hedges and failures of FPL requests issued inside the
+    block (including tasks spawned from it).
+    """
+    stats = RequestStats()
+    token = _REQUEST_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _REQUEST_STATS.reset(token)
+
+
+def current_request_stats() -> RequestStats:
+    """
+    Stats of the enclosing track_request_stats block, or a throwaway one.
+    """
+    stats = _REQUEST_STATS.get()
+    return RequestStats() if stats is None else stats
@@ -0,0 +1,223 @@
+import os
+import re
+import time
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching rule for FPL endpoints whose path matches `pattern`.
+
+    `ttl` applies while the data can still change (None never expires,
+    0 disables caching). When `gameweek_group` is set, the matched gameweek
+    makes the response cached for FPLAdapter.FINISHED_GAMEWEEK_TTL once that
+    gameweek is finished.
+    """
+
+    pattern: re.Pattern
+    ttl: Optional[float]
+    gameweek_group: Optional[int] = None
+
+
+# first matching policy wins, unmatched urls are not cached
+FPL_CACHE_POLICIES: List[CachePolicy] = [
+    CachePolicy(re.compile(r"^/api/bootstrap-static"), ttl=300),
+    CachePolicy(re.compile(r"^/api/event-status"), ttl=60),
+    CachePolicy(
+        re.compile(r"^/api/entry/\d+/event/(\d+)/picks"), ttl=60, gameweek_group=1
+    ),
+    CachePolicy(re.compile(r"^/api/event/(\d+)/live"), ttl=60, gameweek_group=1),
+    CachePolicy(re.compile(r"^/api/fixtures\?event=(\d+)"), ttl=300, gameweek_group=1),
+    CachePolicy(
+        re.compile(r"^/api/leagues-h2h-matches/league/\d+/\?.*event=(\d+)"),
+        ttl=300,
+        gameweek_group=1,
+    ),
+    CachePolicy(re.compile(r"^/api/element-summary/"), ttl=600),
+    CachePolicy(re.compile(r"^/api/entry/\d+/history"), ttl=300),
+    CachePolicy(re.compile(r"^/api/leagues-(classic|h2h)/"), ttl=300),
+    CachePolicy(re.compile(r"^/api/league/\d+/entries"), ttl=300),
+]
+
+
+def find_cache_policy(path: str) -> Optional[CachePolicy]:
+    for policy in FPL_CACHE_POLICIES:
+        if policy.pattern.search(path):
+            return policy
+    return None
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    stored_at: float
+    expires_at: Optional[float]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class ResponseCache:
+    DEFAULT_PATH = "/tmp/fpl_response_cache.sqlite3"
+    # 2 drops the finished gameweek entries stored without an expiry
+    SCHEMA_VERSION = 2
+    # expired entries with validators are kept this long for conditional requests
+    MAX_STALE_AGE = 7 * 24 * 3600
+
+    def __init__(self, path: str = DEFAULT_PATH, max_stale_age: float = MAX_STALE_AGE):
+        """
+        Persistent HTTP response body cache keyed by URL. Safe to use from
+        several threads. Expired entries are purged when it is opened.
+
+        Parameters:
+        - path (str): SQLite database file, shared by warm lambdas and CLI runs.
+        - max_stale_age (float): Seconds after which an expired entry is
+          purged even though it has validators.
+        """
+        directory = os.path.dirname(path)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        self.__max_stale_age = max_stale_age
+        # statements of every thread are serialized on the one connection
+        self.__lock = threading.Lock()
+        self.__conn = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self.__execute("PRAGMA journal_mode=WAL")
+        (version,) = self.__fetchone("PRAGMA user_version")
+        if version != ResponseCache.SCHEMA_VERSION:
+            # it is only a cache, older layouts are dropped
+            self.__execute("DROP TABLE IF EXISTS responses")
+            self.__execute(f"PRAGMA user_version = {ResponseCache.SCHEMA_VERSION}")
+        self.__execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        self.__execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self.purge_expired()
+
+    def __execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        with self.__lock:
+            return self.__conn.execute(sql, parameters)
+
+    def __fetchone(self, sql: str, parameters: tuple = ()) -> Optional[tuple]:
+        with self.__lock:
+            return self.__conn.execute(sql, parameters).fetchone()
+
+    def get_entry(self, url: str) -> Optional[CachedResponse]:
+        """
+        Get a cached response including expired ones, whose validators can
+        still be used for a conditional request.
+        """
+        row = self.__fetchone(
+            "SELECT body, stored_at, expires_at, etag, last_modified "
+            "FROM responses WHERE url = ?",
+            (url,),
+        )
+        if row is None:
+            return None
+        return CachedResponse(*row)
+
+    def get(self, url: str) -> Optional[bytes]:
+        entry = self.get_entry(url)
+        if entry is None or not entry.is_fresh:
+            return None
+        return entry.body
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedResponse:
+        """
+        Store a response body. A `ttl` of None keeps the entry forever.
+        """
+        now = time.time()
+        entry = CachedResponse(
+            body=body,
+            stored_at=now,
+            expires_at=None if ttl is None else now + ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self.__execute(
+            "INSERT OR REPLACE INTO responses "
+            "(url, body, stored_at, expires_at, etag, last_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, body, now, entry.expires_at, etag, last_modified),
+        )
+        return entry
+
+    def touch(self, url: str, ttl: Optional[float]):
+        """
+        Extend the lifetime of an entry after the server confirmed it is
+        still valid.
+        """
+        expires_at = None if ttl is None else time.time() + ttl
+        self.__execute(
+            "UPDATE responses SET expires_at = ? WHERE url = ?", (expires_at, url)
+        )
+
+    def purge(self, url_prefix: Optional[str] = None) -> int:
+        """
+        Delete cached responses, optionally only those whose URL starts with
+        `url_prefix`.
+
+        Returns:
+        - int: Number of deleted entries.
+        """
+        if url_prefix is None:
+            cursor = self.__execute("DELETE FROM responses")
+        else:
+            cursor = self.__execute(
+                "DELETE FROM responses WHERE substr(url, 1, ?) = ?",
+                (len(url_prefix), url_prefix),
+            )
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries without validators, and those with validators
+        once they are stale for longer than `max_stale_age`.
+
+        Returns:
+        - int: Number of deleted entries.
+        """
+        now = time.time()
+        cursor = self.__execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ? "
+            "AND ((etag IS NULL AND last_modified IS NULL) OR expires_at <= ?)",
+            (now, now - self.__max_stale_age),
+        )
+        return cursor.rowcount
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.__fetchone("SELECT value FROM meta WHERE key = ?", (key,))
+        return None if row is None else row[0]
+
+    def put_meta(self, key: str, value: str):
+        self.__execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def close(self):
+        with self.__lock:
+            self.__conn.close()
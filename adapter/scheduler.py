@@ -0,0 +1,289 @@
+import os
+import time
+import heapq
+import asyncio
+import contextlib
+from enum import IntEnum
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional
+
+
+class RequestPriority(IntEnum):
+    # lower value is scheduled first
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# environment variables overriding the limits of RequestScheduler.from_env
+MAX_CONCURRENCY_ENV = "FPL_MAX_CONCURRENCY"
+RATE_ENV = "FPL_REQUEST_RATE"
+BURST_ENV = "FPL_REQUEST_BURST"
+
+
+class SharedPriority:
+    def __init__(self, priority: RequestPriority):
+        """
+        Priority of one request shared by several callers. It is raised to
+        the most urgent priority among them, which requeues the request if it
+        is still waiting for a slot.
+        """
+        self.priority = priority
+        self.__listeners: List[Callable[[], None]] = []
+
+    def raise_to(self, priority: RequestPriority):
+        if priority >= self.priority:
+            return
+        self.priority = priority
+        for listener in list(self.__listeners):
+            listener()
+
+    def add_listener(self, listener: Callable[[], None]):
+        self.__listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]):
+        self.__listeners.remove(listener)
+
+
+_REQUEST_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    "fpl_request_priority", default=RequestPriority.INTERACTIVE
+)
+_SHARED_PRIORITY: ContextVar[Optional[SharedPriority]] = ContextVar(
+    "fpl_shared_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Run FPL requests issued inside the block (including tasks spawned from it)
+    with the given priority.
+    """
+    token = _REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _REQUEST_PRIORITY.reset(token)
+
+
+@contextlib.contextmanager
+def shared_request_priority(shared: SharedPriority):
+    """
+    Run FPL requests issued inside the block with `shared`, following it
+    when it is raised.
+    """
+    token = _SHARED_PRIORITY.set(shared)
+    try:
+        yield
+    finally:
+        _SHARED_PRIORITY.reset(token)
+
+
+def current_request_priority() -> RequestPriority:
+    shared = _SHARED_PRIORITY.get()
+    if shared is not None:
+        return shared.priority
+    return _REQUEST_PRIORITY.get()
+
+
+@dataclass
+class SchedulerMetrics:
+    queue_depth: int = 0
+    in_flight: int = 0
+    max_queue_depth: int = 0
+    total_requests: int = 0
+    total_wait_time: float = 0
+    max_wait_time: float = 0
+
+    @property
+    def average_wait_time(self) -> float:
+        if self.total_requests == 0:
+            return 0
+        return self.total_wait_time / self.total_requests
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Parameters:
+        - rate (float): Tokens added per second.
+        - capacity (float): Maximum number of tokens, i.e. the allowed burst.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.__tokens = capacity
+        self.__updated_at = time.monotonic()
+
+    def __refill(self):
+        now = time.monotonic()
+        elapsed = now - self.__updated_at
+        self.__tokens = min(self.capacity, self.__tokens + elapsed * self.rate)
+        self.__updated_at = now
+
+    def try_acquire(self) -> float:
+        """
+        Take one token if available.
+
+        Returns:
+        - float: 0 when a token was taken, otherwise seconds until one is available.
+        """
+        self.__refill()
+        if self.__tokens >= 1:
+            self.__tokens -= 1
+            return 0
+        return (1 - self.__tokens) / self.rate
+
+
+class _HostQueue:
+    def __init__(self, max_concurrency: int, bucket: TokenBucket):
+        self.__max_concurrency = max_concurrency
+        self.__bucket = bucket
+        # heap of [priority, sequence, waiter]
+        self.__waiters: List[list] = []
+        self.__seq = 0
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        self.metrics = SchedulerMetrics()
+
+    async def acquire(
+        self, priority: RequestPriority, shared: Optional[SharedPriority] = None
+    ):
+        """
+        Wait for a slot. A waiter with a `shared` priority is requeued when
+        it is raised.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self.__seq += 1
+        entry = [int(priority), self.__seq, waiter]
+        heapq.heappush(self.__waiters, entry)
+
+        def requeue():
+            if not waiter.done() and shared.priority < entry[0]:
+                entry[0] = int(shared.priority)
+                heapq.heapify(self.__waiters)
+
+        if shared is not None:
+            shared.add_listener(requeue)
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+        enqueued_at = time.monotonic()
+        self.__dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # slot was granted right before cancellation
+                self.release()
+            else:
+                self.metrics.queue_depth -= 1
+            raise
+        finally:
+            if shared is not None:
+                shared.remove_listener(requeue)
+
+        wait_time = time.monotonic() - enqueued_at
+        self.metrics.total_requests += 1
+        self.metrics.total_wait_time += wait_time
+        self.metrics.max_wait_time = max(self.metrics.max_wait_time, wait_time)
+
+    def release(self):
+        self.metrics.in_flight -= 1
+        self.__dispatch()
+
+    def __on_timer(self):
+        self.__timer = None
+        self.__dispatch()
+
+    def __dispatch(self):
+        while self.__waiters and self.metrics.in_flight < self.__max_concurrency:
+            _, _, waiter = self.__waiters[0]
+            if waiter.done():
+                # cancelled while waiting
+                heapq.heappop(self.__waiters)
+                continue
+            delay = self.__bucket.try_acquire()
+            if delay > 0:
+                if self.__timer is None:
+                    loop = asyncio.get_running_loop()
+                    self.__timer = loop.call_later(delay, self.__on_timer)
+                return
+            heapq.heappop(self.__waiters)
+            self.metrics.queue_depth -= 1
+            self.metrics.in_flight += 1
+            waiter.set_result(None)
+
+
+class RequestScheduler:
+    # Defaults stay well under what FPL tolerates from one client. Past the
+    # burst, n requests to a host take about (n - BURST) / RATE seconds, so
+    # hosts running bulk fan-outs raise them with FPL_REQUEST_RATE,
+    # FPL_REQUEST_BURST and FPL_MAX_CONCURRENCY (see from_env).
+    MAX_CONCURRENCY = 8
+    RATE = 10.0
+    BURST = 20
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        rate: float = RATE,
+        burst: int = BURST,
+    ):
+        """
+        Bound concurrent requests per host and pace them with a token bucket.
+
+        Parameters:
+        - max_concurrency (int): Maximum in-flight requests per host.
+        - rate (float): Sustained requests per second per host.
+        - burst (int): Requests allowed to start back to back before pacing.
+        """
+        self.__max_concurrency = max_concurrency
+        self.__rate = rate
+        self.__burst = burst
+        self.__hosts: Dict[str, _HostQueue] = {}
+
+    @staticmethod
+    def from_env() -> "RequestScheduler":
+        """
+        Scheduler with the limits of the FPL_MAX_CONCURRENCY,
+        FPL_REQUEST_RATE and FPL_REQUEST_BURST environment variables, and
+        the class defaults for those that are not set.
+        """
+        return RequestScheduler(
+            max_concurrency=int(
+                os.environ.get(MAX_CONCURRENCY_ENV, RequestScheduler.MAX_CONCURRENCY)
+            ),
+            rate=float(os.environ.get(RATE_ENV, RequestScheduler.RATE)),
+            burst=int(os.environ.get(BURST_ENV, RequestScheduler.BURST)),
+        )
+
+    def __get_host_queue(self, host: str) -> _HostQueue:
+        queue = self.__hosts.get(host)
+        if queue is None:
+            queue = _HostQueue(
+                max_concurrency=self.__max_concurrency,
+                bucket=TokenBucket(rate=self.__rate, capacity=self.__burst),
+            )
+            self.__hosts[host] = queue
+        return queue
+
+    @contextlib.asynccontextmanager
+    async def slot(self, host: str, priority: Optional[RequestPriority] = None):
+        """
+        Hold one request slot of `host`. Without a `priority`, the one of
+        the calling context is used.
+        """
+        shared: Optional[SharedPriority] = None
+        if priority is None:
+            shared = _SHARED_PRIORITY.get()
+            priority = current_request_priority()
+        queue = self.__get_host_queue(host)
+        await queue.acquire(priority, shared)
+        try:
+            yield
+        finally:
+            queue.release()
+
+    def metrics(self) -> Dict[str, SchedulerMetrics]:
+        return {host: replace(q.metrics) for host, q in self.__hosts.items()}
@@ -0,0 +1,142 @@
+import os
+import re
+import json
+import base64
+import random
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+import httpx
+
+# response headers kept in fixtures, the body is stored decoded
+_FIXTURE_HEADERS = ("content-type", "etag", "last-modified", "retry-after")
+
+
+def fixture_name(url: httpx.URL) -> str:
+    """
+    File name of the fixture of a GET, from its path and query without the
+    cookies parameter.
+    """
+    params = sorted((k, v) for k, v in url.params.multi_items() if k != "cookies")
+    key = url.path + "?" + "&".join(f"{k}={v}" for k, v in params)
+    slug = re.sub(r"[^a-zA-Z0-9]+", "-", url.path).strip("-")
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return f"{slug}-{digest}.json"
+
+
+@dataclass
+class FaultInjection:
+    """
+    Latency and failures added to served responses.
+
+    Parameters:
+    - latency (float): Seconds every response is delayed.
+    - jitter (float): Up to this many seconds are added at random.
+    - error_rate (float): Fraction of requests answered with `error_status`.
+    - timeout_rate (float): Fraction of requests failing with a read timeout.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    timeout_rate: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.__rng = random.Random(self.seed)
+
+    async def apply(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Wait the injected latency. Returns the injected error response, if
+        any, and raises the injected timeouts.
+        """
+        delay = self.latency + self.__rng.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        roll = self.__rng.random()
+        if roll < self.timeout_rate:
+            raise httpx.ReadTimeout("injected timeout", request=request)
+        if roll < self.timeout_rate + self.error_rate:
+            return httpx.Response(
+                self.error_status, content=b"injected error", request=request
+            )
+        return None
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        fixture_dir: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Forward requests to `transport` and record every response into
+        `fixture_dir`, one JSON file per url.
+        """
+        os.makedirs(fixture_dir, exist_ok=True)
+        self.__fixture_dir = fixture_dir
+        self.__transport = (
+            transport if transport is not None else httpx.AsyncHTTPTransport()
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.__transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        headers = {
+            k: response.headers[k] for k in _FIXTURE_HEADERS if k in response.headers
+        }
+        fixture = {
+            "url": str(request.url.copy_remove_param("cookies")),
+            "status": response.status_code,
+            "headers": headers,
+        }
+        try:
+            fixture["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            fixture["body_base64"] = base64.b64encode(body).decode("ascii")
+        path = os.path.join(self.__fixture_dir, fixture_name(request.url))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f)
+        return httpx.Response(
+            response.status_code, headers=headers, content=body, request=request
+        )
+
+    async def aclose(self):
+        await self.__transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fixture_dir: str, faults: Optional[FaultInjection] = None):
+        """
+        Serve responses recorded by RecordingTransport. Urls without a
+        fixture are answered with 404.
+        """
+        self.__fixture_dir = fixture_dir
+        self.__faults = faults if faults is not None else FaultInjection()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        injected = await self.__faults.apply(request)
+        if injected is not None:
+            return injected
+        path = os.path.join(self.__fixture_dir, fixture_name(request.url))
+        if not os.path.exists(path):
+            return httpx.Response(
+                404, content=f"no fixture for {request.url.path}", request=request
+            )
+        with open(path, "r", encoding="utf-8") as f:
+            fixture = json.load(f)
+        if "body_base64" in fixture:
+            body = base64.b64decode(fixture["body_base64"])
+        else:
+            body = fixture["body"].encode("utf-8")
+        return httpx.Response(
+            fixture["status"],
+            headers=fixture["headers"],
+            content=body,
+            request=request,
+        )
@@ -2,6 +2,8 @@ import sys
 import io
 import argparse
 from typing import Optional
+from loguru import logger
+from adapter import track_request_stats
 from .handler import LineMessageHandler
 
 
@@ -27,6 +29,7 @@ class GameweekAction:
 class RevenueAction:
     SUMMARIZE = "summarize"
     PLOT = "plot"
+    REBUILD = "rebuild"
 
 
 class CacheAction:
@@ -100,7 +103,8 @@ def get_luka_command_parser():
 
     revenue_parser = subparsers.add_parser("revenue", aliases=["rev"])
     revenue_parser.add_argument(
-        "action", choices=[RevenueAction.SUMMARIZE, RevenueAction.PLOT]
+        "action",
+        choices=[RevenueAction.SUMMARIZE, RevenueAction.PLOT, RevenueAction.REBUILD],
     )
     revenue_parser.add_argument("--from-gameweek", "-f", type=int, dest="from_gameweek")
     revenue_parser.add_argument("--to-gameweek", "-t", type=int, dest="to_gameweek")
@@ -143,6 +147,14 @@ class Luka:
         return args, None
 
     async def map_namespace_to_action(self, namespace: LukaNamespace, group_id: str):
+        with track_request_stats() as stats:
+            try:
+                await self.__dispatch(namespace=namespace, group_id=group_id)
+            finally:
+                command = f"{namespace.command} {getattr(namespace, 'action', '')}"
+                logger.info(f"FPL requests of command {command}: {stats.summary()}")
+
+    async def __dispatch(self, namespace: LukaNamespace, group_id: str):
         if namespace.command in ("league", "l"):
             await self.league_action_handler(ns=namespace, group_id=group_id)
         elif namespace.command in ("player", "p"):
@@ -168,6 +180,8 @@ class Luka:
             await self.__line_message_handler.handle_gameweek_plots(
                 from_gameweek=from_gameweek, to_gameweek=to_gameweek, group_id=group_id
             )
+        elif ns.action == RevenueAction.REBUILD:
+            self.__line_message_handler.handle_rebuild_revenue_ledger(group_id=group_id)
 
     async def league_action_handler(self, ns: LukaNamespace, group_id: str):
         if ns.action == LeagueAction.SUBSCRIBE:
@@ -14,6 +14,9 @@ from services import MessageService
 from ._message_pattern import MessageHandlerActionGroup, PATTERN_ACTIONS
 
 PLOT_GENERATOR_FUNCTION_NAME = "FPLPlotGenerator"
+# progress messages sent while a gameweek range is processed, the last one
+# is replaced by the result
+PROGRESS_MESSAGE_STEPS = 4
 
 
 def run_in_error_wrapper(func=None, message_service: MessageService = None):
@@ -81,6 +84,10 @@ class LineMessageHandler(abc.ABC):
     async def handle_get_revenues(self, group_id: str):
         pass
 
+    @abc.abstractmethod
+    def handle_rebuild_revenue_ledger(self, group_id: str):
+        pass
+
     @abc.abstractmethod
     async def handle_gameweek_plots(
         self, from_gameweek: int, to_gameweek: int, group_id: str
@@ -196,7 +203,6 @@ def new_line_message_handler(app: App):
                 None if event_status is None else event_status.status[0].event
             )
 
-            gameweek_players: List[List[models.PlayerGameweekData]] = []
             event_statuses: List[Optional[models.FPLEventStatusResponse]] = []
             gameweeks: List[int] = []
             league_id = self.__get_group_league_id(group_id)
@@ -204,13 +210,16 @@ def new_line_message_handler(app: App):
                 text=f"Procesing gameweek {from_gameweek} to {to_gameweek}",
                 group_id=group_id,
             )
-            for gameweek in range(from_gameweek, to_gameweek + 1):
-                players = await self.__fpl_service.get_or_update_fpl_gameweek_table(
-                    gameweek=gameweek,
+            gameweek_players = (
+                await self.__fpl_service.list_or_update_fpl_gameweek_tables(
+                    from_gameweek=from_gameweek,
+                    to_gameweek=to_gameweek,
                     league_id=league_id,
                     ignore_cache=False,
+                    on_progress=self.__new_progress_callback(group_id),
                 )
-                gameweek_players.append(players)
+            )
+            for gameweek in range(from_gameweek, to_gameweek + 1):
                 event_statuses.append(
                     event_status
                     if current_gameweek_event is not None
@@ -230,7 +239,9 @@ def new_line_message_handler(app: App):
             self, group_id: str, gameweek: Optional[int] = None
         ):
             if gameweek is None:
-                gameweek = self.__fpl_service.get_current_gameweek_from_dynamodb()
+                gameweek = (
+                    await self.__fpl_service.aget_current_gameweek_from_dynamodb()
+                )
             league_id = self.__get_group_league_id(group_id)
             self.__message_service.send_text_message(
                 f"Gameweek {gameweek} result is being processed. Please wait for a moment",
@@ -262,6 +273,20 @@ def new_line_message_handler(app: App):
                 group_id=group_id,
             )
 
+        @run_in_error_wrapper(message_service=app.message_service)
+        def handle_rebuild_revenue_ledger(self, group_id: str):
+            league_id = self.__get_group_league_id(group_id)
+            current_gameweek = self.__fpl_service.get_current_gameweek_from_dynamodb()
+            drift_gameweeks = self.__fpl_service.verify_revenue_ledger(
+                league_id, current_gameweek
+            )
+            self.__fpl_service.rebuild_revenue_ledger(league_id, current_gameweek)
+            text = "✅ Revenue ledger is consistent, rebuilt anyway"
+            if len(drift_gameweeks) > 0:
+                drift = ", ".join(f"GW{gw}" for gw in drift_gameweeks)
+                text = f"♻️ Rebuilt revenue ledger, fixed drift in {drift}"
+            self.__message_service.send_text_message(text=text, group_id=group_id)
+
         @util.time_track(description="Gameweek plot handler")
         @run_in_error_wrapper(message_service=app.message_service)
         async def handle_gameweek_plots(
@@ -274,20 +299,30 @@ def new_line_message_handler(app: App):
                 group_id=group_id,
             )
             league_id = self.__get_group_league_id(group_id)
-            gameweeks_data: list[list[dict[str, any]]] = []
-            for gw in range(from_gameweek, to_gameweek + 1, 1):
-                gameweek_data = (
-                    await self.__fpl_service.get_or_update_fpl_gameweek_table(
-                        gameweek=gw,
-                        league_id=league_id,
-                    )
+            cumulative_revenues = (
+                await self.__fpl_service.list_players_cumulative_revenues(
+                    from_gameweek=from_gameweek,
+                    to_gameweek=to_gameweek,
+                    league_id=league_id,
+                    on_progress=self.__new_progress_callback(group_id),
                 )
-                gameweeks_data.append([g.to_json() for g in gameweek_data])
+            )
+            if len(cumulative_revenues) == 0:
+                self.__message_service.send_text_message(
+                    text="😅 This league has no rewards, there are no revenues to plot",
+                    group_id=group_id,
+                )
+                return
+            players = self.__firebase_repo.list_league_players(league_id) or []
+            players = [p for p in players if p.player_id in cumulative_revenues]
 
             payload = {
                 "start_gw": from_gameweek,
                 "end_gw": to_gameweek,
-                "gameweeks_data": gameweeks_data,
+                "player_names": [p.name for p in players],
+                "cumulative_revenues": [
+                    cumulative_revenues[p.player_id] for p in players
+                ],
             }
             response = self.__lambda_client.invoke(
                 FunctionName=PLOT_GENERATOR_FUNCTION_NAME,
@@ -370,7 +405,9 @@ def new_line_message_handler(app: App):
             self, group_id: str, gameweek: Optional[int] = None
         ):
             if gameweek is None:
-                gameweek = self.__fpl_service.get_current_gameweek_from_dynamodb()
+                gameweek = (
+                    await self.__fpl_service.aget_current_gameweek_from_dynamodb()
+                )
             league_id = self.__get_group_league_id(group_id)
             self.__message_service.send_text_message(
                 text=f"🤖 fetching player picks for gameweek {gameweek}",
@@ -389,9 +426,7 @@ def new_line_message_handler(app: App):
         @run_in_error_wrapper(message_service=app.message_service)
         def handle_clear_gameweeks_cache(self, group_id: str):
             league_id = self.__get_group_league_id(group_id)
-            current_gameweek = self.__fpl_service.get_current_gameweek_from_dynamodb()
-            for i in range(current_gameweek):
-                self.__fpl_service.clear_gameweek_result_cache(i + 1, league_id)
+            self.__fpl_service.clear_league_result_caches(league_id)
             self.__message_service.send_text_message(
                 text=f'⚠️ Successfully clear cache for league ID "{league_id}"',
                 group_id=group_id,
@@ -501,7 +536,9 @@ def new_line_message_handler(app: App):
             self, group_id: str, gameweek: Optional[int] = None
         ):
             if gameweek is None:
-                gameweek = self.__fpl_service.get_current_gameweek_from_dynamodb()
+                gameweek = (
+                    await self.__fpl_service.aget_current_gameweek_from_dynamodb()
+                )
             fixtures = await self.__fpl_service.list_gameweek_fixtures(gameweek)
             self.__message_service.send_gameweek_fixtures_message(
                 group_id=group_id,
@@ -550,6 +587,24 @@ def new_line_message_handler(app: App):
                 )
                 abort(403)
 
+        def __new_progress_callback(self, group_id: str):
+            """
+            Report progress of a gameweek range to the group at every
+            PROGRESS_MESSAGE_STEPS-th of it, except when it is done.
+            """
+
+            def on_progress(gameweek: int, completed: int, total: int):
+                step = completed * PROGRESS_MESSAGE_STEPS // total
+                previous_step = (completed - 1) * PROGRESS_MESSAGE_STEPS // total
+                if completed == total or step == previous_step:
+                    return
+                self.__message_service.send_text_message(
+                    text=f"⏳ GW{gameweek} is ready ({completed}/{total} gameweeks)",
+                    group_id=group_id,
+                )
+
+            return on_progress
+
         # NOTE: We support only 1 league per channel for now
         def __get_group_league_id(self, group_id: str):
             league_ids = self.__firebase_repo.list_leagues_by_line_group_id(group_id)
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from flask import Flask, request, abort
 from linebot import WebhookHandler
 from linebot.models import MessageEvent, TextMessage, SourceGroup
@@ -16,6 +17,12 @@ class LineMessageAPI:
         self.handler = new_line_message_handler(app=app)
         self.message_service = app.message_service
         self.luka_cli = Luka(self.handler)
+        # one loop for every request thread, so pooled connections survive
+        # between messages and are never used from two loops
+        self.__loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self.__loop.run_forever, name="line-message-loop", daemon=True
+        ).start()
 
     def initialize(self):
         @self.__app.route("/health-check", methods=["GET"])
@@ -53,11 +60,11 @@ class LineMessageAPI:
                     group_id=source.group_id, text=message
                 )
                 return
-            loop = asyncio.new_event_loop()
-            loop.run_until_complete(
+            asyncio.run_coroutine_threadsafe(
                 self.luka_cli.map_namespace_to_action(
                     group_id=source.group_id, namespace=namespace
-                )
-            )
+                ),
+                self.__loop,
+            ).result()
 
         return self.__app
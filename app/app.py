@@ -2,7 +2,15 @@ from boto3.session import Session
 import services
 import util
 from config import Config
-from adapter import S3Downloader, FPLAdapter, S3Uploader, StateMachine, SSM
+from adapter import (
+    S3Downloader,
+    FPLAdapter,
+    S3Uploader,
+    StateMachine,
+    SSM,
+    ResponseCache,
+    HedgePolicy,
+)
 from database import FirebaseRealtimeDatabase
 from line import LineBot
 
@@ -29,7 +37,12 @@ class App:
         self.linebot = LineBot(config=self.config)
         self.message_service = services.MessageService(bot=self.linebot)
 
-        self.fpl_adapter = FPLAdapter(cookies=self.config.cookies)
+        self.fpl_adapter = FPLAdapter(
+            cookies=self.config.cookies,
+            http2=True,
+            response_cache=ResponseCache(),
+            hedge_policy=HedgePolicy(enabled=True),
+        )
 
         firebase_db = FirebaseRealtimeDatabase(
             database_url=self.config.firebase_db_url,
@@ -48,3 +61,10 @@ class App:
         )
 
         self.sfn = StateMachine(session=sess)
+
+    async def open(self):
+        await self.fpl_adapter.open()
+
+    async def close(self):
+        await self.fpl_adapter.close()
+        await self.fpl_service.close()
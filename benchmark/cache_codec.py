@@ -0,0 +1,99 @@
+"""
+Benchmark the gameweek results cache item encodings.
+
+Compares the JSON string items the cache used to store with the binary
+payload of models.encode_gameweek_results, by item size and decode time.
+DynamoDB reads are billed per 4 KB of item size and items are limited to
+400 KB.
+
+Usage:
+    python -m benchmark.cache_codec --players 10 100 1000 --repeat 200
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from models import (
+    PlayerGameweekData,
+    encode_gameweek_results,
+    decode_gameweek_results,
+)
+
+READ_UNIT_SIZE = 4096
+
+
+def _players(count: int) -> List[PlayerGameweekData]:
+    rng = random.Random(0)
+    return [
+        PlayerGameweekData(
+            name=f"Manager {i}",
+            team_name=f"Team {i}",
+            subsitution_cost=rng.choice([0, 0, 4, 8]),
+            player_id=100000 + i,
+            points=rng.randint(20, 110),
+            reward_division=1,
+            shared_reward_player_ids=[],
+            reward=round(rng.uniform(-100, 100), 2),
+            captain_points=rng.randint(0, 30),
+            vice_captain_points=rng.randint(0, 30),
+            bank_account=f"{rng.randint(0, 10**10):010d}",
+        )
+        for i in range(count)
+    ]
+
+
+def _legacy_decode(data: str) -> List[PlayerGameweekData]:
+    # the lookup before the codec
+    players_objs = json.loads(data)
+    player_data_dict = dict.fromkeys(PlayerGameweekData().to_json().keys())
+    players = []
+    for player_obj in players_objs:
+        init_dict = {}
+        for key in player_data_dict:
+            init_dict[key] = player_obj[key]
+        players.append(PlayerGameweekData(**init_dict))
+    return players
+
+
+def _time(decode, payload, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        decode(payload)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache item encodings.")
+    parser.add_argument("--players", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'players':>8} {'json bytes':>11} {'binary bytes':>13} "
+        f"{'json RCU':>9} {'binary RCU':>11} {'json decode':>12} {'binary decode':>14}"
+    )
+    for count in args.players:
+        players = _players(count)
+        legacy = json.dumps([p.to_json() for p in players])
+        binary = encode_gameweek_results(players)
+        assert decode_gameweek_results(binary) == players
+        legacy_size = len(legacy.encode("utf-8"))
+        print(
+            f"{count:>8} {legacy_size:>11} {len(binary):>13} "
+            f"{-(-legacy_size // READ_UNIT_SIZE):>9} "
+            f"{-(-len(binary) // READ_UNIT_SIZE):>11} "
+            f"{_time(_legacy_decode, legacy, args.repeat) * 1000:>10.3f}ms "
+            f"{_time(decode_gameweek_results, binary, args.repeat) * 1000:>12.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
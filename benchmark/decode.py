@@ -0,0 +1,165 @@
+"""
+Benchmark decoding a bootstrap-static payload into models.Bootstrap.
+
+Compares the per-instance field filtering the adapter used to do (field
+list rebuilt per call, list membership tests) with the compiled decoders of
+models.decoder. The streamed decoder of adapter.json_stream is timed from
+the raw body, JSON parsing included, which the other two are not.
+
+The payload is read from --payload, or from the FPL response cache when a
+bootstrap response was recorded there. Otherwise a synthetic payload with
+the same shape is generated.
+
+Usage:
+    python -m benchmark.decode --payload bootstrap-static.json --repeat 20
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from dataclasses import fields
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import models
+from adapter.response_cache import ResponseCache
+from adapter.json_stream import BootstrapStream
+
+BOOTSTRAP_URL = "https://fantasy.premierleague.com/api/bootstrap-static"
+STREAM_CHUNK_SIZE = 65536
+
+
+def _load_recorded_payload(path: str):
+    if path is not None:
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+    if not os.path.exists(ResponseCache.DEFAULT_PATH):
+        return None
+    cache = ResponseCache()
+    try:
+        entry = cache.get_entry(BOOTSTRAP_URL)
+    finally:
+        cache.close()
+    return None if entry is None else json.loads(entry.body)
+
+
+def _synthetic_value(annotation, rng: random.Random):
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is str:
+        return f"{rng.random():.1f}"
+    return rng.randint(0, 1000)
+
+
+def _synthetic_payload(num_elements: int = 700):
+    rng = random.Random(0)
+    element_fields = [
+        f for f in fields(models.BootstrapElement) if f.name != "position"
+    ]
+    elements = []
+    for i in range(1, num_elements + 1):
+        element = {f.name: _synthetic_value(f.type, rng) for f in element_fields}
+        element.update(id=i, element_type=rng.randint(1, 4))
+        # the live payload has a few fields the model does not keep
+        element.update(removed=False, region=None, team_join_date=None)
+        elements.append(element)
+    events = []
+    for i in range(1, 39):
+        event = {
+            f.name: _synthetic_value(f.type, rng)
+            for f in fields(models.BootstrapGameweek)
+        }
+        event.update(
+            id=i,
+            chip_plays=[{"chip_name": "bboost", "num_played": 1000}],
+            top_element_info={"id": 1, "points": 20},
+        )
+        events.append(event)
+    teams = []
+    for i in range(1, 21):
+        team = {
+            f.name: _synthetic_value(f.type, rng) for f in fields(models.BootstrapTeam)
+        }
+        team.update(id=i)
+        teams.append(team)
+    return {"events": events, "elements": elements, "teams": teams}
+
+
+def _legacy_decode(data: dict) -> models.Bootstrap:
+    bootstrap_elem_fields = [f.name for f in fields(models.BootstrapElement)]
+    elements = []
+    for d in data.get("elements"):
+        new_data = {}
+        for k in d:
+            if k not in bootstrap_elem_fields:
+                continue
+            new_data[k] = d[k]
+        elements.append(models.BootstrapElement(**new_data))
+    events = []
+    for d in data.get("events"):
+        event = models.BootstrapGameweek.__new__(models.BootstrapGameweek)
+        names = set([f.name for f in fields(event)])
+        for k, v in d.items():
+            if k in names:
+                setattr(event, k, v)
+        events.append(event)
+    return models.Bootstrap(
+        events=events,
+        elements=elements,
+        teams=[models.BootstrapTeam(**d) for d in data.get("teams")],
+    )
+
+
+def _compiled_decode(data: dict) -> models.Bootstrap:
+    return models.decode(models.Bootstrap, data)
+
+
+def _streamed_decode(body: bytes) -> models.Bootstrap:
+    stream = BootstrapStream()
+    for i in range(0, len(body), STREAM_CHUNK_SIZE):
+        stream.feed(body[i : i + STREAM_CHUNK_SIZE])
+    return stream.close()
+
+
+def _bench(func, data, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bootstrap decoding.")
+    parser.add_argument("--payload", type=str, help="recorded bootstrap-static JSON")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = _load_recorded_payload(args.payload)
+    source = "recorded"
+    if data is None:
+        data = _synthetic_payload()
+        source = "synthetic"
+    num_elements = len(data.get("elements"))
+    print(f"{source} payload: {num_elements} elements")
+
+    legacy_time = _bench(_legacy_decode, data, args.repeat)
+    compiled_time = _bench(_compiled_decode, data, args.repeat)
+    streamed_time = _bench(_streamed_decode, json.dumps(data).encode(), args.repeat)
+    print(f"{'decoder':>10} {'best (ms)':>10} {'elements/s':>12}")
+    for name, elapsed in (
+        ("legacy", legacy_time),
+        ("compiled", compiled_time),
+        ("streamed", streamed_time),
+    ):
+        print(f"{name:>10} {elapsed * 1000:>10.2f} {num_elements / elapsed:>12.0f}")
+    print(f"speedup {legacy_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+In-memory stand-in of the DynamoDB API for the cache table.
+
+Serves the item, counter and batch operations the adapter uses over the
+DynamoDB JSON protocol, so adapter.aws.DynamoDB runs unchanged against it.
+Tables are created on first use. Batch requests can leave part of their
+keys unprocessed, like a throttled table does.
+
+Usage:
+    python -m benchmark.dynamodb_server --port 8001 --unprocessed-rate 0.2
+    # then DYNAMODB_ENDPOINT_URL=http://127.0.0.1:8001 with any credentials
+"""
+
+import re
+import json
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+TARGET_PREFIX = "DynamoDB_20120810."
+HASH_KEY = "KEY"
+
+
+class _ConditionalCheckFailed(Exception):
+    pass
+
+
+class LocalDynamoDB:
+    def __init__(self, unprocessed_rate: float = 0.0, seed: int = 0):
+        """
+        Parameters:
+        - unprocessed_rate (float): Fraction of the keys of a batch request
+          returned as unprocessed.
+        """
+        self.unprocessed_rate = unprocessed_rate
+        self.requests: Dict[str, int] = {}
+        self.__tables: Dict[str, Dict[str, dict]] = {}
+        self.__rng = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    def __table(self, name: str) -> Dict[str, dict]:
+        return self.__tables.setdefault(name, {})
+
+    def __split(self, requests: list) -> Tuple[list, list]:
+        # at least one request is processed so callers always progress
+        processed, unprocessed = requests[:1], []
+        for request in requests[1:]:
+            if self.__rng.random() < self.unprocessed_rate:
+                unprocessed.append(request)
+            else:
+                processed.append(request)
+        return processed, unprocessed
+
+    def handle(self, operation: str, body: dict) -> Tuple[int, dict]:
+        with self.__lock:
+            self.requests[operation] = self.requests.get(operation, 0) + 1
+            handler = getattr(self, f"_op_{operation}", None)
+            if handler is None:
+                return 400, {
+                    "__type": "com.amazonaws.dynamodb.v20120810#UnknownOperationException",
+                    "message": f"unsupported operation {operation}",
+                }
+            try:
+                return 200, handler(body)
+            except _ConditionalCheckFailed:
+                return 400, {
+                    "__type": "com.amazonaws.dynamodb.v20120810#ConditionalCheckFailedException",
+                    "message": "The conditional request failed",
+                }
+
+    def _op_GetItem(self, body: dict) -> dict:  # pylint: disable=invalid-name
+        item = self.__table(body["TableName"]).get(body["Key"][HASH_KEY]["S"])
+        return {} if item is None else {"Item": item}
+
+    def _op_PutItem(self, body: dict) -> dict:  # pylint: disable=invalid-name
+        item = body["Item"]
+        self.__table(body["TableName"])[item[HASH_KEY]["S"]] = item
+        return {}
+
+    def _op_DeleteItem(self, body: dict) -> dict:  # pylint: disable=invalid-name
+        self.__table(body["TableName"]).pop(body["Key"][HASH_KEY]["S"], None)
+        return {}
+
+    def _op_UpdateItem(self, body: dict) -> dict:  # pylint: disable=invalid-name
+        # numeric "ADD name :value" and "SET name = :value" updates, optionally
+        # conditioned on "attribute_exists(name)"
+        names = body.get("ExpressionAttributeNames", {})
+        values = body["ExpressionAttributeValues"]
+        table = self.__table(body["TableName"])
+        key = body["Key"][HASH_KEY]["S"]
+        condition = body.get("ConditionExpression")
+        if condition is not None:
+            match = re.fullmatch(r"attribute_exists\((\S+)\)", condition)
+            if match is None:
+                raise ValueError(f"unsupported condition {condition}")
+            attribute = names.get(match.group(1), match.group(1))
+            if attribute not in table.get(key, {}):
+                raise _ConditionalCheckFailed()
+        tokens = body["UpdateExpression"].split()
+        item = table.setdefault(key, dict(body["Key"]))
+        if tokens[0].upper() == "SET" and len(tokens) == 4 and tokens[2] == "=":
+            name = names.get(tokens[1], tokens[1])
+            item[name] = values[tokens[3]]
+        elif tokens[0].upper() == "ADD" and len(tokens) == 3:
+            name = names.get(tokens[1], tokens[1])
+            current = item.get(name, {"N": "0"})["N"]
+            item[name] = {"N": str(int(current) + int(values[tokens[2]]["N"]))}
+        else:
+            raise ValueError(f"unsupported update {body['UpdateExpression']}")
+        return {"Attributes": {name: item[name]}}
+
+    def _op_BatchGetItem(self, body: dict) -> dict:  # pylint: disable=invalid-name
+        responses: Dict[str, List[dict]] = {}
+        unprocessed: Dict[str, Any] = {}
+        for name, request in body["RequestItems"].items():
+            table = self.__table(name)
+            processed, left = self.__split(request["Keys"])
+            responses[name] = [
+                table[key[HASH_KEY]["S"]]
+                for key in processed
+                if key[HASH_KEY]["S"] in table
+            ]
+            if len(left) > 0:
+                unprocessed[name] = {"Keys": left}
+        return {"Responses": responses, "UnprocessedKeys": unprocessed}
+
+    def _op_BatchWriteItem(self, body: dict) -> dict:  # pylint: disable=invalid-name
+        unprocessed: Dict[str, list] = {}
+        for name, requests in body["RequestItems"].items():
+            table = self.__table(name)
+            processed, left = self.__split(requests)
+            for request in processed:
+                if "PutRequest" in request:
+                    item = request["PutRequest"]["Item"]
+                    table[item[HASH_KEY]["S"]] = item
+                else:
+                    table.pop(request["DeleteRequest"]["Key"][HASH_KEY]["S"], None)
+            if len(left) > 0:
+                unprocessed[name] = left
+        return {"UnprocessedItems": unprocessed}
+
+
+def make_server(
+    dynamodb: LocalDynamoDB, host: str = "127.0.0.1", port: int = 8001
+) -> ThreadingHTTPServer:
+    """
+    HTTP server of `dynamodb`, port 0 binds any free port.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):  # pylint: disable=invalid-name
+            target = self.headers.get("X-Amz-Target", "")
+            length = int(self.headers.get("Content-Length", "0"))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            status, response = dynamodb.handle(target[len(TARGET_PREFIX) :], body)
+            content = json.dumps(response).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/x-amz-json-1.0")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(dynamodb: LocalDynamoDB, host: str = "127.0.0.1", port: int = 8001):
+    server = make_server(dynamodb, host=host, port=port)
+    print(f"serving DynamoDB on http://{host}:{port}")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an in-memory DynamoDB.")
+    parser.add_argument("--unprocessed-rate", type=float, default=0.0)
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+    serve(
+        LocalDynamoDB(unprocessed_rate=args.unprocessed_rate),
+        host=args.host,
+        port=args.port,
+    )
+
+
+if __name__ == "__main__":
+    main()
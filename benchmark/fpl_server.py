@@ -0,0 +1,462 @@
+"""
+Local stand-in of the FPL API serving a synthetic league of any size.
+
+Every response is generated from the seed, so runs are reproducible. The
+same data can be served over HTTP or in-process through SyntheticTransport,
+with latency and errors injected by adapter.transport.FaultInjection.
+
+Usage:
+    python -m benchmark.fpl_server --managers 100 --port 8000
+    # then FPLAdapter(cookies="", base_url="http://127.0.0.1:8000")
+"""
+
+import os
+import re
+import sys
+import json
+import random
+import typing
+import argparse
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from dataclasses import fields
+
+import httpx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import models
+import util
+from models.fpl_model import FPLPlayerStats
+from adapter.transport import FaultInjection
+
+NUM_TEAMS = 20
+SQUAD_SIZE = 15
+PAGE_SIZE = 50
+SEASON_START = datetime(2024, 8, 16, 19)
+
+
+def _value(annotation, rng: random.Random):
+    origin = typing.get_origin(annotation)
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is int:
+        return rng.randint(0, 100)
+    if annotation is float:
+        return round(rng.uniform(0, 10), 1)
+    if annotation is str:
+        return f"{rng.uniform(0, 10):.1f}"
+    if annotation is datetime:
+        return SEASON_START.strftime(util.RFC3339_FORMAT)
+    if annotation is date:
+        return SEASON_START.date().isoformat()
+    if origin in (list, List):
+        return []
+    return None
+
+
+def _fill(cls: type, rng: random.Random, **overrides) -> Dict[str, Any]:
+    """
+    A JSON object with every field of the model `cls`, random values by
+    field type, then `overrides`.
+    """
+    hints = typing.get_type_hints(cls)
+    data = {f.name: _value(hints[f.name], rng) for f in fields(cls)}
+    data.update(overrides)
+    return data
+
+
+def _page(items: List[dict], query: Dict[str, str], key: str) -> Tuple[list, dict]:
+    page = int(query.get(key, "1"))
+    start = (page - 1) * PAGE_SIZE
+    return items[start : start + PAGE_SIZE], {
+        "page": page,
+        "has_next": start + PAGE_SIZE < len(items),
+    }
+
+
+class SyntheticFPL:
+    def __init__(
+        self,
+        managers: int,
+        current_gameweek: int = 20,
+        num_elements: int = 700,
+        league_id: int = 1,
+        seed: int = 0,
+    ):
+        """
+        A league of `managers` entries, ids from 100001, playing every
+        gameweek up to `current_gameweek`.
+        """
+        self.managers = managers
+        self.current_gameweek = current_gameweek
+        self.num_elements = num_elements
+        self.league_id = league_id
+        self.seed = seed
+        self.entry_ids = [100001 + i for i in range(managers)]
+        self.__bootstrap: Optional[dict] = None
+        self.__live: Dict[int, dict] = {}
+        self.__routes: List[Tuple[re.Pattern, Callable[..., Any]]] = [
+            (re.compile(r"^/api/bootstrap-static/?$"), lambda q: self.bootstrap()),
+            (re.compile(r"^/api/event-status/?$"), lambda q: self.event_status()),
+            (re.compile(r"^/api/event/(\d+)/live/?$"), lambda gw, q: self.live(gw)),
+            (re.compile(r"^/api/fixtures/?$"), self.fixtures),
+            (
+                re.compile(r"^/api/entry/(\d+)/event/(\d+)/picks/?$"),
+                lambda entry, gw, q: self.picks(entry, gw),
+            ),
+            (
+                re.compile(r"^/api/entry/(\d+)/history/?$"),
+                lambda entry, q: self.history(entry),
+            ),
+            (
+                re.compile(r"^/api/element-summary/(\d+)/?$"),
+                lambda element, q: self.element_summary(element),
+            ),
+            (
+                re.compile(r"^/api/league/(\d+)/entries/?$"),
+                lambda league_id, q: self.league_entries(),
+            ),
+            (
+                re.compile(r"^/api/leagues-classic/(\d+)/standings/?$"),
+                self.classic_standings,
+            ),
+            (re.compile(r"^/api/leagues-h2h/(\d+)/standings/?$"), self.h2h_standings),
+            (
+                re.compile(r"^/api/leagues-h2h-matches/league/(\d+)/?$"),
+                self.h2h_matches,
+            ),
+        ]
+
+    def __rng(self, *key) -> random.Random:
+        return random.Random(":".join(str(k) for k in (self.seed,) + key))
+
+    def handle(self, path: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        """
+        Returns:
+        - Tuple[int, Any]: Status code and JSON body of a GET.
+        """
+        for pattern, route in self.__routes:
+            match = pattern.match(path)
+            if match is not None:
+                return 200, route(*[int(g) for g in match.groups()], query)
+        return 404, {"detail": "Not found."}
+
+    def bootstrap(self) -> dict:
+        if self.__bootstrap is None:
+            self.__bootstrap = self.__build_bootstrap()
+        return self.__bootstrap
+
+    def __build_bootstrap(self) -> dict:
+        rng = self.__rng("bootstrap")
+        element_fields = {f.name for f in fields(models.BootstrapElement)}
+        elements = []
+        for i in range(1, self.num_elements + 1):
+            element = _fill(
+                models.BootstrapElement,
+                rng,
+                id=i,
+                code=400000 + i,
+                element_type=rng.randint(1, 4),
+                team=rng.randint(1, NUM_TEAMS),
+                web_name=f"Player {i}",
+                first_name="Player",
+                second_name=str(i),
+                news="",
+                now_cost=rng.randint(40, 140),
+                chance_of_playing_this_round=rng.choice([None, 0, 25, 75, 100]),
+                squad_number=None,
+            )
+            del element["position"]
+            assert set(element) <= element_fields
+            elements.append(element)
+        events = []
+        for gw in range(1, 39):
+            deadline = SEASON_START + timedelta(days=7 * (gw - 1))
+            events.append(
+                _fill(
+                    models.BootstrapGameweek,
+                    rng,
+                    id=gw,
+                    name=f"Gameweek {gw}",
+                    deadline_time=deadline.strftime(util.RFC3339_FORMAT),
+                    deadline_time_epoch=int(deadline.timestamp()),
+                    finished=gw < self.current_gameweek,
+                    data_checked=gw < self.current_gameweek,
+                    is_previous=gw == self.current_gameweek - 1,
+                    is_current=gw == self.current_gameweek,
+                    is_next=gw == self.current_gameweek + 1,
+                    chip_plays=[{"chip_name": "bboost", "num_played": 1000}],
+                    top_element_info={"id": 1, "points": 20},
+                )
+            )
+        teams = [
+            _fill(
+                models.BootstrapTeam,
+                rng,
+                id=i,
+                code=i,
+                name=f"Team {i}",
+                short_name=f"T{i:02d}",
+            )
+            for i in range(1, NUM_TEAMS + 1)
+        ]
+        return {"events": events, "elements": elements, "teams": teams}
+
+    def event_status(self) -> dict:
+        day = SEASON_START.date() + timedelta(days=7 * (self.current_gameweek - 1))
+        return {
+            "status": [
+                {
+                    "bonus_added": True,
+                    "date": (day + timedelta(days=i)).isoformat(),
+                    "event": self.current_gameweek,
+                    "points": "r",
+                }
+                for i in range(3)
+            ],
+            "leagues": "Updated",
+        }
+
+    def live(self, gameweek: int) -> dict:
+        if gameweek not in self.__live:
+            self.__live[gameweek] = self.__build_live(gameweek)
+        return self.__live[gameweek]
+
+    def __build_live(self, gameweek: int) -> dict:
+        rng = self.__rng("live", gameweek)
+        elements = []
+        for i in range(1, self.num_elements + 1):
+            minutes = rng.choice([0, 0, 30, 90, 90, 90])
+            stats = _fill(
+                FPLPlayerStats,
+                rng,
+                minutes=minutes,
+                total_points=rng.randint(1, 15) if minutes > 0 else 0,
+            )
+            elements.append({"id": i, "stats": stats, "explain": []})
+        return {"elements": elements}
+
+    def fixtures(self, query: Dict[str, str]) -> List[dict]:
+        gameweek = int(query.get("event", self.current_gameweek))
+        rng = self.__rng("fixtures", gameweek)
+        teams = list(range(1, NUM_TEAMS + 1))
+        rng.shuffle(teams)
+        kickoff = SEASON_START + timedelta(days=7 * (gameweek - 1))
+        return [
+            _fill(
+                models.FPLMatchFixture,
+                rng,
+                id=gameweek * 100 + i,
+                event=gameweek,
+                team_h=teams[2 * i],
+                team_a=teams[2 * i + 1],
+                kickoff_time=kickoff.strftime(util.RFC3339_FORMAT),
+                finished=gameweek < self.current_gameweek,
+                team_a_data=None,
+                team_h_data=None,
+            )
+            for i in range(NUM_TEAMS // 2)
+        ]
+
+    def __squad(self, entry: int, gameweek: int) -> List[dict]:
+        rng = self.__rng("picks", entry, gameweek)
+        elements = rng.sample(range(1, self.num_elements + 1), SQUAD_SIZE)
+        return [
+            {
+                "element": element,
+                "position": position,
+                "multiplier": 2 if position == 1 else 1 if position <= 11 else 0,
+                "is_captain": position == 1,
+                "is_vice_captain": position == 2,
+            }
+            for position, element in enumerate(elements, 1)
+        ]
+
+    def __entry_history(self, entry: int, gameweek: int) -> dict:
+        live = self.live(gameweek)["elements"]
+        squad = self.__squad(entry, gameweek)
+        points = sum(
+            live[p["element"] - 1]["stats"]["total_points"] * p["multiplier"]
+            for p in squad
+        )
+        rng = self.__rng("history", entry, gameweek)
+        transfers = rng.choice([0, 0, 1, 1, 2, 3])
+        return _fill(
+            models.FPLEntryHistory,
+            rng,
+            event=gameweek,
+            points=points,
+            event_transfers=transfers,
+            event_transfers_cost=max(0, transfers - 1) * 4,
+        )
+
+    def picks(self, entry: int, gameweek: int) -> dict:
+        return {
+            "active_chip": None,
+            "automatic_subs": [],
+            "entry_history": self.__entry_history(entry, gameweek),
+            "picks": self.__squad(entry, gameweek),
+        }
+
+    def history(self, entry: int) -> dict:
+        current = [
+            self.__entry_history(entry, gw)
+            for gw in range(1, self.current_gameweek + 1)
+        ]
+        total = 0
+        for h in current:
+            total += h["points"]
+            h["total_points"] = total
+        return {"current": current, "chips": []}
+
+    def element_summary(self, element: int) -> dict:
+        rng = self.__rng("element", element)
+        history = [
+            _fill(models.FPLPlayerHistory, rng, element=element, round=gw)
+            for gw in range(1, self.current_gameweek + 1)
+        ]
+        return {"history": history, "history_past": []}
+
+    def __entries(self) -> List[dict]:
+        return [
+            {
+                "entry": entry,
+                "entry_name": f"Team {entry}",
+                "player_name": f"Manager {entry}",
+            }
+            for entry in self.entry_ids
+        ]
+
+    def league_entries(self) -> List[dict]:
+        return self.__entries()
+
+    def classic_standings(self, league_id: int, query: Dict[str, str]) -> dict:
+        results = [
+            dict(
+                entry,
+                id=entry["entry"],
+                event_total=0,
+                rank=rank,
+                last_rank=rank,
+                rank_sort=rank,
+                total=0,
+            )
+            for rank, entry in enumerate(self.__entries(), 1)
+        ]
+        page, meta = _page(results, query, "page_standings")
+        league = _fill(
+            models.FPLClassicLeagueInfo,
+            self.__rng("league"),
+            id=league_id,
+            name="Synthetic League",
+            max_entries=None,
+            cup_league=None,
+            rank=None,
+        )
+        return {"league": league, "standings": dict(meta, results=page)}
+
+    def h2h_standings(self, league_id: int, query: Dict[str, str]) -> dict:
+        rng = self.__rng("h2h", league_id)
+        results = [
+            _fill(
+                models.FPLTeamStanding,
+                rng,
+                id=entry["entry"],
+                entry=entry["entry"],
+                entry_name=entry["entry_name"],
+                player_name=entry["player_name"],
+                rank=rank,
+            )
+            for rank, entry in enumerate(self.__entries(), 1)
+        ]
+        page, meta = _page(results, query, "page_standings")
+        return {
+            "league": {"id": league_id, "name": "Synthetic H2H League"},
+            "standings": dict(meta, results=page),
+        }
+
+    def h2h_matches(self, league_id: int, query: Dict[str, str]) -> dict:
+        gameweek = int(query.get("event", self.current_gameweek))
+        rng = self.__rng("h2h-matches", league_id, gameweek)
+        entries = self.__entries()
+        matches = [
+            _fill(
+                models.FPLH2HData,
+                rng,
+                id=gameweek * 100000 + i,
+                entry_1_entry=entries[i]["entry"],
+                entry_2_entry=entries[i + 1]["entry"],
+                event=str(gameweek),
+            )
+            for i in range(0, len(entries) - 1, 2)
+        ]
+        page, meta = _page(matches, query, "page")
+        return dict(meta, results=page)
+
+
+def split_path(raw_path: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Returns:
+    - Tuple[str, Dict[str, str]]: Path and last value of each query parameter.
+    """
+    url = urlsplit(raw_path)
+    return url.path, {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+
+class SyntheticTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fpl: SyntheticFPL, faults: Optional[FaultInjection] = None):
+        """
+        Serve a SyntheticFPL in-process, without sockets.
+        """
+        self.__fpl = fpl
+        self.__faults = faults if faults is not None else FaultInjection()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        injected = await self.__faults.apply(request)
+        if injected is not None:
+            return injected
+        path, query = split_path(request.url.raw_path.decode("ascii"))
+        status, body = self.__fpl.handle(path, query)
+        return httpx.Response(status, json=body, request=request)
+
+
+def serve(fpl: SyntheticFPL, host: str = "127.0.0.1", port: int = 8000):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            path, query = split_path(self.path)
+            status, body = fpl.handle(path, query)
+            content = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"serving {fpl.managers} managers on http://{host}:{port}")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic FPL league.")
+    parser.add_argument("--managers", type=int, default=100)
+    parser.add_argument("--gameweek", type=int, default=20, help="current gameweek")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    fpl = SyntheticFPL(
+        managers=args.managers, current_gameweek=args.gameweek, seed=args.seed
+    )
+    serve(fpl, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
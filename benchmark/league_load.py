@@ -0,0 +1,115 @@
+"""
+Load profile of a gameweek update against synthetic leagues.
+
+Runs the requests FPLService issues for a league update (bootstrap, live
+event, every manager's picks and season history, paginated standings)
+through FPLAdapter, for each league size. Requests are served in-process by
+benchmark.fpl_server.SyntheticTransport with injected latency, or by a
+running stand-in server with --base-url.
+
+Usage:
+    python -m benchmark.league_load --managers 10 100 1000 --latency 0.05
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+from typing import Awaitable, Callable, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from adapter import (
+    FPLAdapter,
+    FaultInjection,
+    RequestScheduler,
+    RetryPolicy,
+    track_request_stats,
+)
+from benchmark.fpl_server import SyntheticFPL, SyntheticTransport
+
+
+async def _timed(name: str, step: Callable[[], Awaitable]):
+    with track_request_stats() as stats:
+        started = time.perf_counter()
+        result = await step()
+        elapsed = time.perf_counter() - started
+    print(f"  {name:<22} {elapsed * 1000:9.1f} ms  {stats.summary()}")
+    return result
+
+
+async def _profile(fpl: SyntheticFPL, args, base_url: Optional[str]):
+    faults = FaultInjection(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=0,
+    )
+    adapter = FPLAdapter(
+        cookies="",
+        scheduler=RequestScheduler(
+            max_concurrency=args.concurrency, rate=args.rate, burst=args.concurrency
+        ),
+        retry_policy=RetryPolicy(base_delay=0.01),
+        base_url=base_url if base_url is not None else "http://fpl.local",
+        transport=None if base_url is not None else SyntheticTransport(fpl, faults),
+    )
+    gameweek = fpl.current_gameweek
+    league_id = fpl.league_id
+    print(f"{fpl.managers} managers")
+    started = time.perf_counter()
+    try:
+        await _timed("bootstrap", adapter.get_bootstrap)
+        await _timed("live event", lambda: adapter.get_gameweek_live_event(gameweek))
+        entries = await _timed(
+            "classic standings",
+            lambda: adapter.list_classic_league_standings(league_id),
+        )
+        player_ids = [entry.entry for entry in entries]
+
+        async def fan_out(fetch):
+            return await asyncio.gather(*[fetch(i) for i in player_ids])
+
+        await _timed(
+            "picks",
+            lambda: fan_out(lambda i: adapter.get_player_team_by_id(i, gameweek)),
+        )
+        await _timed("entry histories", lambda: fan_out(adapter.get_entry_history))
+        await _timed(
+            "h2h results", lambda: adapter.list_h2h_results(gameweek, league_id)
+        )
+    finally:
+        await adapter.close()
+    print(f"  {'total':<22} {(time.perf_counter() - started) * 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--managers", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--concurrency", type=int, default=RequestScheduler.MAX_CONCURRENCY
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1000.0,
+        help="requests per second of the scheduler, FPL's own pacing is far lower",
+    )
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        default=None,
+        help="a running benchmark.fpl_server, its league size is used as is",
+    )
+    args = parser.parse_args()
+    for managers in args.managers:
+        asyncio.run(_profile(SyntheticFPL(managers=managers), args, args.base_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Measure the memory held by decoded bootstrap-static and event/live snapshots.
+
+Compares the slotted models with the same fields laid out in a per-instance
+__dict__, which is how the models were stored before. Payload values are
+shared between both layouts, so the numbers are the overhead of the objects
+and their containers.
+
+Usage:
+    python -m benchmark.memory --payload bootstrap-static.json --teams 50
+"""
+
+import os
+import sys
+import random
+import argparse
+import tracemalloc
+from dataclasses import fields, make_dataclass
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import models
+from models.fpl_model import FPLPlayerStats
+from benchmark.decode import _load_recorded_payload, _synthetic_payload
+
+
+def _synthetic_live_payload(element_ids, rng: random.Random):
+    stat_names = [f.name for f in fields(FPLPlayerStats)]
+    return [
+        {
+            "id": element_id,
+            "stats": {name: rng.randint(0, 90) for name in stat_names},
+            "explain": [],
+        }
+        for element_id in element_ids
+    ]
+
+
+def _synthetic_picks_payload(element_ids, num_teams: int, rng: random.Random):
+    teams = []
+    for _ in range(num_teams):
+        picks = [
+            {
+                "element": element_id,
+                "position": position,
+                "multiplier": 1 if position <= 11 else 0,
+                "is_captain": False,
+                "is_vice_captain": False,
+            }
+            for position, element_id in enumerate(rng.sample(element_ids, 15), 1)
+        ]
+        teams.append(picks)
+    return teams
+
+
+def _unslotted(cls):
+    return make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)])
+
+
+def _dict_decoder(cls):
+    names = frozenset(f.name for f in fields(cls))
+
+    def decode(data: dict):
+        obj = object.__new__(cls)
+        obj.__dict__.update({k: v for k, v in data.items() if k in names})
+        return obj
+
+    return decode
+
+
+_decode_element = _dict_decoder(_unslotted(models.BootstrapElement))
+_decode_stats = _dict_decoder(_unslotted(FPLPlayerStats))
+_decode_live = _dict_decoder(_unslotted(models.FPLLiveEventElement))
+_decode_pick = _dict_decoder(_unslotted(models.FPLPick))
+
+
+def _decode_dict_layout(bootstrap_data: dict, live_data: list, picks_data: list):
+    elements = [_decode_element(d) for d in bootstrap_data["elements"]]
+    live = []
+    for d in live_data:
+        element = _decode_live(d)
+        element.stats = _decode_stats(d["stats"])
+        live.append(element)
+    picks = [[_decode_pick(d) for d in team] for team in picks_data]
+    return elements, live, picks
+
+
+def _decode_slotted(bootstrap_data: dict, live_data: list, picks_data: list):
+    elements = models.decode_list(models.BootstrapElement, bootstrap_data["elements"])
+    live = models.decode_list(models.FPLLiveEventElement, live_data)
+    picks = [models.decode_list(models.FPLPick, team) for team in picks_data]
+    return elements, live, picks
+
+
+def _measure(func, *args) -> int:
+    tracemalloc.start()
+    try:
+        snapshot = func(*args)  # pylint: disable=unused-variable
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure decoded snapshot memory.")
+    parser.add_argument("--payload", type=str, help="recorded bootstrap-static JSON")
+    parser.add_argument("--teams", type=int, default=50, help="fantasy teams picked")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    bootstrap_data = _load_recorded_payload(args.payload) or _synthetic_payload()
+    element_ids = [d["id"] for d in bootstrap_data["elements"]]
+    live_data = _synthetic_live_payload(element_ids, rng)
+    picks_data = _synthetic_picks_payload(element_ids, args.teams, rng)
+    print(
+        f"{len(element_ids)} elements, {len(live_data)} live elements, "
+        f"{args.teams} teams"
+    )
+
+    dict_size = _measure(_decode_dict_layout, bootstrap_data, live_data, picks_data)
+    slotted_size = _measure(_decode_slotted, bootstrap_data, live_data, picks_data)
+    print(f"{'layout':>10} {'snapshot (KiB)':>15}")
+    for name, size in (("__dict__", dict_size), ("slotted", slotted_size)):
+        print(f"{name:>10} {size / 1024:>15.1f}")
+    print(f"saved {1 - slotted_size / dict_size:.0%}")
+
+
+if __name__ == "__main__":
+    main()
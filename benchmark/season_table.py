@@ -0,0 +1,158 @@
+"""
+Benchmark ranking and reward allocation of a full season.
+
+Compares the original per-gameweek ranking (float noise tie-break and
+pairwise tie detection), the pure Python composite-key ranking
+models.rank_players and the vectorized models.SeasonTable.
+
+Usage:
+    python -m benchmark.season_table --sizes 10 100 1000 10000 --gameweeks 38
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from models import SeasonTable, PlayerGameweekData, rank_players
+
+# pairwise tie detection is quadratic, larger leagues take minutes
+LEGACY_MAX_PLAYERS = 1000
+
+
+def _create_table(num_players: int, num_gameweeks: int, seed: int) -> SeasonTable:
+    rng = random.Random(seed)
+    table = SeasonTable(
+        player_ids=list(range(1, num_players + 1)),
+        gameweeks=list(range(1, num_gameweeks + 1)),
+    )
+    for row in range(num_players):
+        for col in range(num_gameweeks):
+            table.points[row, col] = rng.randint(20, 90)
+            table.transfers_cost[row, col] = rng.choice([0, 0, 0, 4, 8])
+            table.captain_points[row, col] = rng.randint(0, 12) * 2
+            table.vice_captain_points[row, col] = rng.randint(0, 12)
+    return table
+
+
+def _add_noise(value, noise_factor=0.0000000099):
+    return value + random.uniform(0, noise_factor)
+
+
+def _is_equal_float(a: float, b: float, precision=6):
+    return abs(a - b) < 10**-precision
+
+
+def _legacy_rank_gameweek(
+    table: SeasonTable, col: int, rewards: List[float]
+) -> List[PlayerGameweekData]:
+    players: List[PlayerGameweekData] = []
+    for row, player_id in enumerate(table.player_ids):
+        points = int(table.points[row, col] - table.transfers_cost[row, col])
+        captain = int(table.captain_points[row, col])
+        vice = int(table.vice_captain_points[row, col])
+        players.append(
+            PlayerGameweekData(
+                player_id=int(player_id),
+                points=_add_noise(points) + captain / 10000 + vice / 1000000,
+            )
+        )
+    players = sorted(players, key=lambda player: player.points, reverse=True)
+    for i, p in enumerate(players):
+        for j, other in enumerate(players):
+            if i == j:
+                continue
+            if _is_equal_float(other.points, p.points) and p.points > 1:
+                p.reward_division += 1
+                p.shared_reward_player_ids.append(other.player_id)
+    for i, p in enumerate(players):
+        p.reward = rewards[i]
+    shared = [p for p in players if p.reward_division > 1]
+    for p in shared:
+        p.reward = round(sum(s.reward for s in shared) / p.reward_division, 2)
+    return players
+
+
+def _composite_rank_gameweek(
+    table: SeasonTable, col: int, rewards: List[float]
+) -> List[PlayerGameweekData]:
+    players = [
+        PlayerGameweekData(
+            player_id=int(player_id),
+            points=int(table.points[row, col] - table.transfers_cost[row, col]),
+            captain_points=int(table.captain_points[row, col]),
+            vice_captain_points=int(table.vice_captain_points[row, col]),
+        )
+        for row, player_id in enumerate(table.player_ids)
+    ]
+    players = rank_players(players)
+    start = 0
+    while start < len(players):
+        end = start + players[start].reward_division
+        reward = round(sum(rewards[start:end]) / (end - start), 2)
+        for p in players[start:end]:
+            p.reward = reward
+        start = end
+    return players
+
+
+def _bench(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark season ranking.")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 50000]
+    )
+    parser.add_argument("--gameweeks", type=int, default=38)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'managers':>10} {'legacy (s)':>12} {'composite (s)':>14}"
+        f" {'season table (s)':>18} {'speedup':>9}"
+    )
+    for num_players in args.sizes:
+        table = _create_table(num_players, args.gameweeks, seed=num_players)
+        rewards = [float(num_players - i) for i in range(num_players)]
+
+        def run_season_table(table=table, rewards=rewards):
+            table.rank()
+            table.allocate_rewards(rewards)
+
+        def run_composite(table=table, rewards=rewards):
+            for col in range(args.gameweeks):
+                _composite_rank_gameweek(table, col, rewards)
+
+        def run_legacy(table=table, rewards=rewards):
+            for col in range(args.gameweeks):
+                _legacy_rank_gameweek(table, col, rewards)
+
+        season_table_time = _bench(run_season_table, args.repeat)
+        composite_time = _bench(run_composite, 1)
+        if num_players > LEGACY_MAX_PLAYERS:
+            print(
+                f"{num_players:>10} {'-':>12} {composite_time:>14.4f}"
+                f" {season_table_time:>18.4f} {'-':>9}"
+            )
+            continue
+        legacy_time = _bench(run_legacy, 1)
+        print(
+            f"{num_players:>10} {legacy_time:>12.4f} {composite_time:>14.4f}"
+            f" {season_table_time:>18.4f} {legacy_time / season_table_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
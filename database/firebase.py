@@ -48,6 +48,25 @@ class FirebaseRealtimeDatabase:
             logger.error(f"Error putting data: {e}")
             return False
 
+    def update_data(self, path, update):
+        """
+        Atomically update data at the specified path in the Firebase Realtime
+        Database.
+
+        Args:
+            path (str): The path to the data in the database.
+            update (callable): Receives the current data and returns the new data.
+                It may be called more than once if the data changes concurrently.
+
+        Returns:
+            Any: The new data, or None if the transaction failed.
+        """
+        try:
+            return self.__db_ref.child(path).transaction(update)
+        except Exception as e:
+            logger.error(f"Error updating data: {e}")
+            return None
+
     def get_data(self, path):
         """
         Get data from the specified path in the Firebase Realtime Database.
@@ -35,8 +35,10 @@ source remove_dependencies.sh requirement.deploy2.txt matplotlib numpy kiwiresol
 pip install -r requirement.deploy2.txt -t layer_plot_generator/python/lib/python3.9/site-packages
 
 # build numpy@1.26.2
+# general lambdas need numpy for models.SeasonTable
 curl -O https://files.pythonhosted.org/packages/2f/75/f007cc0e6a373207818bef17f463d3305e9dd380a70db0e523e7660bf21f/numpy-1.26.2-cp39-cp39-manylinux_2_17_x86_64.manylinux2014_x86_64.whl
 unzip -o numpy-1.26.2-cp39-cp39-manylinux_2_17_x86_64.manylinux2014_x86_64.whl -d ./layer_plot_generator/python/lib/python3.9/site-packages/
+unzip -o numpy-1.26.2-cp39-cp39-manylinux_2_17_x86_64.manylinux2014_x86_64.whl -d ./layer/python/lib/python3.9/site-packages/
 rm numpy-1.26.2-cp39-cp39-manylinux_2_17_x86_64.manylinux2014_x86_64.whl
 
 # build matplotlib@3.8.2
@@ -15,6 +15,7 @@ async def execute():
     global _APP
     if _APP is None:
         _APP = App()
+    await _APP.open()
     gw_status = await _APP.fpl_service.get_current_gameweek()
     line_channel_ids = _APP.firebase_repo.list_line_channels()
     for group_id in line_channel_ids:
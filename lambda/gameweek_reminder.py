@@ -15,9 +15,19 @@ LINE_UP_STATEMACHINE_ARN = "arn:aws:states:ap-southeast-1:661296166047:stateMach
 
 async def execute():
     app = App()
-    gw_status = await app.fpl_service.get_current_gameweek()
+    await app.open()
+    try:
+        await _execute(app)
+    finally:
+        await app.close()
+
+
+async def _execute(app: App):
+    gw_status, system_current_gameweek = await asyncio.gather(
+        app.fpl_service.get_current_gameweek(),
+        app.fpl_service.aget_current_gameweek_from_dynamodb(),
+    )
     fpl_current_gameweek = gw_status.event + 1
-    system_current_gameweek = app.fpl_service.get_current_gameweek_from_dynamodb()
 
     if system_current_gameweek >= fpl_current_gameweek:
         return
@@ -11,11 +11,13 @@ from api import LineMessageAPI
 from app import App
 
 _APP = None
+_API = None
 
 
 def handler(event, context):
-    global _APP
+    global _APP, _API
     if _APP is None:
         _APP = App()
-    app = LineMessageAPI(app=_APP).initialize()
-    return awsgi.response(app, event, context)
+    if _API is None:
+        _API = LineMessageAPI(app=_APP).initialize()
+    return awsgi.response(_API, event, context)
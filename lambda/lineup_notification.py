@@ -16,6 +16,7 @@ async def execute(gameweek: int):
     if _APP is None:
         _APP = App()
     app = _APP
+    await app.open()
     group_ids = app.firebase_repo.list_line_channels()
     for group_id in group_ids:
         league_id = app.firebase_repo.list_leagues_by_line_group_id(group_id)[0]
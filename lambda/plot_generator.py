@@ -21,16 +21,24 @@ S3_UPLOADER = S3Uploader(session=SESSION, bucket="ds-fpl")
 def execute(event: dict) -> List[str]:
     start_gw: int = event.get("start_gw")
     end_gw: int = event.get("end_gw")
-    data: list[list[models.PlayerGameweekData]] = []
-    for gameweek_data in event.get("gameweeks_data"):
-        g = [models.PlayerGameweekData(**d) for d in gameweek_data]
-        data.append(g)
     plot_service = PlotService(S3_UPLOADER)
-    urls = plot_service.generate_overall_gameweeks_plot(
-        from_gameweek=start_gw,
-        to_gameweek=end_gw,
-        gameweeks_data=data,
-    )
+    if event.get("cumulative_revenues") is not None:
+        urls = plot_service.generate_cumulative_revenue_plot(
+            from_gameweek=start_gw,
+            to_gameweek=end_gw,
+            player_names=event.get("player_names"),
+            cumulative_revenues=event.get("cumulative_revenues"),
+        )
+    else:
+        data: list[list[models.PlayerGameweekData]] = []
+        for gameweek_data in event.get("gameweeks_data"):
+            g = [models.PlayerGameweekData(**d) for d in gameweek_data]
+            data.append(g)
+        urls = plot_service.generate_overall_gameweeks_plot(
+            from_gameweek=start_gw,
+            to_gameweek=end_gw,
+            gameweeks_data=data,
+        )
 
     for url in urls:
         logger.success(url)
@@ -8,13 +8,17 @@ GAMEWEEK = 17
 
 async def main() -> None:
     app = App()
+    await app.open()
 
-    gameweek_fixtures = await app.fpl_service.list_gameweek_fixtures(gameweek=20)
-    app.message_service.send_gameweek_fixtures_message(
-        group_id=GROUP_ID,
-        fixtures=gameweek_fixtures,
-        gameweek=20,
-    )
+    try:
+        gameweek_fixtures = await app.fpl_service.list_gameweek_fixtures(gameweek=20)
+        app.message_service.send_gameweek_fixtures_message(
+            group_id=GROUP_ID,
+            fixtures=gameweek_fixtures,
+            gameweek=20,
+        )
+    finally:
+        await app.close()
 
 
 if __name__ == "__main__":
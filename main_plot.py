@@ -6,22 +6,28 @@ from plot import Service as PlotService
 
 async def main() -> None:
     app = App()
+    await app.open()
     channel_id = app.firebase_repo.list_line_channels()[0]
     league_id = app.firebase_repo.list_leagues_by_line_group_id(channel_id)
-    data: list[list[models.PlayerGameweekData]] = []
     start_gw = 1
     end_gw = 17
-    for gw in range(start_gw, end_gw + 1, 1):
-        gameweek_data = await app.fpl_service.get_or_update_fpl_gameweek_table(
-            gw,
-            league_id,
-        )
-        data.append(gameweek_data)
+    cumulative_revenues = await app.fpl_service.list_players_cumulative_revenues(
+        from_gameweek=start_gw,
+        to_gameweek=end_gw,
+        league_id=league_id,
+    )
+    await app.close()
+    players: list[models.PlayerData] = [
+        p
+        for p in app.firebase_repo.list_league_players(league_id)
+        if p.player_id in cumulative_revenues
+    ]
     plot_service = PlotService(app.s3_uploader)
-    urls = plot_service.generate_overall_gameweeks_plot(
+    urls = plot_service.generate_cumulative_revenue_plot(
         from_gameweek=start_gw,
         to_gameweek=end_gw,
-        gameweeks_data=data,
+        player_names=[p.name for p in players],
+        cumulative_revenues=[cumulative_revenues[p.player_id] for p in players],
     )
     for url in urls:
         print(url)
@@ -17,6 +17,12 @@ async def main():
         "--gameweek", type=int, help="Specify the gameweek as an integer"
     )
 
+    parser.add_argument(
+        "--purge-response-cache",
+        action="store_true",
+        help="Drop cached FPL API responses before processing",
+    )
+
     # Parse the command-line arguments
     args = parser.parse_args()
 
@@ -29,6 +35,10 @@ async def main():
 
     logger.info(f"processing gameweek {gameweek}")
     app = App()
+    await app.open()
+    if args.purge_response_cache:
+        purged = app.fpl_adapter.purge_response_cache()
+        logger.info(f"purged {purged} cached FPL responses")
     league_ids = app.firebase_repo.list_leagues_by_line_group_id(group_id=GROUP_ID)
     league_id = league_ids[0]
     event_status = await app.fpl_service.get_gameweek_event_status(gameweek=gameweek)
@@ -38,6 +48,8 @@ async def main():
         ignore_cache=True,
     )
 
+    await app.close()
+
     # app.message_service.send_gameweek_result_message(
     #     gameweek=gameweek,
     #     event_status=event_status,
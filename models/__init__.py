@@ -4,6 +4,7 @@ from .fpl_model import (
     FPLPlayerSeasonHistory,
     FPLFantasyTeam,
     FPLEntryHistory,
+    FPLEntrySeasonHistory,
     FPLH2HData,
     FPLH2HResponse,
     FPLPick,
@@ -28,11 +29,30 @@ from .model import (
     PlayerGameweekData,
     PlayerRevenue,
     PlayerGameweekPicksData,
+    PickView,
     PlayerSheetData,
     LeagueSheet,
     PlayerData,
 )
 
+from .season_history import SeasonHistory
+from .season_table import SeasonTable
+from .ranking import composite_key, rank_players
+from .revenue_ledger import RevenueLedger
+from .cache_codec import (
+    CACHE_CODEC_VERSION,
+    encode_gameweek_results,
+    decode_gameweek_results,
+)
+from .element_table import ElementTable, ElementRow
+from .decoder import (
+    decode,
+    decode_list,
+    decoder_for,
+    partial_decoder_for,
+    register_decoders,
+)
+
 from .bootstrap import (
     Bootstrap,
     BootstrapElement,
@@ -44,6 +64,7 @@ from .bootstrap import (
 __all__ = [
     "FPLFantasyTeam",
     "FPLEntryHistory",
+    "FPLEntrySeasonHistory",
     "FPLH2HData",
     "FPLH2HResponse",
     "FPLPick",
@@ -61,6 +82,7 @@ __all__ = [
     "BootstrapElement",
     "BootstrapGameweek",
     "PlayerGameweekPicksData",
+    "PickView",
     "PlayerSheetData",
     "PlayerPosition",
     "FPLLiveEventResponse",
@@ -76,4 +98,34 @@ __all__ = [
     "FPLClassicLeagueStandings",
     "FPLClassicLeagueInfo",
     "FPLClassicLeagueStandingData",
+    "SeasonHistory",
+    "SeasonTable",
+    "composite_key",
+    "rank_players",
+    "RevenueLedger",
+    "CACHE_CODEC_VERSION",
+    "encode_gameweek_results",
+    "decode_gameweek_results",
+    "ElementTable",
+    "ElementRow",
+    "decode",
+    "decode_list",
+    "decoder_for",
+    "partial_decoder_for",
 ]
+
+# compile the decoders of API payload models once at import
+register_decoders(
+    Bootstrap,
+    FPLEntrySeasonHistory,
+    FPLFantasyTeam,
+    FPLH2HResponse,
+    FPLEventStatusResponse,
+    FPLLeagueEntry,
+    FPLLiveEventResponse,
+    FPLMatchFixture,
+    FPLPlayerData,
+    FPLPlayerGameweekPicksData,
+    FPLTeamStanding,
+    FPLClassicLeagueStandingData,
+)
@@ -0,0 +1,20 @@
+from dataclasses import fields
+
+
+def slotted(cls):
+    """
+    Recreate a dataclass with __slots__ so instances carry no __dict__.
+    Backport of dataclass(slots=True), which needs Python 3.10.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # defaults live in the generated __init__, class attributes would
+        # conflict with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
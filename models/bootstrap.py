@@ -1,6 +1,8 @@
-from dataclasses import dataclass, field, fields
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from enum import Enum
+from .decoder import field_names
+from ._slots import slotted
 
 
 @dataclass
@@ -49,7 +51,7 @@ class BootstrapGameweek:
     most_vice_captained: int
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -62,7 +64,8 @@ class BootstrapGameweek:
             self.top_element_info = TopElementInfo(**dict(self.top_element_info))
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class BootstrapElement:
     chance_of_playing_next_round: int
     chance_of_playing_this_round: int
@@ -155,11 +158,6 @@ class BootstrapElement:
 
     # manually constructed fields
     position: Optional[PlayerPosition] = field(default=None)
-    is_subsituition: Optional[bool] = field(default=None)
-    pick_position: Optional[int] = field(default=None)
-    is_captain: Optional[bool] = field(default=None)
-    is_vice_captain: Optional[bool] = field(default=None)
-    gameweek_points: Optional[int] = field(default=None)
 
     def __post_init__(self):
         positions = [
@@ -168,7 +166,7 @@ class BootstrapElement:
             PlayerPosition.MIDFIELDER,
             PlayerPosition.FORWARD,
         ]
-        self.position = positions[self.element_type - 1]
+        object.__setattr__(self, "position", positions[self.element_type - 1])
 
 
 @dataclass
@@ -201,3 +199,25 @@ class Bootstrap:
     events: List[BootstrapGameweek]
     elements: List[BootstrapElement]
     teams: List[BootstrapTeam]
+
+    _events_by_id: Dict[int, BootstrapGameweek] = field(
+        default_factory=dict, repr=False
+    )
+    _elements_by_id: Dict[int, BootstrapElement] = field(
+        default_factory=dict, repr=False
+    )
+    _teams_by_id: Dict[int, BootstrapTeam] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._events_by_id = {event.id: event for event in self.events}
+        self._elements_by_id = {element.id: element for element in self.elements}
+        self._teams_by_id = {team.id: team for team in self.teams}
+
+    def get_gameweek(self, gameweek: int) -> Optional[BootstrapGameweek]:
+        return self._events_by_id.get(gameweek)
+
+    def get_element(self, element_id: int) -> Optional[BootstrapElement]:
+        return self._elements_by_id.get(element_id)
+
+    def get_team(self, team_id: int) -> Optional[BootstrapTeam]:
+        return self._teams_by_id.get(team_id)
@@ -0,0 +1,81 @@
+import json
+import zlib
+from dataclasses import fields
+from typing import List, Tuple, Union
+from .model import PlayerGameweekData
+
+# bumped whenever the row layout changes, older payloads keep their layout
+CACHE_CODEC_VERSION = 1
+
+# version -> PlayerGameweekData field of each row column
+_ROW_LAYOUTS = {
+    1: (
+        "name",
+        "team_name",
+        "subsitution_cost",
+        "player_id",
+        "points",
+        "reward_division",
+        "shared_reward_player_ids",
+        "reward",
+        "captain_points",
+        "vice_captain_points",
+        "bank_account",
+    ),
+}
+
+
+_MODEL_FIELDS = tuple(f.name for f in fields(PlayerGameweekData))
+
+
+def _row(player: PlayerGameweekData, layout: Tuple[str, ...]) -> list:
+    return [getattr(player, name) for name in layout]
+
+
+def encode_gameweek_results(players: List[PlayerGameweekData]) -> bytes:
+    """
+    Encode gameweek results as one version byte followed by a zlib
+    compressed JSON array of rows, one array of field values per player.
+    """
+    layout = _ROW_LAYOUTS[CACHE_CODEC_VERSION]
+    rows = [_row(player, layout) for player in players]
+    payload = json.dumps(rows, separators=(",", ":"), ensure_ascii=False)
+    return bytes([CACHE_CODEC_VERSION]) + zlib.compress(payload.encode("utf-8"))
+
+
+def decode_gameweek_results(data: Union[bytes, str]) -> List[PlayerGameweekData]:
+    """
+    Decode gameweek results from a binary payload of encode_gameweek_results
+    or from a JSON string of player objects written before the codec.
+
+    Raises:
+    - ValueError: The payload is corrupt or was written by an unknown codec
+      version.
+    """
+    if isinstance(data, str):
+        names = _ROW_LAYOUTS[CACHE_CODEC_VERSION]
+        try:
+            return [
+                PlayerGameweekData(**{name: obj[name] for name in names})
+                for obj in json.loads(data)
+            ]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"malformed gameweek results object: {e!r}") from e
+    if len(data) == 0:
+        raise ValueError("empty gameweek results payload")
+    version = data[0]
+    layout = _ROW_LAYOUTS.get(version)
+    if layout is None:
+        raise ValueError(f"unknown gameweek results codec version {version}")
+    try:
+        rows = json.loads(zlib.decompress(data[1:]))
+    except zlib.error as e:
+        raise ValueError(f"corrupt gameweek results payload: {e}") from e
+    if not isinstance(rows, list) or not all(
+        isinstance(row, list) and len(row) == len(layout) for row in rows
+    ):
+        raise ValueError("malformed gameweek results rows")
+    if layout == _MODEL_FIELDS[: len(layout)]:
+        # columns in field order construct the model positionally
+        return [PlayerGameweekData(*row) for row in rows]
+    return [PlayerGameweekData(**dict(zip(layout, row))) for row in rows]
@@ -0,0 +1,127 @@
+import inspect
+import typing
+import functools
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+_DECODERS: Dict[type, Callable[[dict], Any]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def field_names(cls: type) -> FrozenSet[str]:
+    return frozenset(f.name for f in fields(cls))
+
+
+def _has_kwargs_init(cls: type) -> bool:
+    # models whose __init__ only sets the given known fields
+    parameters = inspect.signature(cls.__init__).parameters.values()
+    return any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+
+
+def _nested_model(annotation) -> Optional[Tuple[bool, type]]:
+    """
+    Returns (is_list, model) when a field holds a model or a list of models.
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        # Optional[X]
+        candidates = [arg for arg in args if arg is not type(None)]
+        if len(candidates) == 1:
+            return _nested_model(candidates[0])
+        return None
+    if origin in (list, List) and len(args) == 1 and is_dataclass(args[0]):
+        return True, args[0]
+    if isinstance(annotation, type) and is_dataclass(annotation):
+        return False, annotation
+    return None
+
+
+def _compile(cls: type, only: Optional[FrozenSet[str]] = None) -> Callable[[dict], Any]:
+    hints = typing.get_type_hints(cls)
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "new": object.__new__,
+        "names": field_names(cls) if only is None else field_names(cls) & only,
+    }
+    lines = [
+        "def decode(data):",
+        "    kwargs = {k: v for k, v in data.items() if k in names}",
+    ]
+    for i, f in enumerate(fields(cls)):
+        if f.name not in namespace["names"]:
+            continue
+        nested = _nested_model(hints.get(f.name))
+        if nested is None:
+            continue
+        is_list, model = nested
+        namespace[f"decode_{i}"] = decoder_for(model)
+        lines.append(f"    value = kwargs.get({f.name!r})")
+        if is_list:
+            lines.append(
+                f"    if value is not None: kwargs[{f.name!r}] = "
+                f"[decode_{i}(v) for v in value]"
+            )
+        else:
+            lines.append(
+                f"    if value is not None: kwargs[{f.name!r}] = decode_{i}(value)"
+            )
+    if "__slots__" in cls.__dict__ and (only is not None or _has_kwargs_init(cls)):
+        # slotted (and possibly frozen) models have no __dict__ to fill
+        namespace["set_field"] = object.__setattr__
+        lines += [
+            "    obj = new(cls)",
+            "    for k, v in kwargs.items(): set_field(obj, k, v)",
+            "    return obj",
+        ]
+    elif only is not None or _has_kwargs_init(cls):
+        lines += [
+            "    obj = new(cls)",
+            "    obj.__dict__.update(kwargs)",
+            "    return obj",
+        ]
+    else:
+        lines.append("    return cls(**kwargs)")
+
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    decode_fn = namespace["decode"]
+    decode_fn.__qualname__ = f"decode_{cls.__name__}"
+    return decode_fn
+
+
+def decoder_for(cls: Type[T]) -> Callable[[dict], T]:
+    """
+    Get the construction function of a dataclass model from a decoded JSON
+    object. Unknown keys are dropped and fields annotated with models or
+    lists of models are decoded recursively.
+    """
+    decode_fn = _DECODERS.get(cls)
+    if decode_fn is None:
+        decode_fn = _compile(cls)
+        _DECODERS[cls] = decode_fn
+    return decode_fn
+
+
+@functools.lru_cache(maxsize=None)
+def partial_decoder_for(cls: Type[T], only: FrozenSet[str]) -> Callable[[dict], T]:
+    """
+    Like decoder_for, but only the fields in `only` are kept and __init__ is
+    not run. Other fields of the model are left unset.
+    """
+    return _compile(cls, only)
+
+
+def register_decoders(*classes: type):
+    for cls in classes:
+        decoder_for(cls)
+
+
+def decode(cls: Type[T], data: dict) -> T:
+    return decoder_for(cls)(data)
+
+
+def decode_list(cls: Type[T], items: List[dict]) -> List[T]:
+    decode_fn = decoder_for(cls)
+    return [decode_fn(item) for item in items]
@@ -0,0 +1,274 @@
+import typing
+from dataclasses import fields
+from typing import Dict, List, Optional, Sequence, Set
+import numpy as np
+from .bootstrap import Bootstrap, BootstrapElement, PlayerPosition
+from .fpl_model import FPLLiveEventResponse, FPLPlayerStats
+
+_POSITIONS = list(PlayerPosition)
+
+_NUMERIC_DTYPES = {bool: np.bool_, int: np.int64}
+
+
+def _column_kind(annotation) -> Optional[str]:
+    if annotation in _NUMERIC_DTYPES:
+        return "numeric"
+    if annotation is str:
+        return "string"
+    args = set(typing.get_args(annotation))
+    if typing.get_origin(annotation) is typing.Union and args == {int, type(None)}:
+        return "optional"
+    return None
+
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class ElementTable:
+    """
+    Columnar bootstrap elements, optionally joined with the stats of one
+    event/live response.
+
+    Integer and boolean fields are typed arrays, optional integers are
+    float64 with NaN for None and string fields are int32 codes into one
+    interned string pool (-1 for None). Live stats columns are prefixed with
+    "live_" and are 0 for elements missing from the live response.
+    """
+
+    LIVE_PREFIX = "live_"
+
+    def __init__(self, ids: Sequence[int]):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.__rows = {int(element_id): row for row, element_id in enumerate(self.ids)}
+        self.__columns: Dict[str, np.ndarray] = {}
+        self.__string_columns: Set[str] = set()
+        self.__optional_columns: Set[str] = set()
+        self.__strings: List[str] = []
+        self.__string_codes: Dict[str, int] = {}
+
+    @staticmethod
+    def from_bootstrap(
+        bootstrap: Bootstrap, live: Optional[FPLLiveEventResponse] = None
+    ) -> "ElementTable":
+        table = ElementTable([element.id for element in bootstrap.elements])
+        table.add_columns(BootstrapElement, bootstrap.elements)
+        if live is not None:
+            table.add_live_stats(live)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_columns(
+        self,
+        cls: type,
+        objects: Sequence[object],
+        prefix: str = "",
+        fill: Optional[int] = None,
+    ):
+        """
+        Add a column per int, bool, Optional[int] and str field of the
+        dataclass `cls`. `objects` are aligned with the rows and may be None.
+
+        Numeric values that are None or unset are replaced by `fill`. Without
+        a fill, int columns holding None are stored as optional columns since
+        the API sends null for some int fields such as
+        chance_of_playing_this_round.
+        """
+        hints = typing.get_type_hints(cls)
+        for f in fields(cls):
+            kind = _column_kind(hints.get(f.name))
+            if kind is None or f.name == "id":
+                continue
+            values = [getattr(obj, f.name, None) for obj in objects]
+            if kind == "numeric" and fill is None and None in values:
+                kind = "optional"
+            self.__set_column(prefix + f.name, kind, hints[f.name], values, fill)
+
+    def add_live_stats(self, live: FPLLiveEventResponse):
+        stats: List[Optional[FPLPlayerStats]] = [None] * len(self)
+        for element in live.elements:
+            row = self.__rows.get(element.id)
+            if row is not None:
+                stats[row] = element.stats
+        # elements missing from the live response did not play
+        self.add_columns(FPLPlayerStats, stats, prefix=self.LIVE_PREFIX, fill=0)
+
+    def has_column(self, name: str) -> bool:
+        return name in self.__columns
+
+    @property
+    def has_live_stats(self) -> bool:
+        return self.has_column(f"{self.LIVE_PREFIX}total_points")
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        The stored array of a column. String columns are returned as an
+        object array of the interned strings.
+        """
+        values = self.__columns[name]
+        if name in self.__string_columns:
+            pool = np.asarray(self.__strings + [None], dtype=object)
+            return pool[values]
+        return values
+
+    def numeric(self, name: str) -> np.ndarray:
+        """
+        A column as float64. String columns holding decimals such as "form"
+        or "selected_by_percent" are parsed once per distinct value, values
+        that are not numbers become NaN.
+        """
+        values = self.__columns[name]
+        if name in self.__string_columns:
+            pool = np.array(
+                [_parse_float(s) for s in self.__strings] + [np.nan], dtype=np.float64
+            )
+            return pool[values]
+        return values.astype(np.float64)
+
+    def row_of(self, element_id: int) -> Optional[int]:
+        return self.__rows.get(element_id)
+
+    def equals(self, name: str, value) -> np.ndarray:
+        values = self.__columns[name]
+        if name in self.__string_columns:
+            code = -1 if value is None else self.__string_codes.get(value)
+            if code is None:
+                return np.zeros(len(self), dtype=bool)
+            return values == code
+        return values == value
+
+    def between(
+        self, name: str, low: Optional[float] = None, high: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Rows whose value is within [low, high], e.g. between("now_cost", 45, 60)
+        for players priced from 4.5 to 6.0.
+        """
+        values = self.numeric(name)
+        mask = ~np.isnan(values)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    def played(self) -> np.ndarray:
+        if not self.has_live_stats:
+            raise Exception("element table has no live stats")
+        return self.__columns[f"{self.LIVE_PREFIX}minutes"] > 0
+
+    def sum_by(
+        self,
+        value_name: str,
+        group_name: str = "team",
+        mask: Optional[np.ndarray] = None,
+    ) -> Dict[int, float]:
+        groups = self.__columns[group_name]
+        values = self.numeric(value_name)
+        if mask is not None:
+            groups = groups[mask]
+            values = values[mask]
+        keys, inverse = np.unique(groups, return_inverse=True)
+        sums = np.bincount(inverse, weights=values, minlength=len(keys))
+        return {int(key): float(total) for key, total in zip(keys, sums)}
+
+    def points_by_team(self, mask: Optional[np.ndarray] = None) -> Dict[int, float]:
+        """
+        Gameweek points per team id, from the live stats when joined and
+        from the bootstrap event points otherwise.
+        """
+        value_name = (
+            f"{self.LIVE_PREFIX}total_points" if self.has_live_stats else "event_points"
+        )
+        return self.sum_by(value_name, group_name="team", mask=mask)
+
+    def value(self, name: str, row: int):
+        """
+        The value of one cell as a Python object.
+        """
+        value = self.__columns[name][row]
+        if name in self.__string_columns:
+            return None if value < 0 else self.__strings[value]
+        if name in self.__optional_columns:
+            return None if np.isnan(value) else int(value)
+        return value.item()
+
+    def row(self, row: int) -> "ElementRow":
+        return ElementRow(self, row)
+
+    def get(self, element_id: int) -> Optional["ElementRow"]:
+        row = self.__rows.get(element_id)
+        return None if row is None else ElementRow(self, row)
+
+    def rows(self, mask: Optional[np.ndarray] = None) -> List["ElementRow"]:
+        indexes = range(len(self)) if mask is None else np.flatnonzero(mask)
+        return [ElementRow(self, int(row)) for row in indexes]
+
+    def __intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self.__string_codes.get(value)
+        if code is None:
+            code = len(self.__strings)
+            self.__strings.append(value)
+            self.__string_codes[value] = code
+        return code
+
+    def __set_column(
+        self,
+        name: str,
+        kind: str,
+        annotation,
+        values: List[object],
+        fill: Optional[int],
+    ):
+        if kind == "string":
+            self.__columns[name] = np.fromiter(
+                (self.__intern(v) for v in values), dtype=np.int32, count=len(values)
+            )
+            self.__string_columns.add(name)
+        elif kind == "optional":
+            self.__columns[name] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+            self.__optional_columns.add(name)
+        else:
+            self.__columns[name] = np.array(
+                [fill if v is None else v for v in values],
+                dtype=_NUMERIC_DTYPES[annotation],
+            )
+
+
+class ElementRow:
+    """
+    Read-only row of an ElementTable with the attribute access of
+    BootstrapElement, for templates.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: ElementTable, row: int):
+        self._table = table
+        self._row = row
+
+    def __getattr__(self, name: str):
+        try:
+            return self._table.value(name, self._row)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def id(self) -> int:
+        return int(self._table.ids[self._row])
+
+    @property
+    def position(self) -> PlayerPosition:
+        return _POSITIONS[self.element_type - 1]
+
+    def __repr__(self) -> str:
+        return f"ElementRow(id={self.id}, web_name={self.web_name!r})"
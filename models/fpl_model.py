@@ -1,8 +1,10 @@
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Union
 from datetime import datetime, timezone, date
 import util
 from .bootstrap import BootstrapTeam
+from .decoder import decode, decode_list, field_names
+from ._slots import slotted
 
 
 @dataclass
@@ -12,7 +14,7 @@ class FPLH2HResponse:
     results: List["FPLH2HData"]
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -47,7 +49,7 @@ class FPLH2HData:
     knockout_name: str
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -61,7 +63,7 @@ class FPLFantasyTeam:
     picks: List["FPLPick"]
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -82,13 +84,26 @@ class FPLEntryHistory:
     points_on_bench: int
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
 
 
 @dataclass
+class FPLEntrySeasonHistory:
+    current: List["FPLEntryHistory"]
+    chips: List[Dict[str, Union[str, int]]]
+
+    def __init__(self, **kwargs):
+        names = field_names(type(self))
+        for k, v in kwargs.items():
+            if k in names:
+                setattr(self, k, v)
+
+
+@slotted
+@dataclass(frozen=True)
 class FPLPick:
     element: int
     position: int
@@ -97,10 +112,10 @@ class FPLPick:
     is_vice_captain: bool
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
-                setattr(self, k, v)
+                object.__setattr__(self, k, v)
 
 
 @dataclass
@@ -109,7 +124,7 @@ class FPLPlayerData:
     history_past: List["FPLPlayerSeasonHistory"]
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -155,7 +170,7 @@ class FPLPlayerHistory:
     transfers_out: int
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -192,7 +207,7 @@ class FPLPlayerSeasonHistory:
     expected_goals_conceded: float
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -203,9 +218,11 @@ class FPLLeagueStandings:
     league_id: int
     league_name: str
     standings: List["FPLTeamStanding"]
+    page: int
+    has_next: bool
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -229,7 +246,7 @@ class FPLTeamStanding:
     points_for: int
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -241,7 +258,7 @@ class FPLEventStatusResponse:
     leagues: bool = field(default=False)
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -255,7 +272,7 @@ class FPLEventStatus:
     points: float
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -301,7 +318,8 @@ class FPLMatchFixture:
         )
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class FPLPlayerStats:
     minutes: int
     goals_scored: int
@@ -329,35 +347,32 @@ class FPLPlayerStats:
     in_dreamteam: bool
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
-                setattr(self, k, v)
+                object.__setattr__(self, k, v)
 
     @staticmethod
     def create_from_dict(data: dict):
-        return FPLPlayerStats(**data)
+        return decode(FPLPlayerStats, data)
 
 
-@dataclass
+@slotted
+@dataclass(frozen=True)
 class FPLLiveEventElement:
     id: int
     stats: FPLPlayerStats
     explain: any
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
-                setattr(self, k, v)
+                object.__setattr__(self, k, v)
 
     @staticmethod
     def create_from_dict(data: dict):
-        return FPLLiveEventElement(
-            id=data.get("id"),
-            explain=data.get("explain"),
-            stats=FPLPlayerStats.create_from_dict(data=data.get("stats")),
-        )
+        return decode(FPLLiveEventElement, data)
 
 
 @dataclass
@@ -365,16 +380,14 @@ class FPLLiveEventResponse:
     elements: List[FPLLiveEventElement]
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
 
     @staticmethod
     def create_from_dict(data: List[dict]):
-        return FPLLiveEventResponse(
-            elements=[FPLLiveEventElement.create_from_dict(d) for d in data]
-        )
+        return FPLLiveEventResponse(elements=decode_list(FPLLiveEventElement, data))
 
 
 @dataclass
@@ -384,7 +397,7 @@ class FPLLeagueEntry:
     player_name: str
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
@@ -422,7 +435,7 @@ class FPLPlayerGameweekPicksData:
     picks: List[FPLPlayerGameweekPick]
 
     def __init__(self, **kwargs):
-        names = set([f.name for f in fields(self)])
+        names = field_names(type(self))
         for k, v in kwargs.items():
             if k in names:
                 setattr(self, k, v)
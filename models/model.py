@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field, asdict
-from typing import List
-from .bootstrap import BootstrapElement
+from typing import List, Optional
+from .bootstrap import BootstrapElement, PlayerPosition
 
 
 @dataclass
@@ -37,12 +37,64 @@ class PlayerSheetData:
     team_name: str
 
 
+@dataclass(frozen=True)
+class PickView:
+    """
+    A manager's pick of a gameweek. Refers to the shared bootstrap element
+    and only carries the per-pick fields.
+    """
+
+    element: BootstrapElement
+    pick_position: int
+    multiplier: int
+    is_captain: bool
+    is_vice_captain: bool
+    # None until the element has played in the gameweek
+    gameweek_points: Optional[int] = None
+
+    @property
+    def is_subsituition(self) -> bool:
+        return self.pick_position > 11
+
+    @property
+    def id(self) -> int:
+        return self.element.id
+
+    @property
+    def code(self) -> int:
+        return self.element.code
+
+    @property
+    def position(self) -> PlayerPosition:
+        return self.element.position
+
+    @property
+    def web_name(self) -> str:
+        return self.element.web_name
+
+    @property
+    def first_name(self) -> str:
+        return self.element.first_name
+
+    @property
+    def second_name(self) -> str:
+        return self.element.second_name
+
+    @property
+    def news(self) -> str:
+        return self.element.news
+
+    @property
+    def chance_of_playing_this_round(self) -> Optional[int]:
+        return self.element.chance_of_playing_this_round
+
+
 @dataclass
 class PlayerGameweekPicksData:
     player: PlayerSheetData
     event_transfers_cost: int
     event_transfers: int
-    picked_elements: List[BootstrapElement]
+    picks: List[PickView]
 
 
 @dataclass
@@ -0,0 +1,122 @@
+from typing import List
+import numpy as np
+from .model import PlayerGameweekData
+
+# Gameweek standings order by net points, captain points and vice captain
+# points (all descending) and finally entry id (ascending). The four values
+# are packed into one integer so a single sort ranks a gameweek and equal
+# tie keys identify managers that share rewards.
+_PLAYER_ID_BITS = 31
+_CAPTAIN_BITS = 10
+_POINTS_BITS = 12
+
+_MAX_PLAYER_ID = (1 << _PLAYER_ID_BITS) - 1
+_CAPTAIN_OFFSET = 1 << (_CAPTAIN_BITS - 1)
+_MAX_CAPTAIN = (1 << _CAPTAIN_BITS) - 1
+_POINTS_OFFSET = 1 << (_POINTS_BITS - 1)
+_MAX_POINTS = (1 << _POINTS_BITS) - 1
+
+_VICE_SHIFT = _PLAYER_ID_BITS
+_CAPTAIN_SHIFT = _VICE_SHIFT + _CAPTAIN_BITS
+_POINTS_SHIFT = _CAPTAIN_SHIFT + _CAPTAIN_BITS
+
+
+def _check_range(name: str, value, low: int, high: int):
+    if isinstance(value, np.ndarray):
+        out_of_range = value.size > 0 and (value.min() < low or value.max() > high)
+    else:
+        out_of_range = not low <= value <= high
+    if out_of_range:
+        raise ValueError(f"{name} out of range for ranking key [{low}, {high}]")
+
+
+def _check_ranges(net_points, captain_points, vice_captain_points, player_ids):
+    _check_range("net points", net_points, -_POINTS_OFFSET, _POINTS_OFFSET - 1)
+    _check_range(
+        "captain points", captain_points, -_CAPTAIN_OFFSET, _CAPTAIN_OFFSET - 1
+    )
+    _check_range(
+        "vice captain points",
+        vice_captain_points,
+        -_CAPTAIN_OFFSET,
+        _CAPTAIN_OFFSET - 1,
+    )
+    _check_range("player id", player_ids, 0, _MAX_PLAYER_ID)
+
+
+def composite_key(
+    net_points: int, captain_points: int, vice_captain_points: int, player_id: int
+) -> int:
+    """
+    Ranking key of a manager in a gameweek, lower keys rank higher.
+    """
+    _check_ranges(net_points, captain_points, vice_captain_points, player_id)
+    return (
+        ((_MAX_POINTS - (net_points + _POINTS_OFFSET)) << _POINTS_SHIFT)
+        | ((_MAX_CAPTAIN - (captain_points + _CAPTAIN_OFFSET)) << _CAPTAIN_SHIFT)
+        | ((_MAX_CAPTAIN - (vice_captain_points + _CAPTAIN_OFFSET)) << _VICE_SHIFT)
+        | player_id
+    )
+
+
+def composite_keys(
+    net_points: np.ndarray,
+    captain_points: np.ndarray,
+    vice_captain_points: np.ndarray,
+    player_ids: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized composite_key over int64 arrays of the same shape.
+    """
+    _check_ranges(net_points, captain_points, vice_captain_points, player_ids)
+    return (
+        ((_MAX_POINTS - (net_points + _POINTS_OFFSET)) << _POINTS_SHIFT)
+        | ((_MAX_CAPTAIN - (captain_points + _CAPTAIN_OFFSET)) << _CAPTAIN_SHIFT)
+        | ((_MAX_CAPTAIN - (vice_captain_points + _CAPTAIN_OFFSET)) << _VICE_SHIFT)
+        | player_ids
+    )
+
+
+def tie_keys(keys: np.ndarray) -> np.ndarray:
+    """
+    Drop the entry id from composite keys, equal results are tied.
+    """
+    return keys >> _PLAYER_ID_BITS
+
+
+def rank_players(players: List[PlayerGameweekData]) -> List[PlayerGameweekData]:
+    """
+    Sort a gameweek table and fill reward_division and shared_reward_player_ids
+    of managers with positive points that tie.
+    """
+    ranked = sorted(
+        (
+            (
+                composite_key(
+                    int(p.points), p.captain_points, p.vice_captain_points, p.player_id
+                ),
+                p,
+            )
+            for p in players
+        ),
+        key=lambda item: item[0],
+    )
+    results = [p for _, p in ranked]
+
+    start = 0
+    while start < len(ranked):
+        start_tie_key = ranked[start][0] >> _PLAYER_ID_BITS
+        end = start + 1
+        if results[start].points > 0:
+            while (
+                end < len(ranked) and ranked[end][0] >> _PLAYER_ID_BITS == start_tie_key
+            ):
+                end += 1
+        group = results[start:end]
+        for p in group:
+            p.reward_division = len(group)
+            p.shared_reward_player_ids = [
+                other.player_id for other in group if other.player_id != p.player_id
+            ]
+        start = end
+    return results
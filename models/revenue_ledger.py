@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from .model import PlayerGameweekData
+
+# rewards are money, totals are kept to the satang
+_DECIMALS = 2
+
+
+def _gameweek_key(gameweek: int) -> str:
+    # numeric keys would make the realtime database return a list
+    return f"gw{gameweek}"
+
+
+@dataclass
+class RevenueLedger:
+    """
+    Materialized league revenues. Keeps the rewards of every written gameweek
+    and the running total of each manager up to that gameweek, so revenue
+    summaries and cumulative plots are a single read.
+    """
+
+    # gameweek -> player id -> reward of that gameweek
+    rewards: Dict[int, Dict[int, float]] = field(default_factory=dict)
+    # gameweek -> player id -> sum of rewards up to and including that gameweek
+    totals: Dict[int, Dict[int, float]] = field(default_factory=dict)
+
+    @property
+    def gameweeks(self) -> List[int]:
+        return sorted(self.rewards)
+
+    def put_gameweek(
+        self, gameweek: int, players: List[PlayerGameweekData]
+    ) -> "RevenueLedger":
+        """
+        Record the rewards of a gameweek and update the running totals of
+        that gameweek and the ones after it.
+        """
+        self.rewards[gameweek] = {p.player_id: p.reward for p in players}
+        previous = self.get_totals(gameweek - 1)
+        for gw in self.gameweeks:
+            if gw < gameweek:
+                continue
+            totals = dict(previous)
+            for player_id, reward in self.rewards[gw].items():
+                totals[player_id] = round(totals.get(player_id, 0) + reward, _DECIMALS)
+            self.totals[gw] = totals
+            previous = totals
+        return self
+
+    def get_totals(self, gameweek: Optional[int] = None) -> Dict[int, float]:
+        """
+        Running totals of the latest written gameweek up to `gameweek`.
+        """
+        written = [gw for gw in self.gameweeks if gameweek is None or gw <= gameweek]
+        if len(written) == 0:
+            return {}
+        return self.totals[written[-1]]
+
+    def missing_gameweeks(self, from_gameweek: int, to_gameweek: int) -> List[int]:
+        return [
+            gw for gw in range(from_gameweek, to_gameweek + 1) if gw not in self.rewards
+        ]
+
+    def list_cumulative_revenues(
+        self, from_gameweek: int, to_gameweek: int
+    ) -> Dict[int, List[float]]:
+        """
+        Revenue of each manager accumulated from `from_gameweek`, one value per
+        gameweek up to `to_gameweek`.
+        """
+        base = self.get_totals(from_gameweek - 1)
+        player_ids = {
+            player_id
+            for gw in range(from_gameweek, to_gameweek + 1)
+            for player_id in self.rewards.get(gw, {})
+        }
+        revenues: Dict[int, List[float]] = {player_id: [] for player_id in player_ids}
+        for gw in range(from_gameweek, to_gameweek + 1):
+            totals = self.get_totals(gw)
+            for player_id in player_ids:
+                revenues[player_id].append(
+                    round(totals.get(player_id, 0) - base.get(player_id, 0), _DECIMALS)
+                )
+        return revenues
+
+    def find_drift(
+        self, gameweeks_results: Dict[int, Optional[List[PlayerGameweekData]]]
+    ) -> List[int]:
+        """
+        Gameweeks whose ledger entries do not match the stored gameweek
+        results or whose running totals do not add up.
+        """
+        expected = RevenueLedger()
+        for gameweek, results in gameweeks_results.items():
+            if results is not None:
+                expected.put_gameweek(gameweek, results)
+
+        drift: List[int] = []
+        for gameweek in sorted(set(self.rewards) | set(expected.rewards)):
+            if self.rewards.get(gameweek) != expected.rewards.get(gameweek) or (
+                self.totals.get(gameweek) != expected.totals.get(gameweek)
+            ):
+                drift.append(gameweek)
+        return drift
+
+    def to_json(self):
+        return {
+            _gameweek_key(gw): {
+                "rewards": {str(k): v for k, v in self.rewards[gw].items()},
+                "totals": {str(k): v for k, v in self.totals[gw].items()},
+            }
+            for gw in self.gameweeks
+        }
+
+    @staticmethod
+    def from_json(data: Optional[dict]) -> "RevenueLedger":
+        ledger = RevenueLedger()
+        for key, entry in (data or {}).items():
+            gameweek = int(key[len("gw") :])
+            ledger.rewards[gameweek] = {
+                int(k): v for k, v in (entry.get("rewards") or {}).items()
+            }
+            ledger.totals[gameweek] = {
+                int(k): v for k, v in (entry.get("totals") or {}).items()
+            }
+        return ledger
@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+from .fpl_model import FPLEntrySeasonHistory
+
+
+@dataclass
+class SeasonHistory:
+    """
+    Managers x gameweeks matrix of gameweek points and transfer costs built
+    from each manager's entry history.
+    """
+
+    player_ids: List[int]
+    gameweeks: List[int]
+    # rows follow player_ids, columns follow gameweeks
+    points: List[List[int]]
+    transfers_cost: List[List[int]]
+
+    _rows: Dict[int, int] = field(default_factory=dict, repr=False)
+    _columns: Dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._rows = {player_id: i for i, player_id in enumerate(self.player_ids)}
+        self._columns = {gameweek: i for i, gameweek in enumerate(self.gameweeks)}
+
+    @staticmethod
+    def create(
+        histories: Dict[int, FPLEntrySeasonHistory], num_gameweeks: int = 38
+    ) -> "SeasonHistory":
+        gameweeks = list(range(1, num_gameweeks + 1))
+        player_ids = list(histories.keys())
+        points = [[0] * num_gameweeks for _ in player_ids]
+        transfers_cost = [[0] * num_gameweeks for _ in player_ids]
+        for row, player_id in enumerate(player_ids):
+            for event in histories[player_id].current:
+                if not 1 <= event.event <= num_gameweeks:
+                    continue
+                points[row][event.event - 1] = event.points
+                transfers_cost[row][event.event - 1] = event.event_transfers_cost
+        return SeasonHistory(
+            player_ids=player_ids,
+            gameweeks=gameweeks,
+            points=points,
+            transfers_cost=transfers_cost,
+        )
+
+    def has_player(self, player_id: int) -> bool:
+        return player_id in self._rows
+
+    def get_points(self, player_id: int, gameweek: int) -> int:
+        return self.points[self._rows[player_id]][self._columns[gameweek]]
+
+    def get_transfers_cost(self, player_id: int, gameweek: int) -> int:
+        return self.transfers_cost[self._rows[player_id]][self._columns[gameweek]]
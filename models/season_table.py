@@ -0,0 +1,156 @@
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from .model import PlayerGameweekData, PlayerData
+from .season_history import SeasonHistory
+from .ranking import composite_keys, tie_keys
+
+
+class SeasonTable:
+    """
+    Managers x gameweeks arrays of points, transfer costs, captain points and
+    rewards. Ranking and reward splitting run over every gameweek at once.
+
+    Managers are ranked per gameweek by net points, then captain points, then
+    vice captain points, then entry id. Managers with positive net points
+    that tie on the first three share the rewards of the ranks they occupy.
+    """
+
+    def __init__(self, player_ids: Sequence[int], gameweeks: Sequence[int]):
+        self.player_ids = np.asarray(player_ids, dtype=np.int64)
+        self.gameweeks = np.asarray(gameweeks, dtype=np.int64)
+        shape = (len(self.player_ids), len(self.gameweeks))
+        self.points = np.zeros(shape, dtype=np.int64)
+        self.transfers_cost = np.zeros(shape, dtype=np.int64)
+        self.captain_points = np.zeros(shape, dtype=np.int64)
+        self.vice_captain_points = np.zeros(shape, dtype=np.int64)
+        self.rewards = np.zeros(shape, dtype=np.float64)
+        # 0-based position of each manager in the gameweek ranking
+        self.ranks = np.zeros(shape, dtype=np.int64)
+        # rank of the first manager of the tie group each manager belongs to
+        self.tie_groups = np.zeros(shape, dtype=np.int64)
+        self.reward_division = np.ones(shape, dtype=np.int64)
+        self.__order: Optional[np.ndarray] = None
+        self.__columns = {int(gw): i for i, gw in enumerate(self.gameweeks)}
+
+    @staticmethod
+    def from_season_history(
+        season_history: SeasonHistory, gameweeks: Sequence[int]
+    ) -> "SeasonTable":
+        table = SeasonTable(season_history.player_ids, gameweeks)
+        points = np.asarray(season_history.points, dtype=np.int64)
+        transfers_cost = np.asarray(season_history.transfers_cost, dtype=np.int64)
+        history_columns = [season_history.gameweeks.index(gw) for gw in gameweeks]
+        table.points[:] = points[:, history_columns]
+        table.transfers_cost[:] = transfers_cost[:, history_columns]
+        return table
+
+    @property
+    def net_points(self) -> np.ndarray:
+        return self.points - self.transfers_cost
+
+    def column(self, gameweek: int) -> int:
+        return self.__columns[gameweek]
+
+    def rank(self):
+        net_points = self.net_points
+        num_players, num_gameweeks = net_points.shape
+        if num_players == 0:
+            self.__order = np.zeros(net_points.shape, dtype=np.int64)
+            return
+        player_ids = np.broadcast_to(self.player_ids[:, None], net_points.shape)
+        keys = composite_keys(
+            net_points, self.captain_points, self.vice_captain_points, player_ids
+        )
+        # keys are unique per gameweek, one sort ranks each column
+        order = np.argsort(keys, axis=0)
+        sorted_keys = np.take_along_axis(keys, order, axis=0)
+        sorted_net = np.take_along_axis(net_points, order, axis=0)
+
+        ties_previous = np.zeros(order.shape, dtype=bool)
+        ties_previous[1:] = (
+            tie_keys(sorted_keys[1:]) == tie_keys(sorted_keys[:-1])
+        ) & (sorted_net[1:] > 0)
+        positions = np.broadcast_to(np.arange(num_players)[:, None], order.shape).copy()
+        group_starts = np.maximum.accumulate(
+            np.where(ties_previous, 0, positions), axis=0
+        )
+        # group keys are unique across gameweeks
+        group_keys = group_starts + np.arange(num_gameweeks)[None, :] * num_players
+        group_sizes = np.bincount(group_keys.ravel(), minlength=order.size)
+
+        np.put_along_axis(self.ranks, order, positions, axis=0)
+        np.put_along_axis(self.tie_groups, order, group_starts, axis=0)
+        np.put_along_axis(self.reward_division, order, group_sizes[group_keys], axis=0)
+        self.__order = order
+
+    def allocate_rewards(self, rewards: Sequence[float]):
+        """
+        Give every manager the reward of their rank, averaged over tie groups.
+        """
+        if self.__order is None:
+            self.rank()
+        num_players, num_gameweeks = self.points.shape
+        if len(rewards) != num_players:
+            raise Exception("total number of rewards not equal to number of players")
+        if num_players == 0:
+            return
+        order = self.__order
+        sorted_rewards = np.broadcast_to(
+            np.asarray(rewards, dtype=np.float64)[:, None], order.shape
+        )
+        group_starts = np.take_along_axis(self.tie_groups, order, axis=0)
+        group_keys = group_starts + np.arange(num_gameweeks)[None, :] * num_players
+        group_sums = np.bincount(
+            group_keys.ravel(), weights=sorted_rewards.ravel(), minlength=order.size
+        )
+        group_sizes = np.bincount(group_keys.ravel(), minlength=order.size)
+        shared = group_sizes[group_keys] > 1
+        split_rewards = np.round(
+            group_sums[group_keys] / group_sizes[group_keys], decimals=2
+        )
+        np.put_along_axis(
+            self.rewards,
+            order,
+            np.where(shared, split_rewards, sorted_rewards),
+            axis=0,
+        )
+
+    def to_player_gameweek_data(
+        self, gameweek: int, players: Dict[int, PlayerData]
+    ) -> List[PlayerGameweekData]:
+        """
+        Build the ranked gameweek table of `gameweek`.
+        """
+        if self.__order is None:
+            self.rank()
+        col = self.column(gameweek)
+        rows = self.__order[:, col]
+        group_members: Dict[int, List[int]] = {}
+        for row in rows:
+            group_members.setdefault(int(self.tie_groups[row, col]), []).append(
+                int(self.player_ids[row])
+            )
+
+        results: List[PlayerGameweekData] = []
+        for row in rows:
+            player_id = int(self.player_ids[row])
+            player = players[player_id]
+            members = group_members[int(self.tie_groups[row, col])]
+            results.append(
+                PlayerGameweekData(
+                    name=player.name,
+                    team_name=player.team_name,
+                    bank_account=player.bank_account,
+                    player_id=player_id,
+                    points=int(self.points[row, col] - self.transfers_cost[row, col]),
+                    subsitution_cost=-1 * int(self.transfers_cost[row, col]),
+                    captain_points=int(self.captain_points[row, col]),
+                    vice_captain_points=int(self.vice_captain_points[row, col]),
+                    reward=float(self.rewards[row, col]),
+                    reward_division=int(self.reward_division[row, col]),
+                    shared_reward_player_ids=[
+                        member for member in members if member != player_id
+                    ],
+                )
+            )
+        return results
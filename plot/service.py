@@ -1,4 +1,5 @@
 import os
+import itertools
 from typing import List, Dict
 import matplotlib.pyplot as plt
 import util
@@ -39,10 +40,6 @@ class Service:
         gameweeks_data: List[List[models.PlayerGameweekData]],
     ) -> List[str]:
         players_dict: Dict[str, List[models.PlayerGameweekData]] = {}
-        gameweeks: List[str] = [
-            f"GW{gw}" for gw in range(from_gameweek, to_gameweek + 1, 1)
-        ]
-
         for gameweek_players in gameweeks_data:
             for player in gameweek_players:
                 if player.player_id not in players_dict:
@@ -50,26 +47,42 @@ class Service:
                 else:
                     players_dict[player.player_id].append(player)
 
-        player_ids = list(players_dict)
-        player_points: List[List[int]] = []
+        player_names: List[str] = []
+        cumulative_revenues: List[List[float]] = []
         for _, gameweek_results in players_dict.items():
-            player_rewards = [gw.reward for gw in gameweek_results]
-            cummulative_rewards = []
-            for i, _ in enumerate(player_rewards):
-                player_reward = 0
-                for _reward in player_rewards[: i + 1]:
-                    player_reward += _reward
-                cummulative_rewards.append(player_reward)
-            player_points.append(cummulative_rewards)
+            player_names.append(gameweek_results[0].name)
+            cumulative_revenues.append(
+                list(itertools.accumulate(gw.reward for gw in gameweek_results))
+            )
+        return self.generate_cumulative_revenue_plot(
+            from_gameweek=from_gameweek,
+            to_gameweek=to_gameweek,
+            player_names=player_names,
+            cumulative_revenues=cumulative_revenues,
+        )
+
+    @util.time_track(description="Generate cumulative revenue plot")
+    def generate_cumulative_revenue_plot(
+        self,
+        from_gameweek: int,
+        to_gameweek: int,
+        player_names: List[str],
+        cumulative_revenues: List[List[float]],
+    ) -> List[str]:
+        """
+        Plot revenues already accumulated per gameweek, one line per manager.
+        """
+        gameweeks: List[str] = [
+            f"GW{gw}" for gw in range(from_gameweek, to_gameweek + 1, 1)
+        ]
         plot_destinations: List[str] = []
         # Plotting the trend graph
         plt.figure(figsize=(12, 6))
-        for i, player_id in enumerate(player_ids):
-            player_id = players_dict[player_id][0].name
+        for i, player_name in enumerate(player_names):
             plt.plot(
                 gameweeks,
-                player_points[i],
-                label=player_id,
+                cumulative_revenues[i],
+                label=player_name,
                 marker="o",
                 color=COLORS[i % len(COLORS)],
             )
@@ -86,11 +99,10 @@ class Service:
             plot_destinations.append(plot_destination)
 
         # generate all
-        for i, player_id in enumerate(player_ids):
-            player_name = players_dict[player_id][0].name
+        for i, player_name in enumerate(player_names):
             plt.plot(
                 gameweeks,
-                player_points[i],
+                cumulative_revenues[i],
                 label=player_name,
                 marker="o",
                 color=COLORS[i % len(COLORS)],
@@ -102,7 +114,7 @@ class Service:
             plt.legend()
             plt.grid(True)
 
-            if i == len(player_ids) - 1:
+            if i == len(player_names) - 1:
                 plot_destination = "/tmp/figure_all.png"
                 plt.savefig(plot_destination, bbox_inches="tight")
                 plot_destinations.append(plot_destination)
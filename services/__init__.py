@@ -2,5 +2,16 @@ from .fpl_service import Service as FPLService
 from .message import MessageService
 from .firebase_repo import FirebaseRepo
 from .subscription import Service as SubscriptionService
+from .bootstrap_cache import BootstrapCache
+from .result_cache import LRUCache, TieredCache, TierStats
 
-__all__ = ["FPLService", "MessageService", "FirebaseRepo", "SubscriptionService"]
+__all__ = [
+    "FPLService",
+    "MessageService",
+    "FirebaseRepo",
+    "SubscriptionService",
+    "BootstrapCache",
+    "LRUCache",
+    "TieredCache",
+    "TierStats",
+]
@@ -0,0 +1,69 @@
+import time
+import asyncio
+from typing import Optional
+from loguru import logger
+from adapter import FPLAdapter, RequestPriority, request_priority
+from models import Bootstrap
+
+
+class BootstrapCache:
+    TTL = 300
+    MAX_STALENESS = 3600
+
+    def __init__(
+        self,
+        fpl_adapter: FPLAdapter,
+        ttl: float = TTL,
+        max_staleness: float = MAX_STALENESS,
+    ):
+        """
+        Keeps one decoded bootstrap-static with its lookup indexes.
+
+        Parameters:
+        - fpl_adapter (FPLAdapter): Adapter the bootstrap is fetched from.
+        - ttl (float): Seconds the bootstrap is served without refreshing.
+        - max_staleness (float): Seconds an expired bootstrap is still served
+          while it is refreshed in the background. Older ones are refreshed
+          before returning.
+        """
+        self.__fpl_adapter = fpl_adapter
+        self.__ttl = ttl
+        self.__max_staleness = max_staleness
+        self.__bootstrap: Optional[Bootstrap] = None
+        self.__fetched_at = 0.0
+        self.__refresh_task: Optional[asyncio.Task] = None
+
+    async def get(self) -> Bootstrap:
+        age = time.monotonic() - self.__fetched_at
+        if self.__bootstrap is not None and age < self.__ttl:
+            return self.__bootstrap
+        if self.__bootstrap is not None and age < self.__max_staleness:
+            self.__schedule_refresh()
+            return self.__bootstrap
+        return await self.refresh()
+
+    async def refresh(self) -> Bootstrap:
+        # concurrent refreshes share one request through the adapter
+        bootstrap = await self.__fpl_adapter.get_bootstrap()
+        self.__bootstrap = bootstrap
+        self.__fetched_at = time.monotonic()
+        return bootstrap
+
+    def invalidate(self):
+        self.__bootstrap = None
+        self.__fetched_at = 0.0
+
+    def __schedule_refresh(self):
+        task = self.__refresh_task
+        loop = asyncio.get_running_loop()
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self.__refresh_task = loop.create_task(self.__refresh_in_background())
+
+    async def __refresh_in_background(self):
+        try:
+            with request_priority(RequestPriority.BACKGROUND):
+                await self.refresh()
+        except Exception as e:
+            # the stale bootstrap keeps being served until the next attempt
+            logger.warning(f"unable to refresh bootstrap with error: {e}")
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 import models
 from database import FirebaseRealtimeDatabase
 
@@ -10,6 +10,7 @@ class _Schema:
     LEAGUE_IGNORED_PLAYERS = "league_ignored_players"
     LEAGUE_GAMEWEEK_REWARDS = "league_gameweek_rewards"
     LEAGUE_GAMEWEEK_RESULTS = "league_gameweek_results"
+    LEAGUE_REVENUE_LEDGERS = "league_revenue_ledgers"
 
 
 class FirebaseRepo:
@@ -23,11 +24,33 @@ class FirebaseRepo:
         league_id: int,
         player_gameweek_results: List[models.PlayerGameweekData],
         gameweek: int,
+        update_ledger: bool = True,
     ):
-        return self.__db.put_data(
+        is_ok = self.__db.put_data(
             f"{_Schema.LEAGUE_GAMEWEEK_RESULTS}/{league_id}/{gameweek}",
             [p.to_json() for p in player_gameweek_results],
         )
+        if not is_ok or not update_ledger:
+            return is_ok
+        return self.update_league_revenue_ledger(
+            league_id, {gameweek: player_gameweek_results}
+        )
+
+    def update_league_revenue_ledger(
+        self,
+        league_id: int,
+        gameweeks_results: Dict[int, List[models.PlayerGameweekData]],
+    ):
+        def update(data):
+            ledger = models.RevenueLedger.from_json(data)
+            for gameweek in sorted(gameweeks_results):
+                ledger.put_gameweek(gameweek, gameweeks_results[gameweek])
+            return ledger.to_json()
+
+        ledger = self.__db.update_data(
+            f"{_Schema.LEAGUE_REVENUE_LEDGERS}/{league_id}", update
+        )
+        return ledger is not None
 
     def get_league_gameweek_results(
         self, league_id: int, gameweek: int
@@ -39,6 +62,22 @@ class FirebaseRepo:
             return None
         return [models.PlayerGameweekData(**d) for d in data]
 
+    def get_league_revenue_ledger(
+        self, league_id: int
+    ) -> Optional[models.RevenueLedger]:
+        data = self.__db.get_data(f"{_Schema.LEAGUE_REVENUE_LEDGERS}/{league_id}")
+        if data is None:
+            return None
+        return models.RevenueLedger.from_json(data)
+
+    def put_league_revenue_ledger(self, league_id: int, ledger: models.RevenueLedger):
+        return self.__db.put_data(
+            f"{_Schema.LEAGUE_REVENUE_LEDGERS}/{league_id}", ledger.to_json()
+        )
+
+    def delete_league_revenue_ledger(self, league_id: int):
+        return self.__db.delete_data(f"{_Schema.LEAGUE_REVENUE_LEDGERS}/{league_id}")
+
     def list_league_gameweek_rewards(self, league_id: int) -> Optional[List[float]]:
         data = self.__db.get_data(f"{_Schema.LEAGUE_GAMEWEEK_REWARDS}/{league_id}")
         return data
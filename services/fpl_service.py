@@ -1,9 +1,10 @@
+import os
 import json
 import asyncio
-from dataclasses import asdict
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
 from loguru import logger
-from adapter import FPLAdapter, DynamoDB
+from adapter import FPLAdapter, DynamoDB, AsyncDynamoDB
 from config import Config
 from models import (
     PlayerGameweekData,
@@ -11,22 +12,95 @@ from models import (
     FPLEventStatus,
     FPLMatchFixture,
     FPLEventStatusResponse,
-    FPLPlayerHistory,
     FPLFantasyTeam,
-    BootstrapElement,
+    PickView,
     PlayerGameweekPicksData,
     FPLLiveEventElement,
-    BootstrapTeam,
+    PlayerData,
+    SeasonHistory,
+    SeasonTable,
+    RevenueLedger,
+    encode_gameweek_results,
+    decode_gameweek_results,
 )
 import util
 from .firebase_repo import FirebaseRepo
+from .bootstrap_cache import BootstrapCache
+from .result_cache import LRUCache, TieredCache, TierStats
 
 
 CACHE_TABLE_NAME = "FPLCacheTable"
+# points the cache table at a local DynamoDB stand-in
+DYNAMODB_ENDPOINT_URL_ENV = "DYNAMODB_ENDPOINT_URL"
+# Firebase calls of a gameweek batch run in worker threads
+MAX_CONCURRENT_BLOCKING_CALLS = 8
+CURRENT_GAMEWEEK_KEY = "gameweek"
+# the current gameweek is moved by the gameweek reminder lambda
+CURRENT_GAMEWEEK_CACHE_TTL = 60
+# generations bumped by other lambda instances are seen after this long
+CACHE_GENERATION_CACHE_TTL = 10
+# gameweek results of replaced generations are deleted by the table's TTL,
+# results still read get their expiry refreshed
+RESULT_CACHE_EXPIRY = 30 * 24 * 3600
 
+# (gameweek, completed gameweeks, total gameweeks)
+GameweekProgressCallback = Callable[[int, int, int], None]
 
-def _construct_cache_hash(league_id, gameweek):
-    return f"{league_id}-gameweek-{gameweek}"
+
+def _construct_cache_hash(league_id, gameweek, generation=0):
+    if generation == 0:
+        # keys written before cache generations
+        return f"{league_id}-gameweek-{gameweek}"
+    return f"{league_id}-g{generation}-gameweek-{gameweek}"
+
+
+def _construct_generation_key(league_id):
+    return f"{league_id}-generation"
+
+
+def _decode_current_gameweek(item: dict) -> int:
+    gameweek_data = json.loads(item.get("DATA").get("S"))
+    return gameweek_data.get("gameweek")
+
+
+def _decode_cache_generation(item: dict) -> int:
+    return int(item.get("DATA").get("N"))
+
+
+def _decode_gameweek_results_item(item: dict) -> Optional[List[PlayerGameweekData]]:
+    data = item.get("DATA") or {}
+    # items written before the binary codec hold a JSON string
+    payload = data["B"] if "B" in data else data.get("S")
+    try:
+        return decode_gameweek_results(payload)
+    except (ValueError, KeyError, TypeError) as e:
+        # rewritten once the gameweek is recomputed
+        logger.warning(f"unable to decode {item['KEY']['S']} cache: {e}")
+        return None
+
+
+@dataclass
+class _LeagueContext:
+    league_id: int
+    # active league players by player id
+    players: Dict[int, PlayerData]
+    rewards: Optional[List[float]]
+    current_gameweek: int
+    # part of the cache keys of the league's gameweek results
+    cache_generation: int
+
+
+class _GameweekProgress:
+    def __init__(self, total: int, callback: Optional[GameweekProgressCallback]):
+        self.total = total
+        self.completed = 0
+        self.__callback = callback
+
+    def report(self, gameweek: int):
+        self.completed += 1
+        logger.info(f"gameweek {gameweek} ready ({self.completed}/{self.total})")
+        if self.__callback is not None:
+            self.__callback(gameweek, self.completed, self.total)
 
 
 class Service:
@@ -38,184 +112,410 @@ class Service:
     ):
         self.config = config
         self.fpl_adapter = fpl_adapter
-        self.dynamodb = DynamoDB(table_name=CACHE_TABLE_NAME)
+        endpoint_url = os.environ.get(DYNAMODB_ENDPOINT_URL_ENV)
+        self.dynamodb = DynamoDB(table_name=CACHE_TABLE_NAME, endpoint_url=endpoint_url)
+        # cache I/O of coroutines, so it does not block the event loop
+        self.async_dynamodb = AsyncDynamoDB(
+            table_name=CACHE_TABLE_NAME, endpoint_url=endpoint_url
+        )
+        self.result_cache = TieredCache(
+            self.dynamodb, LRUCache(), async_dynamodb=self.async_dynamodb
+        )
         self.firebase_repo = firebase_repo
+        self.bootstrap_cache = BootstrapCache(fpl_adapter)
 
     def update_gameweek(self, gameweek: int):
-        response = self.dynamodb.put_json_item(
-            key="gameweek", data={"gameweek": gameweek}
+        response = self.result_cache.put(
+            key=CURRENT_GAMEWEEK_KEY,
+            data={"gameweek": gameweek},
+            value=gameweek,
+            ttl=CURRENT_GAMEWEEK_CACHE_TTL,
         )
         return response
 
-    async def __construct_player_gameweek_pick_data(
-        self, player: PlayerGameweekData, gameweek: int
-    ):
+    def get_cache_stats(self) -> Dict[str, TierStats]:
+        return self.result_cache.stats()
+
+    async def close(self):
+        await self.async_dynamodb.close()
+
+    async def __get_gameweek_element_points(self, gameweek: int) -> Dict[int, int]:
+        live_event = await self.fpl_adapter.get_gameweek_live_event(gameweek=gameweek)
+        return {
+            element.id: element.stats.total_points for element in live_event.elements
+        }
+
+    async def __get_player_captain_points(
+        self,
+        player_id: int,
+        gameweek: int,
+        element_points: Dict[int, int],
+    ) -> Tuple[int, int]:
         player_team = await self.fpl_adapter.get_player_team_by_id(
-            player.player_id, gameweek=gameweek
+            player_id, gameweek=gameweek
         )
-        player.points -= player_team.entry_history.event_transfers_cost
-        player.subsitution_cost = -1 * player_team.entry_history.event_transfers_cost
+        captain_points = 0
+        vice_captain_points = 0
         for pick in player_team.picks:
-            player_gameweek_history: Optional[FPLPlayerHistory] = None
-            if pick.is_captain or pick.is_vice_captain:
-                player_gameweek_history = (
-                    await self.fpl_adapter.get_player_gameweek_info(
-                        gameweek=gameweek, player_id=pick.element
-                    )
-                )
-            if player_gameweek_history is not None:
-                if pick.is_captain:
-                    # adding some noise to captain pick
-                    player.points += (
-                        player_gameweek_history.total_points / 10000 * pick.multiplier
-                    )
-                    player.captain_points = (
-                        player_gameweek_history.total_points * pick.multiplier
-                    )
-                if pick.is_vice_captain:
-                    # adding some noise to vice captain pick
-                    player.points += (
-                        player_gameweek_history.total_points / 1000000 * pick.multiplier
-                    )
-                    player.vice_captain_points = (
-                        player_gameweek_history.total_points * pick.multiplier
-                    )
-        return player
-
-    @util.time_track(description="Construct Players Gameweek Data")
-    async def __construct_players_gameweek_data(self, gameweek: int, league_id: int):
-        classic_standings = await self.fpl_adapter.get_classic_league_standings(
-            league_id=league_id
-        )
-        players_points_map: Dict[int, PlayerGameweekData] = {}
+            total_points = element_points.get(pick.element)
+            if total_points is None:
+                continue
+            if pick.is_captain:
+                captain_points = total_points * pick.multiplier
+            if pick.is_vice_captain:
+                vice_captain_points = total_points * pick.multiplier
+        return captain_points, vice_captain_points
+
+    def __list_active_league_players(self, league_id: int) -> List[PlayerData]:
         ignored_players = self.firebase_repo.list_league_ignored_players(league_id)
-        ignored_players.append(None)
         league_players = self.firebase_repo.list_league_players(league_id)
         if league_players is None:
             raise Exception(f"league players for {league_id} not found")
+        return [p for p in league_players if p.player_id not in ignored_players]
+
+    async def get_season_history(self, league_id: int) -> SeasonHistory:
+        player_ids = [p.player_id for p in self.__list_active_league_players(league_id)]
+        return await self.__get_season_history(player_ids)
+
+    @util.time_track(description="Get Season History")
+    async def __get_season_history(self, player_ids: List[int]) -> SeasonHistory:
+        histories = await asyncio.gather(
+            *[
+                self.fpl_adapter.get_entry_history(player_id=player_id)
+                for player_id in player_ids
+            ]
+        )
+        return SeasonHistory.create(dict(zip(player_ids, histories)))
 
-        for result in classic_standings.standings.results:
-            # player 1
-            p1_name = result.entry_name
-            p1_point = util.add_noise(result.event_total)
-            p1_id = result.entry
-
-            if p1_id not in ignored_players:
-                players_points_map[p1_id] = PlayerGameweekData(
-                    team_name=p1_name, player_id=p1_id, points=p1_point
-                )
+    @util.time_track(description="Construct Season Table")
+    async def __construct_season_table(
+        self, gameweeks: List[int], season_history: SeasonHistory
+    ) -> SeasonTable:
+        table = SeasonTable.from_season_history(season_history, gameweeks)
 
+        # one live event request per gameweek resolves every captain's points
+        gameweeks_element_points: List[Dict[int, int]] = await asyncio.gather(
+            *[self.__get_gameweek_element_points(gw) for gw in gameweeks]
+        )
         futures = []
-        for _, player in players_points_map.items():
-            player_result_future = self.__construct_player_gameweek_pick_data(
-                player, gameweek=gameweek
-            )
-            futures.append(player_result_future)
-
-        players: List[PlayerGameweekData] = await asyncio.gather(*futures)
+        for gameweek, element_points in zip(gameweeks, gameweeks_element_points):
+            for player_id in season_history.player_ids:
+                futures.append(
+                    self.__get_player_captain_points(
+                        player_id, gameweek=gameweek, element_points=element_points
+                    )
+                )
 
-        # Sorting the list of PlayerResultData instances by the 'point' attribute
-        players = sorted(players, key=lambda player: player.points, reverse=True)
-        players = self.__expand_check_dupl_point(players=players)
+        captain_points: List[Tuple[int, int]] = await asyncio.gather(*futures)
+        logger.info(
+            f"FPL scheduler metrics: {self.fpl_adapter.get_scheduler_metrics()}"
+        )
 
-        for p in players:
-            for fp in league_players:
-                if fp.player_id == p.player_id:
-                    p.name = fp.name
-                    p.bank_account = fp.bank_account
+        num_players = len(season_history.player_ids)
+        for col, _ in enumerate(gameweeks):
+            column_points = captain_points[col * num_players : (col + 1) * num_players]
+            for row, (captain, vice_captain) in enumerate(column_points):
+                table.captain_points[row, col] = captain
+                table.vice_captain_points[row, col] = vice_captain
 
-        return players
+        table.rank()
+        return table
 
     @util.time_track(description="Update FPL Table")
     async def get_or_update_fpl_gameweek_table(
         self, gameweek: int, league_id: int, ignore_cache=False
     ):
-        if not self.__is_current_gameweek(gameweek=gameweek) and not ignore_cache:
-            cache = self.__lookup_gameweek_result_cache(gameweek, league_id)
-            if cache is not None:
-                return cache
-
-        players = await self.__construct_players_gameweek_data(gameweek, league_id)
-        league_gameweek_rewards = self.firebase_repo.list_league_gameweek_rewards(
-            league_id
+        gameweeks_players = await self.list_or_update_fpl_gameweek_tables(
+            from_gameweek=gameweek,
+            to_gameweek=gameweek,
+            league_id=league_id,
+            ignore_cache=ignore_cache,
         )
-        if league_gameweek_rewards is None:
-            return players
-        if len(players) != len(league_gameweek_rewards):
-            raise Exception("total number of rewards not equal to number of players")
-
-        new_reward_map: dict[int, float] = {}
+        return gameweeks_players[0]
 
-        players = sorted(players, key=lambda player: player.points, reverse=True)
-        for i, p in enumerate(players):
-            p.reward = league_gameweek_rewards[i]
-
-        players_with_shared_reward = [
-            player for player in players if player.reward_division > 1
+    @util.time_track(description="Update FPL Tables")
+    async def list_or_update_fpl_gameweek_tables(
+        self,
+        from_gameweek: int,
+        to_gameweek: int,
+        league_id: int,
+        ignore_cache=False,
+        on_progress: Optional[GameweekProgressCallback] = None,
+    ) -> List[List[PlayerGameweekData]]:
+        """
+        Get the gameweek tables of a gameweek range, in gameweek order.
+
+        Cached gameweeks are looked up in one batch and the others are ranked
+        together from one season history, then written concurrently.
+        `on_progress(gameweek, completed, total)` is called whenever a
+        gameweek table is ready.
+        """
+        gameweeks = list(range(from_gameweek, to_gameweek + 1))
+        progress = _GameweekProgress(len(gameweeks), on_progress)
+        blocking_calls = asyncio.Semaphore(MAX_CONCURRENT_BLOCKING_CALLS)
+        league = await self.__get_league_context(league_id)
+
+        cached_gameweeks = [
+            gameweek
+            for gameweek in gameweeks
+            if gameweek != league.current_gameweek and not ignore_cache
         ]
+        gameweeks_players: Dict[int, List[PlayerGameweekData]] = {}
+        if len(cached_gameweeks) > 0:
+            gameweeks_players = await self.__lookup_gameweek_result_caches(
+                cached_gameweeks, league
+            )
+        for gameweek in gameweeks:
+            if gameweek in gameweeks_players:
+                progress.report(gameweek)
 
-        for p in players_with_shared_reward:
-            sum_reward = 0
-            for inner_p in players_with_shared_reward:
-                sum_reward += inner_p.reward
-            new_reward = round(sum_reward / p.reward_division, 2)
-            new_reward_map[p.player_id] = new_reward
-
-        for p in players_with_shared_reward:
-            p.reward = new_reward_map[p.player_id]
-
-        is_ok = self.firebase_repo.put_league_gameweek_results(
+        # every missing gameweek is ranked together from one season history
+        missing_gameweeks = [
+            gameweek for gameweek in gameweeks if gameweek not in gameweeks_players
+        ]
+        if len(missing_gameweeks) > 0:
+            updated_players = await self.__update_fpl_gameweek_tables(
+                missing_gameweeks, league, blocking_calls, progress
+            )
+            for gameweek, players in zip(missing_gameweeks, updated_players):
+                gameweeks_players[gameweek] = players
+
+        stats = self.get_cache_stats()
+        logger.info(
+            "gameweek cache "
+            + " ".join(
+                f"{tier}={s.hits}/{s.hits + s.misses}" for tier, s in stats.items()
+            )
+        )
+        return [gameweeks_players[gameweek] for gameweek in gameweeks]
+
+    async def __get_league_context(self, league_id: int) -> _LeagueContext:
+        """
+        Fetch the league data shared by every gameweek of a batch at once.
+        """
+        (
+            league_players,
+            ignored_players,
+            rewards,
+            current_gameweek,
+            cache_generation,
+        ) = await asyncio.gather(
+            asyncio.to_thread(self.firebase_repo.list_league_players, league_id),
+            asyncio.to_thread(
+                self.firebase_repo.list_league_ignored_players, league_id
+            ),
+            asyncio.to_thread(
+                self.firebase_repo.list_league_gameweek_rewards, league_id
+            ),
+            self.aget_current_gameweek_from_dynamodb(),
+            self.aget_cache_generation(league_id),
+        )
+        if league_players is None:
+            raise Exception(f"league players for {league_id} not found")
+        return _LeagueContext(
             league_id=league_id,
-            player_gameweek_results=players,
-            gameweek=gameweek,
+            players={
+                p.player_id: p
+                for p in league_players
+                if p.player_id not in ignored_players
+            },
+            rewards=rewards,
+            current_gameweek=current_gameweek,
+            cache_generation=cache_generation,
         )
-        if not is_ok:
-            raise Exception("unable to update gameweek result")
 
-        player_cache_items = [player.to_json() for player in players]
-        self.__put_cache_item(
-            key=_construct_cache_hash(league_id, gameweek), item=player_cache_items
+    async def __update_fpl_gameweek_tables(
+        self,
+        gameweeks: List[int],
+        league: _LeagueContext,
+        blocking_calls: asyncio.Semaphore,
+        progress: _GameweekProgress,
+    ) -> List[List[PlayerGameweekData]]:
+        season_history = await self.__get_season_history(list(league.players))
+        table = await self.__construct_season_table(gameweeks, season_history)
+        if league.rewards is None:
+            gameweeks_players = []
+            for gameweek in gameweeks:
+                gameweeks_players.append(
+                    table.to_player_gameweek_data(gameweek, league.players)
+                )
+                progress.report(gameweek)
+            return gameweeks_players
+        table.allocate_rewards(league.rewards)
+
+        async def write_gameweek(gameweek: int) -> List[PlayerGameweekData]:
+            players = table.to_player_gameweek_data(gameweek, league.players)
+            async with blocking_calls:
+                is_ok = await asyncio.to_thread(
+                    self.firebase_repo.put_league_gameweek_results,
+                    league_id=league.league_id,
+                    player_gameweek_results=players,
+                    gameweek=gameweek,
+                    update_ledger=False,
+                )
+            if not is_ok:
+                raise Exception("unable to update gameweek result")
+            progress.report(gameweek)
+            return players
+
+        gameweeks_players: List[List[PlayerGameweekData]] = await asyncio.gather(
+            *[write_gameweek(gameweek) for gameweek in gameweeks]
+        )
+        await self.__put_gameweek_result_caches(
+            dict(zip(gameweeks, gameweeks_players)), league
+        )
+        # one ledger transaction for the whole batch
+        is_ok = await asyncio.to_thread(
+            self.firebase_repo.update_league_revenue_ledger,
+            league.league_id,
+            dict(zip(gameweeks, gameweeks_players)),
         )
+        if not is_ok:
+            raise Exception("unable to update revenue ledger")
 
-        return players
+        return gameweeks_players
 
     async def list_players_revenues(self, league_id: int):
         current_gameweek_status = await self.get_current_gameweek()
         current_gameweek = current_gameweek_status.event
-        players = await self.__construct_players_gameweek_data(
-            gameweek=current_gameweek, league_id=league_id
-        )
-        player_revs_map: Dict[int, PlayerRevenue] = {}
+        players = self.__list_active_league_players(league_id)
+        ledger = await self.__get_revenue_ledger(league_id, 1, current_gameweek)
+        totals = {} if ledger is None else ledger.get_totals(current_gameweek)
 
-        for p in players:
-            player_revs_map[p.player_id] = PlayerRevenue(
+        player_revs = [
+            PlayerRevenue(
                 name=p.name,
-                revenue=0,
+                revenue=totals.get(p.player_id, 0),
                 team_name=p.team_name,
             )
-
-        for gw in range(1, current_gameweek + 1, 1):
-            gameweek_results = self.firebase_repo.get_league_gameweek_results(
-                league_id=league_id,
-                gameweek=gw,
-            )
-            if gameweek_results is None:
-                raise Exception(
-                    "error when getting revenue with error gameweek results not found"
-                )
-            for player_result in gameweek_results:
-                player_revs_map[player_result.player_id].revenue += player_result.reward
-
-        player_revs = [p_rev for _, p_rev in player_revs_map.items()]
+            for p in players
+        ]
         player_revs = sorted(player_revs, key=lambda p_rev: p_rev.revenue, reverse=True)
 
         return player_revs
 
+    async def list_players_cumulative_revenues(
+        self,
+        from_gameweek: int,
+        to_gameweek: int,
+        league_id: int,
+        on_progress: Optional[GameweekProgressCallback] = None,
+    ) -> Dict[int, List[float]]:
+        """
+        Revenue of each manager accumulated from `from_gameweek`, one value per
+        gameweek. Gameweeks not in the ledger yet are computed first, with
+        `on_progress` called as in list_or_update_fpl_gameweek_tables.
+
+        Returns:
+        - Dict[int, List[float]]: Revenues by player id, empty for leagues
+          without rewards.
+        """
+        ledger = await self.__get_revenue_ledger(
+            league_id, from_gameweek, to_gameweek, on_progress
+        )
+        if ledger is None:
+            return {}
+        return ledger.list_cumulative_revenues(from_gameweek, to_gameweek)
+
+    async def __get_revenue_ledger(
+        self,
+        league_id: int,
+        from_gameweek: int,
+        to_gameweek: int,
+        on_progress: Optional[GameweekProgressCallback] = None,
+    ) -> Optional[RevenueLedger]:
+        """
+        The revenue ledger of a league with every gameweek of the range.
+        Gameweeks missing from it, because the league was written before the
+        ledger existed or its caches were cleared, are computed, which adds
+        them to the ledger.
+
+        Returns:
+        - Optional[RevenueLedger]: None for leagues without rewards, which
+          have no revenues.
+        """
+        if self.firebase_repo.list_league_gameweek_rewards(league_id) is None:
+            return None
+        ledger = self.firebase_repo.get_league_revenue_ledger(league_id)
+        if ledger is None:
+            ledger = RevenueLedger()
+        missing_gameweeks = ledger.missing_gameweeks(from_gameweek, to_gameweek)
+        if len(missing_gameweeks) == 0:
+            return ledger
+        await self.list_or_update_fpl_gameweek_tables(
+            from_gameweek=min(missing_gameweeks),
+            to_gameweek=max(missing_gameweeks),
+            league_id=league_id,
+            ignore_cache=True,
+            on_progress=on_progress,
+        )
+        ledger = self.firebase_repo.get_league_revenue_ledger(league_id)
+        if (
+            ledger is None
+            or len(ledger.missing_gameweeks(from_gameweek, to_gameweek)) > 0
+        ):
+            raise Exception(
+                "error when getting revenue with error gameweek results not found"
+            )
+        return ledger
+
+    def __list_league_gameweeks_results(
+        self, league_id: int, to_gameweek: int
+    ) -> Dict[int, Optional[List[PlayerGameweekData]]]:
+        return {
+            gameweek: self.firebase_repo.get_league_gameweek_results(
+                league_id=league_id, gameweek=gameweek
+            )
+            for gameweek in range(1, to_gameweek + 1)
+        }
+
+    def verify_revenue_ledger(self, league_id: int, to_gameweek: int) -> List[int]:
+        """
+        Compare the revenue ledger with the stored gameweek results.
+
+        Returns:
+        - List[int]: Gameweeks that drifted, empty when the ledger is consistent.
+        """
+        ledger = self.firebase_repo.get_league_revenue_ledger(league_id)
+        if ledger is None:
+            ledger = RevenueLedger()
+        return ledger.find_drift(
+            self.__list_league_gameweeks_results(league_id, to_gameweek)
+        )
+
+    def rebuild_revenue_ledger(self, league_id: int, to_gameweek: int) -> RevenueLedger:
+        """
+        Recreate the revenue ledger from the stored gameweek results.
+        """
+        ledger = RevenueLedger()
+        gameweeks_results = self.__list_league_gameweeks_results(league_id, to_gameweek)
+        for gameweek, results in gameweeks_results.items():
+            if results is not None:
+                ledger.put_gameweek(gameweek, results)
+        is_ok = self.firebase_repo.put_league_revenue_ledger(league_id, ledger)
+        if not is_ok:
+            raise Exception("unable to update revenue ledger")
+        return ledger
+
     def get_current_gameweek_from_dynamodb(self) -> int:
-        item = self.dynamodb.get_item_by_hash_key("gameweek")
-        data = item.get("Item").get("DATA").get("S")
-        gameweek_data = json.loads(data)
-        return gameweek_data.get("gameweek")
+        gameweek = self.result_cache.get(
+            CURRENT_GAMEWEEK_KEY,
+            _decode_current_gameweek,
+            ttl=CURRENT_GAMEWEEK_CACHE_TTL,
+        )
+        if gameweek is None:
+            raise Exception("current gameweek not found")
+        return gameweek
+
+    async def aget_current_gameweek_from_dynamodb(self) -> int:
+        gameweek = await self.result_cache.aget(
+            CURRENT_GAMEWEEK_KEY,
+            _decode_current_gameweek,
+            ttl=CURRENT_GAMEWEEK_CACHE_TTL,
+        )
+        if gameweek is None:
+            raise Exception("current gameweek not found")
+        return gameweek
 
     async def get_current_gameweek(self) -> FPLEventStatus:
         result = await self.fpl_adapter.get_gameweek_event_status()
@@ -239,22 +539,13 @@ class Service:
         gameweek_fixtures = await self.fpl_adapter.list_gameweek_fixtures(
             gameweek=gameweek
         )
-        teams = await self.list_league_teams()
-        team_map: dict[int, BootstrapTeam] = {}
-        for team in teams:
-            team_map[team.id] = team
+        bootstrap = await self.bootstrap_cache.get()
         for fixture in gameweek_fixtures:
-            team_a = team_map[fixture.team_a]
-            team_h = team_map[fixture.team_h]
-            fixture.team_a_data = team_a
-            fixture.team_h_data = team_h
+            fixture.team_a_data = bootstrap.get_team(fixture.team_a)
+            fixture.team_h_data = bootstrap.get_team(fixture.team_h)
 
         return gameweek_fixtures
 
-    def __is_current_gameweek(self, gameweek: int) -> bool:
-        current_gameweek = self.get_current_gameweek_from_dynamodb()
-        return current_gameweek == gameweek
-
     async def get_gameweek_event_status(
         self, gameweek: int
     ) -> Optional[FPLEventStatusResponse]:
@@ -264,47 +555,37 @@ class Service:
                 return None
         return status
 
-    def __expand_check_dupl_point(self, players: List[PlayerGameweekData]):
-        players_points_map = [p.points for p in players]
-        for i, p in enumerate(players):
-            for j, point in enumerate(players_points_map):
-                if i == j:
-                    continue
-                if util.is_equal_float(point, p.points) and p.points > 1:
-                    p.reward_division += 1
-                    p.shared_reward_player_ids.append(players[j].player_id)
-
-        return players
-
-    def __put_cache_item(self, key: str, item: any):
-        response = self.dynamodb.put_json_item(key=key, data=item)
-        return response
-
-    def __lookup_gameweek_result_cache(
+    async def __put_gameweek_result_caches(
         self,
-        gameweek: int,
-        league_id: int,
-    ) -> Optional[List[PlayerGameweekData]]:
-        response = self.dynamodb.get_item_by_hash_key(
-            key=_construct_cache_hash(league_id, gameweek)
+        gameweeks_players: Dict[int, List[PlayerGameweekData]],
+        league: _LeagueContext,
+    ):
+        await self.result_cache.aput_many(
+            {
+                _construct_cache_hash(
+                    league.league_id, gameweek, league.cache_generation
+                ): (encode_gameweek_results(players), players)
+                for gameweek, players in gameweeks_players.items()
+            },
+            expires_in=RESULT_CACHE_EXPIRY,
         )
-        item = response.get("Item")
-        if item is None:
-            return None
-
-        logger.info(f"cache hit for gameweek {gameweek}")
 
-        data = item.get("DATA").get("S")
-        players_objs = json.loads(data)
-        player_data_dict = dict.fromkeys(PlayerGameweekData().to_json().keys())
-        players: List[PlayerGameweekData] = []
-        for player_obj in players_objs:
-            init_dict = {}
-            for key in player_data_dict:
-                init_dict[key] = player_obj[key]
-            player = PlayerGameweekData(**init_dict)
-            players.append(player)
-        return players
+    async def __lookup_gameweek_result_caches(
+        self,
+        gameweeks: List[int],
+        league: _LeagueContext,
+    ) -> Dict[int, List[PlayerGameweekData]]:
+        keys = {
+            _construct_cache_hash(league.league_id, gw, league.cache_generation): gw
+            for gw in gameweeks
+        }
+        caches = await self.result_cache.aget_many(
+            list(keys), _decode_gameweek_results_item, expires_in=RESULT_CACHE_EXPIRY
+        )
+        if len(caches) > 0:
+            logger.info(f"cache hit for gameweeks {sorted(keys[k] for k in caches)}")
+        # the cached lists are shared with later lookups
+        return {keys[key]: list(players) for key, players in caches.items()}
 
     async def get_gameweek_live_event(
         self, gameweek: int
@@ -334,47 +615,48 @@ class Service:
             player_picks_dict[player_data.team_name] = []
 
         results: List[FPLFantasyTeam] = await asyncio.gather(*futures)
+        logger.info(
+            f"FPL scheduler metrics: {self.fpl_adapter.get_scheduler_metrics()}"
+        )
 
         return results, players_data
 
     @util.time_track(description="List player gameweek picks")
     async def list_player_gameweek_picks(self, gameweek: int, league_id: int):
-        gameweek_live_event_dict: Dict[int, FPLLiveEventElement] = (
-            await self.get_gameweek_live_event(gameweek=gameweek)
-        )
+        live_elements = await self.get_gameweek_live_event(gameweek=gameweek)
         fantasy_teams, players_data = await self.__list_fantasy_teams(
             gameweek=gameweek, league_id=league_id
         )
 
-        bootstrap_data = await self.fpl_adapter.get_bootstrap()
-        elements = bootstrap_data.elements
+        bootstrap = await self.bootstrap_cache.get()
         players_gameweek_picks: List[PlayerGameweekPicksData] = []
 
         for r, player_data in zip(fantasy_teams, players_data):
-            picks: List[BootstrapElement] = []
+            picks: List[PickView] = []
             for pick in r.picks:
-                for element in elements:
-                    if element.id == pick.element:
-                        # need to create new instance to avoid mutation
-                        new_element = BootstrapElement(**asdict(element))
-                        new_element.is_subsituition = pick.position > 11
-                        new_element.pick_position = pick.position
-                        new_element.is_captain = pick.is_captain
-                        new_element.is_vice_captain = pick.is_vice_captain
-                        gameweek_live_event = gameweek_live_event_dict[element.id]
-                        gameweek_minutes_played = gameweek_live_event.stats.minutes
-                        gameweek_points = gameweek_live_event.stats.total_points * (
-                            pick.multiplier if pick.multiplier > 0 else 1
-                        )
-                        new_element.gameweek_points = (
-                            gameweek_points if gameweek_minutes_played > 0 else None
-                        )
-
-                        picks.append(new_element)
+                element = bootstrap.get_element(pick.element)
+                if element is None:
+                    continue
+                live_element = live_elements.get(pick.element)
+                gameweek_points: Optional[int] = None
+                if live_element is not None and live_element.stats.minutes > 0:
+                    gameweek_points = live_element.stats.total_points * (
+                        pick.multiplier if pick.multiplier > 0 else 1
+                    )
+                picks.append(
+                    PickView(
+                        element=element,
+                        pick_position=pick.position,
+                        multiplier=pick.multiplier,
+                        is_captain=pick.is_captain,
+                        is_vice_captain=pick.is_vice_captain,
+                        gameweek_points=gameweek_points,
+                    )
+                )
             players_gameweek_picks.append(
                 PlayerGameweekPicksData(
                     player=player_data,
-                    picked_elements=picks,
+                    picks=picks,
                     event_transfers=r.entry_history.event_transfers,
                     event_transfers_cost=r.entry_history.event_transfers_cost,
                 )
@@ -382,11 +664,41 @@ class Service:
 
         return players_gameweek_picks
 
-    def clear_gameweek_result_cache(self, gameweek: int, league_id: str):
-        return self.dynamodb.delete_item_by_hash_key(
-            _construct_cache_hash(league_id, gameweek)
+    def get_cache_generation(self, league_id: int) -> int:
+        return self.result_cache.get(
+            _construct_generation_key(league_id),
+            _decode_cache_generation,
+            ttl=CACHE_GENERATION_CACHE_TTL,
+            default=0,
+        )
+
+    async def aget_cache_generation(self, league_id: int) -> int:
+        return await self.result_cache.aget(
+            _construct_generation_key(league_id),
+            _decode_cache_generation,
+            ttl=CACHE_GENERATION_CACHE_TTL,
+            default=0,
         )
 
+    def clear_league_result_caches(self, league_id: int) -> int:
+        """
+        Invalidate every cached gameweek result of a league with one write by
+        moving it to a new cache generation. The revenue ledger is reset, its
+        gameweeks are computed again when revenues are next listed.
+
+        Returns:
+        - int: The new cache generation.
+        """
+        generation = self.result_cache.increment(
+            _construct_generation_key(league_id), ttl=CACHE_GENERATION_CACHE_TTL
+        )
+        logger.info(f"league {league_id} cache generation is now {generation}")
+        # revenues of the ledger were computed with the replaced results
+        is_ok = self.firebase_repo.delete_league_revenue_ledger(league_id)
+        if not is_ok:
+            raise Exception("unable to reset revenue ledger")
+        return generation
+
     async def list_league_teams(self):
-        bootstrap = await self.fpl_adapter.get_bootstrap()
+        bootstrap = await self.bootstrap_cache.get()
         return bootstrap.teams
@@ -7,7 +7,7 @@ from models import (
     FPLEventStatusResponse,
     PlayerGameweekPicksData,
     PlayerPosition,
-    BootstrapElement,
+    PickView,
     FPLMatchFixture,
     BootstrapTeam,
 )
@@ -403,7 +403,7 @@ class PlayerGameweekPickMessage:
 
     def build(self):
         player = self.__player_data.player
-        picks = self.__player_data.picked_elements
+        picks = self.__player_data.picks
         container = {
             "type": "bubble",
             "size": "giga",
@@ -536,7 +536,7 @@ class PlayerGameweekPickMessageV2:
         total_points = 0
         transfer_cost = self.player_picks.event_transfers_cost
         transfer_count = self.player_picks.event_transfers
-        for p in self.player_picks.picked_elements:
+        for p in self.player_picks.picks:
             if not p.is_subsituition:
                 total_points += (
                     p.gameweek_points if p.gameweek_points is not None else 0
@@ -646,15 +646,15 @@ class PlayerGameweekPickMessageV2:
         }
         container_contents: List[dict] = container["body"]["contents"]
 
-        position_map: Dict[PlayerPosition, List[BootstrapElement]] = {
+        position_map: Dict[PlayerPosition, List[PickView]] = {
             PlayerPosition.GOAL_KEEPER: [],
             PlayerPosition.DEFENDER: [],
             PlayerPosition.MIDFIELDER: [],
             PlayerPosition.FORWARD: [],
         }
 
-        subs: List[BootstrapElement] = []
-        for p in self.player_picks.picked_elements:
+        subs: List[PickView] = []
+        for p in self.player_picks.picks:
             if not p.is_subsituition:
                 position_map[p.position].append(p)
             else:
@@ -686,7 +686,7 @@ class PlayerGameweekPickMessageV2:
 
         return container
 
-    def __construct_player_position_section(self, players: List[BootstrapElement]):
+    def __construct_player_position_section(self, players: List[PickView]):
         content = {
             "type": "box",
             "margin": "xl",
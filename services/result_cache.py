@@ -0,0 +1,272 @@
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from adapter import DynamoDB, AsyncDynamoDB
+
+T = TypeVar("T")
+
+
+def _expires_within(item: dict, seconds: float) -> bool:
+    # items written without an expiry are given one
+    expires_at = item.get(DynamoDB.EXPIRES_AT)
+    if expires_at is None:
+        return True
+    return time.time() < float(expires_at["N"]) <= time.time() + seconds
+
+
+@dataclass
+class TierStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0
+        return self.hits / lookups
+
+
+class LRUCache:
+    MAX_ITEMS = 512
+    TTL = 300
+
+    def __init__(self, max_items: int = MAX_ITEMS, ttl: float = TTL):
+        """
+        In-process cache bounded by size and age. Safe to use from worker
+        threads.
+
+        Parameters:
+        - max_items (int): Least recently used items are evicted beyond this.
+        - ttl (float): Default seconds an item is served after it is put.
+        """
+        self.__max_items = max_items
+        self.__ttl = ttl
+        # key -> (expires_at, value)
+        self.__items: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.stats = TierStats()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__items.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self.__items[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.__items.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.__ttl if ttl is None else ttl
+        with self.__lock:
+            self.__items[key] = (time.monotonic() + ttl, value)
+            self.__items.move_to_end(key)
+            while len(self.__items) > self.__max_items:
+                self.__items.popitem(last=False)
+
+    def invalidate(self, key: str):
+        with self.__lock:
+            self.__items.pop(key, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__items.clear()
+
+
+class TieredCache:
+    def __init__(
+        self,
+        dynamodb: DynamoDB,
+        l1: Optional[LRUCache] = None,
+        async_dynamodb: Optional[AsyncDynamoDB] = None,
+    ):
+        """
+        Items of the DynamoDB cache table behind an in-process LRU of their
+        decoded values, so a warm Lambda skips the DynamoDB round trip.
+
+        Writes go through both tiers. Other Lambda instances
+        writing the same key are only seen once the L1 entry expires. The
+        methods prefixed with `a` are awaited through `async_dynamodb` and
+        share the LRU with the blocking ones.
+        """
+        self.__dynamodb = dynamodb
+        self.__async_dynamodb = async_dynamodb
+        self.__l1 = l1 if l1 is not None else LRUCache()
+        self.__l2_stats = TierStats()
+
+    def __resolve(
+        self,
+        key: str,
+        item: Optional[dict],
+        decode: Callable[[dict], T],
+        ttl: Optional[float],
+        default: Optional[T] = None,
+    ) -> Optional[T]:
+        """
+        Decode the DynamoDB item of `key` and keep it in the LRU. Expired
+        items and items `decode` returns None for are treated as missing.
+        """
+        value = None
+        if item is not None and not DynamoDB.is_expired(item):
+            value = decode(item)
+        if value is None:
+            self.__l2_stats.misses += 1
+            if default is not None:
+                self.__l1.put(key, default, ttl=ttl)
+            return default
+        self.__l2_stats.hits += 1
+        self.__l1.put(key, value, ttl=ttl)
+        return value
+
+    def __lookup_l1(self, keys: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        values: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in keys:
+            value = self.__l1.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                values[key] = value
+        return values, missing
+
+    def __resolve_many(
+        self,
+        values: Dict[str, T],
+        missing: List[str],
+        items: Dict[str, dict],
+        decode: Callable[[dict], T],
+        ttl: Optional[float],
+    ) -> Dict[str, T]:
+        for key in missing:
+            value = self.__resolve(key, items.get(key), decode, ttl)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def get(
+        self,
+        key: str,
+        decode: Callable[[dict], T],
+        ttl: Optional[float] = None,
+        default: Optional[T] = None,
+    ) -> Optional[T]:
+        """
+        Look up `key` in the LRU, then in DynamoDB. A DynamoDB item is
+        decoded with `decode` and kept in the LRU for `ttl` seconds. Expired
+        items and items `decode` returns None for are treated as missing.
+        A `default` other than None is kept in the LRU for missing items.
+        """
+        value = self.__l1.get(key)
+        if value is not None:
+            return value
+        item = self.__dynamodb.get_item_by_hash_key(key).get("Item")
+        return self.__resolve(key, item, decode, ttl, default)
+
+    async def aget(
+        self,
+        key: str,
+        decode: Callable[[dict], T],
+        ttl: Optional[float] = None,
+        default: Optional[T] = None,
+    ) -> Optional[T]:
+        value = self.__l1.get(key)
+        if value is not None:
+            return value
+        response = await self.__async_dynamodb.get_item_by_hash_key(key)
+        return self.__resolve(key, response.get("Item"), decode, ttl, default)
+
+    async def aget_many(
+        self,
+        keys: List[str],
+        decode: Callable[[dict], T],
+        ttl: Optional[float] = None,
+        expires_in: Optional[float] = None,
+    ) -> Dict[str, T]:
+        """
+        Like aget for many keys. Keys missing from the LRU are read from
+        DynamoDB in batches.
+
+        Items read from DynamoDB that are past half of `expires_in`, if
+        given, have their expiry moved `expires_in` seconds out, so the
+        table's TTL only deletes items nobody reads.
+
+        Returns:
+        - Dict[str, T]: Values of the keys found in either tier.
+        """
+        values, missing = self.__lookup_l1(keys)
+        if len(missing) == 0:
+            return values
+        items = await self.__async_dynamodb.batch_get_items_by_hash_keys(missing)
+        if expires_in is not None:
+            await asyncio.gather(
+                *[
+                    self.__async_dynamodb.refresh_expiry(key, expires_in)
+                    for key, item in items.items()
+                    if _expires_within(item, expires_in / 2)
+                ]
+            )
+        return self.__resolve_many(values, missing, items, decode, ttl)
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        value: Any,
+        ttl: Optional[float] = None,
+        expires_in: Optional[float] = None,
+    ):
+        """
+        Write `data` to DynamoDB, as a binary attribute when it is bytes and
+        as JSON otherwise, and keep its decoded `value` in the LRU. The
+        DynamoDB item expires after `expires_in` seconds, if given.
+        """
+        if isinstance(data, bytes):
+            response = self.__dynamodb.put_binary_item(
+                key=key, data=data, expires_in=expires_in
+            )
+        else:
+            response = self.__dynamodb.put_json_item(
+                key=key, data=data, expires_in=expires_in
+            )
+        self.__l1.put(key, value, ttl=ttl)
+        return response
+
+    async def aput_many(
+        self,
+        items: Dict[str, Tuple[Any, Any]],
+        ttl: Optional[float] = None,
+        expires_in: Optional[float] = None,
+    ):
+        """
+        Like put for many keys, written to DynamoDB in batches.
+
+        Parameters:
+        - items (Dict[str, Tuple[Any, Any]]): (data, value) by key.
+        """
+        await self.__async_dynamodb.batch_put_items(
+            {key: data for key, (data, _) in items.items()}, expires_in=expires_in
+        )
+        for key, (_, value) in items.items():
+            self.__l1.put(key, value, ttl=ttl)
+
+    def increment(self, key: str, ttl: Optional[float] = None) -> int:
+        """
+        Atomically increment the counter at `key` in DynamoDB and keep the
+        new count in the LRU.
+        """
+        count = self.__dynamodb.increment_counter(key)
+        self.__l1.put(key, count, ttl=ttl)
+        return count
+
+    def stats(self) -> Dict[str, TierStats]:
+        return {"l1": self.__l1.stats, "dynamodb": self.__l2_stats}
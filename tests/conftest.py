@@ -0,0 +1,181 @@
+import json
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional
+import httpx
+import pytest
+from adapter import FPLAdapter, RequestScheduler, ResponseCache, RetryPolicy
+from benchmark.dynamodb_server import LocalDynamoDB, make_server
+from benchmark.fpl_server import SyntheticFPL, split_path
+from models import PlayerData
+from services import FPLService, FirebaseRepo
+
+BASE_URL = "http://fpl.local"
+LEAGUE_ID = 1
+
+
+class FPLServer:
+    def __init__(self, fpl: SyntheticFPL):
+        """
+        Serve a SyntheticFPL through httpx.MockTransport, with an ETag on
+        every response and 304s for matching If-None-Match headers.
+
+        `fault(request)` may return a response or raise instead of serving.
+        """
+        self.fpl = fpl
+        self.paths: List[str] = []
+        self.fault: Optional[Callable[[httpx.Request], Optional[httpx.Response]]] = None
+        self.transport = httpx.MockTransport(self.__handle)
+
+    def __handle(self, request: httpx.Request) -> httpx.Response:
+        path, query = split_path(request.url.raw_path.decode("ascii"))
+        self.paths.append(path)
+        if self.fault is not None:
+            response = self.fault(request)
+            if response is not None:
+                return response
+        status, body = self.fpl.handle(path, query)
+        response = httpx.Response(status, json=body)
+        etag = '"' + hashlib.sha1(response.content).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+    def count(self, fragment: str) -> int:
+        return sum(1 for path in self.paths if fragment in path)
+
+
+@pytest.fixture
+def fpl_server() -> FPLServer:
+    return FPLServer(SyntheticFPL(managers=10, num_elements=50))
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def new_adapter(fpl_server: FPLServer):
+    def new_adapter(**kwargs) -> FPLAdapter:
+        kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0))
+        # the synthetic server needs no pacing
+        kwargs.setdefault("scheduler", RequestScheduler(rate=1000, burst=1000))
+        return FPLAdapter(
+            cookies="",
+            base_url=BASE_URL,
+            transport=fpl_server.transport,
+            **kwargs,
+        )
+
+    return new_adapter
+
+
+class InMemoryDatabase:
+    def __init__(self):
+        """
+        database.FirebaseRealtimeDatabase keeping JSON values by path. Like
+        the realtime database, empty values are not stored.
+        """
+        self.data: Dict[str, Any] = {}
+        self.writes: List[str] = []
+        self.__ref = ""
+
+    def set_ref(self, path):
+        self.__ref = f"{self.__ref}/{path}"
+        return self
+
+    def __put(self, path, data):
+        self.writes.append(path)
+        key = f"{self.__ref}/{path}"
+        if data is None or data in ({}, []):
+            self.data.pop(key, None)
+        else:
+            self.data[key] = json.loads(json.dumps(data))
+
+    def delete_data(self, path):
+        self.__put(path, None)
+        return True
+
+    def put_data(self, path, data):
+        self.__put(path, data)
+        return True
+
+    def update_data(self, path, update):
+        data = update(self.get_data(path))
+        self.__put(path, data)
+        return data
+
+    def get_data(self, path):
+        data = self.data.get(f"{self.__ref}/{path}")
+        return None if data is None else json.loads(json.dumps(data))
+
+
+@pytest.fixture
+def aws_environment(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+
+
+@pytest.fixture
+def local_dynamodb(aws_environment, monkeypatch) -> LocalDynamoDB:
+    dynamodb = LocalDynamoDB()
+    server = make_server(dynamodb, port=0)
+    host, port = server.server_address
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("DYNAMODB_ENDPOINT_URL", f"http://{host}:{port}")
+    yield dynamodb
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def firebase_db() -> InMemoryDatabase:
+    return InMemoryDatabase()
+
+
+@pytest.fixture
+def firebase_repo(firebase_db) -> FirebaseRepo:
+    return FirebaseRepo(firebase=firebase_db)
+
+
+@pytest.fixture
+def new_service(local_dynamodb, firebase_repo, new_adapter):
+    def new_service(**kwargs) -> FPLService:
+        return FPLService(
+            config=None,
+            fpl_adapter=new_adapter(**kwargs),
+            firebase_repo=firebase_repo,
+        )
+
+    return new_service
+
+
+@pytest.fixture
+def league(fpl_server: FPLServer, firebase_repo: FirebaseRepo) -> int:
+    """
+    League LEAGUE_ID of every synthetic manager, the first one winning and
+    the last one paying each gameweek.
+    """
+    entry_ids = fpl_server.fpl.entry_ids
+    firebase_repo.put_league_players(
+        LEAGUE_ID,
+        [
+            PlayerData(
+                bank_account="",
+                player_id=entry_id,
+                season_rank=rank,
+                name=f"Manager {entry_id}",
+                team_name=f"Team {entry_id}",
+            )
+            for rank, entry_id in enumerate(entry_ids, 1)
+        ],
+    )
+    rewards = [0.0] * len(entry_ids)
+    rewards[0], rewards[-1] = 10.0, -10.0
+    firebase_repo.put_league_rewards(LEAGUE_ID, rewards)
+    return LEAGUE_ID
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from typing import List
+from adapter import AsyncDynamoDB
+
+
+class FakeSession:
+    def __init__(self):
+        """
+        aioboto3.Session recording the loops its clients are opened and
+        closed on.
+        """
+        self.opened: List[asyncio.AbstractEventLoop] = []
+        self.closed: List[asyncio.AbstractEventLoop] = []
+
+    def client(self, service_name: str, endpoint_url=None):
+        return FakeClient(self)
+
+
+class FakeClient:
+    # a class based context manager like aiobotocore's client, which unlike
+    # a generator based one is not finalized by the loop
+    def __init__(self, session: FakeSession):
+        self.__session = session
+
+    async def __aenter__(self):
+        self.__session.opened.append(asyncio.get_running_loop())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.__session.closed.append(asyncio.get_running_loop())
+
+
+def test_client_is_shared_on_a_loop():
+    session = FakeSession()
+    dynamodb = AsyncDynamoDB("FPLCacheTable", session=session)
+
+    async def run():
+        clients = await asyncio.gather(*[dynamodb.open() for _ in range(4)])
+        await dynamodb.close()
+        return clients
+
+    clients = asyncio.run(run())
+
+    assert len(set(map(id, clients))) == 1
+    assert len(session.opened) == 1
+    assert session.closed == session.opened
+
+
+def test_client_is_closed_on_its_own_loop_when_the_loop_finishes():
+    session = FakeSession()
+    dynamodb = AsyncDynamoDB("FPLCacheTable", session=session)
+
+    asyncio.run(dynamodb.open())
+    asyncio.run(dynamodb.open())
+
+    assert len(session.opened) == 2
+    assert session.closed == session.opened
+
+
+def test_close_closes_clients_of_other_running_loops():
+    session = FakeSession()
+    dynamodb = AsyncDynamoDB("FPLCacheTable", session=session)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(dynamodb.open(), loop).result()
+
+        async def run():
+            await dynamodb.open()
+            await dynamodb.close()
+
+        asyncio.run(run())
+
+        assert session.opened[0] is loop
+        assert sorted(map(id, session.closed)) == sorted(map(id, session.opened))
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
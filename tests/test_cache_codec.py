@@ -0,0 +1,74 @@
+import json
+import zlib
+from dataclasses import asdict
+import pytest
+from models import PlayerGameweekData, decode_gameweek_results, encode_gameweek_results
+from models.cache_codec import CACHE_CODEC_VERSION
+
+PLAYERS = [
+    PlayerGameweekData(
+        name="Manager ก",
+        team_name="Team 1",
+        subsitution_cost=4,
+        player_id=1,
+        points=61,
+        reward_division=2,
+        shared_reward_player_ids=[1, 2],
+        reward=-12.5,
+        captain_points=16,
+        vice_captain_points=2,
+        bank_account="123-4",
+    ),
+    PlayerGameweekData(player_id=2, points=55.5),
+]
+
+
+def test_encoded_results_round_trip():
+    data = encode_gameweek_results(PLAYERS)
+
+    assert data[0] == CACHE_CODEC_VERSION
+    assert decode_gameweek_results(data) == PLAYERS
+
+
+def test_json_written_before_the_codec_is_decoded():
+    data = json.dumps([asdict(p) for p in PLAYERS])
+
+    assert decode_gameweek_results(data) == PLAYERS
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        bytes([CACHE_CODEC_VERSION]),
+        bytes([CACHE_CODEC_VERSION]) + b"not zlib",
+        encode_gameweek_results(PLAYERS)[:-4],
+        bytes([CACHE_CODEC_VERSION]) + zlib.compress(b"[1, "),
+        bytes([255]) + zlib.compress(b"[]"),
+        bytes([CACHE_CODEC_VERSION]) + zlib.compress(b'{"rows": []}'),
+        bytes([CACHE_CODEC_VERSION]) + zlib.compress(b"[[1, 2]]"),
+        bytes([CACHE_CODEC_VERSION]) + zlib.compress(b"[1]"),
+        json.dumps([{"player_id": 1}]),
+        json.dumps([[1, 2]]),
+        json.dumps({"player_id": 1}),
+        json.dumps(1),
+    ],
+    ids=[
+        "empty",
+        "version only",
+        "not zlib",
+        "truncated",
+        "bad json",
+        "version",
+        "rows not a list",
+        "short row",
+        "row not a list",
+        "legacy missing field",
+        "legacy row not an object",
+        "legacy not a list",
+        "legacy number",
+    ],
+)
+def test_corrupt_payloads_raise_value_error(data):
+    with pytest.raises(ValueError):
+        decode_gameweek_results(data)
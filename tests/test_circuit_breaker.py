@@ -0,0 +1,128 @@
+import asyncio
+import httpx
+import pytest
+from adapter import CircuitBreaker, CircuitState, FPLError
+from tests.conftest import FPLServer
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_circuit_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.trip()
+
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_opens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0)
+    breaker.trip()
+
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_released_probe_lets_another_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.trip()
+
+    assert breaker.allow()
+    breaker.release()
+
+    assert breaker.allow()
+
+
+def _undecodable_once(fpl_server: FPLServer, fragment: str):
+    failed = []
+
+    def fault(request: httpx.Request):
+        if fragment in request.url.path and len(failed) == 0:
+            failed.append(request)
+            return httpx.Response(200, content=b"[1, 2]")
+        return None
+
+    fpl_server.fault = fault
+
+
+@pytest.mark.parametrize(
+    "fragment,fetch",
+    [
+        ("/event-status", lambda adapter: adapter.get_gameweek_event_status()),
+        ("/bootstrap-static", lambda adapter: adapter.get_bootstrap()),
+    ],
+)
+def test_undecodable_probe_does_not_wedge_the_circuit(
+    fpl_server: FPLServer, new_adapter, fragment, fetch
+):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.trip()
+    adapter = new_adapter(circuit_breaker=breaker)
+    _undecodable_once(fpl_server, fragment)
+
+    async def run():
+        try:
+            with pytest.raises(Exception):
+                await fetch(adapter)
+            return await fetch(adapter)
+        finally:
+            await adapter.close()
+
+    assert asyncio.run(run()) is not None
+    assert breaker.state == CircuitState.CLOSED
+
+
+def _collect(adapter, **kwargs):
+    async def run():
+        try:
+            return [item async for item in adapter.stream_bootstrap(**kwargs)]
+        finally:
+            await adapter.close()
+
+    return asyncio.run(run())
+
+
+def test_stream_bootstrap_is_retried(fpl_server: FPLServer, new_adapter):
+    failed = []
+
+    def fault(request: httpx.Request):
+        if len(failed) == 0:
+            failed.append(request)
+            return httpx.Response(503)
+        return None
+
+    fpl_server.fault = fault
+
+    items = _collect(new_adapter(), sections=["teams"])
+
+    assert len(items) == 20
+    assert fpl_server.count("/bootstrap-static") == 2
+
+
+def test_stream_bootstrap_fails_fast_while_the_circuit_is_open(
+    fpl_server: FPLServer, new_adapter
+):
+    breaker = CircuitBreaker(reset_timeout=60)
+    breaker.trip()
+
+    with pytest.raises(FPLError, match="circuit breaker is open"):
+        _collect(new_adapter(circuit_breaker=breaker))
+    assert fpl_server.count("/bootstrap-static") == 0
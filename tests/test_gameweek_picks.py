@@ -0,0 +1,31 @@
+import asyncio
+from tests.conftest import LEAGUE_ID
+
+
+def test_picks_carry_live_points_of_played_elements(league, fpl_server, new_service):
+    fpl = fpl_server.fpl
+    gameweek = fpl.current_gameweek
+    service = new_service()
+
+    async def run():
+        try:
+            return await service.list_player_gameweek_picks(gameweek, LEAGUE_ID)
+        finally:
+            await service.close()
+
+    players_picks = asyncio.run(run())
+
+    live = {e["id"]: e["stats"] for e in fpl.live(gameweek)["elements"]}
+    assert [p.player.player_id for p in players_picks] == fpl.entry_ids
+    for player_picks in players_picks:
+        picks = fpl.picks(player_picks.player.player_id, gameweek)["picks"]
+        assert [p.element.id for p in player_picks.picks] == [
+            p["element"] for p in picks
+        ]
+        for view, pick in zip(player_picks.picks, picks):
+            stats = live[pick["element"]]
+            if stats["minutes"] == 0:
+                assert view.gameweek_points is None
+            else:
+                multiplier = max(pick["multiplier"], 1)
+                assert view.gameweek_points == stats["total_points"] * multiplier
@@ -0,0 +1,36 @@
+import asyncio
+import pytest
+from adapter import FPLAdapter
+from benchmark.fpl_server import PAGE_SIZE, SyntheticFPL
+from tests.conftest import FPLServer
+
+
+def _list_standings(adapter: FPLAdapter, league_id: int, **kwargs):
+    async def run():
+        try:
+            return await adapter.list_classic_league_standings(league_id, **kwargs)
+        finally:
+            await adapter.close()
+
+    return asyncio.run(run())
+
+
+def test_single_page_is_requested_once(fpl_server: FPLServer, new_adapter):
+    entries = _list_standings(new_adapter(), fpl_server.fpl.league_id)
+
+    assert [e.entry for e in entries] == fpl_server.fpl.entry_ids
+    assert fpl_server.count("/leagues-classic/") == 1
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, 3, 5])
+def test_pages_past_the_last_are_bounded_by_the_prefetch(new_adapter, max_concurrency):
+    fpl_server = FPLServer(SyntheticFPL(managers=3 * PAGE_SIZE - 1))
+    adapter = FPLAdapter(cookies="", transport=fpl_server.transport)
+
+    entries = _list_standings(
+        adapter, fpl_server.fpl.league_id, max_concurrency=max_concurrency
+    )
+
+    assert [e.entry for e in entries] == fpl_server.fpl.entry_ids
+    prefetch = max_concurrency - 1
+    assert fpl_server.count("/leagues-classic/") <= 3 + max(0, prefetch - 1)
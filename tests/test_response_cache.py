@@ -0,0 +1,155 @@
+import time
+import sqlite3
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from adapter import FPLAdapter, ResponseCache
+from tests.conftest import BASE_URL
+
+
+def test_cache_is_usable_from_other_threads(response_cache: ResponseCache):
+    def put_and_get(i: int) -> bytes:
+        url = f"{BASE_URL}/api/entry/{i}/history/"
+        response_cache.put(url, f"body {i}".encode(), ttl=60)
+        return response_cache.get(url)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        bodies = list(executor.map(put_and_get, range(16)))
+
+    assert bodies == [f"body {i}".encode() for i in range(16)]
+
+
+def test_expired_entries_are_purged_on_open(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(path=path)
+    cache.put("expired", b"", ttl=-1)
+    cache.put("revalidatable", b"", ttl=-1, etag='"a"')
+    cache.put("stale", b"", ttl=-ResponseCache.MAX_STALE_AGE - 1, etag='"b"')
+    cache.put("fresh", b"", ttl=60)
+    cache.put("immutable", b"", ttl=None)
+    cache.close()
+
+    cache = ResponseCache(path=path)
+    try:
+        assert cache.get_entry("expired") is None
+        assert cache.get_entry("revalidatable") is not None
+        assert cache.get_entry("stale") is None
+        assert cache.get("fresh") == b""
+        assert cache.get("immutable") == b""
+    finally:
+        cache.close()
+
+
+def test_fresh_responses_are_served_from_cache(fpl_server, response_cache, new_adapter):
+    adapter: FPLAdapter = new_adapter(response_cache=response_cache)
+
+    async def run():
+        try:
+            first = await adapter.get_gameweek_event_status()
+            second = await adapter.get_gameweek_event_status()
+        finally:
+            await adapter.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert fpl_server.count("/event-status") == 1
+
+
+def test_expired_responses_are_revalidated(fpl_server, response_cache, new_adapter):
+    url = f"{BASE_URL}/api/event-status"
+
+    async def run():
+        adapter: FPLAdapter = new_adapter(response_cache=response_cache)
+        try:
+            first = await adapter.get_gameweek_event_status()
+            response_cache.touch(url, ttl=-1)
+            second = await adapter.get_gameweek_event_status()
+        finally:
+            await adapter.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert fpl_server.count("/event-status") == 2
+    # the 304 extended the lifetime of the entry
+    assert response_cache.get(url) is not None
+
+
+def test_finished_gameweeks_of_the_season_are_cached_long(
+    fpl_server, response_cache, new_adapter
+):
+    response_cache.put_meta(
+        FPLAdapter.FINISHED_GAMEWEEK_META_KEY, f"{int(time.time()) - 3600}:5"
+    )
+    adapter: FPLAdapter = new_adapter(response_cache=response_cache)
+
+    async def run():
+        try:
+            await adapter.get_player_team_by_id(fpl_server.fpl.entry_ids[0], 5)
+        finally:
+            await adapter.close()
+
+    asyncio.run(run())
+
+    entry = response_cache.get_entry(
+        f"{BASE_URL}/api/entry/{fpl_server.fpl.entry_ids[0]}/event/5/picks"
+    )
+    # finite so the url of the next season's gameweek 5 is not served
+    expires_at = time.time() + FPLAdapter.FINISHED_GAMEWEEK_TTL
+    assert entry.expires_at == pytest.approx(expires_at, abs=60)
+    assert fpl_server.count("/bootstrap-static") == 0
+
+
+def test_finished_gameweek_of_an_older_season_is_ignored(
+    fpl_server, response_cache, new_adapter
+):
+    a_year_ago = int(time.time()) - 365 * 24 * 3600
+    response_cache.put_meta(FPLAdapter.FINISHED_GAMEWEEK_META_KEY, f"{a_year_ago}:38")
+    fpl = fpl_server.fpl
+    adapter: FPLAdapter = new_adapter(response_cache=response_cache)
+
+    async def run():
+        try:
+            await adapter.get_player_team_by_id(fpl.entry_ids[0], fpl.current_gameweek)
+        finally:
+            await adapter.close()
+
+    asyncio.run(run())
+
+    entry = response_cache.get_entry(
+        f"{BASE_URL}/api/entry/{fpl.entry_ids[0]}/event/{fpl.current_gameweek}/picks"
+    )
+    # the current gameweek is not finished in the synthetic season
+    assert entry.expires_at is not None
+    assert fpl_server.count("/bootstrap-static") == 1
+    season, gameweek = response_cache.get_meta(
+        FPLAdapter.FINISHED_GAMEWEEK_META_KEY
+    ).split(":")
+    assert int(season) != a_year_ago
+    assert int(gameweek) == fpl.current_gameweek - 1
+
+
+def test_entries_of_an_older_schema_are_dropped(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (url TEXT PRIMARY KEY, body BLOB NOT NULL, "
+        "stored_at REAL NOT NULL, expires_at REAL, etag TEXT, last_modified TEXT)"
+    )
+    # a finished gameweek of a past season, stored without an expiry
+    conn.execute(
+        "INSERT INTO responses VALUES (?, ?, ?, NULL, NULL, NULL)",
+        (f"{BASE_URL}/api/event/1/live", b"{}", time.time() - 365 * 24 * 3600),
+    )
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    cache = ResponseCache(path=path)
+    try:
+        assert cache.get_entry(f"{BASE_URL}/api/event/1/live") is None
+    finally:
+        cache.close()
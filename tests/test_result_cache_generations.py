@@ -0,0 +1,156 @@
+import os
+import time
+import asyncio
+from typing import Optional
+import pytest
+from adapter import DynamoDB, AsyncDynamoDB
+from benchmark.dynamodb_server import LocalDynamoDB
+from services.fpl_service import CACHE_TABLE_NAME, RESULT_CACHE_EXPIRY
+from tests.conftest import LEAGUE_ID
+
+
+def _item(dynamodb: LocalDynamoDB, key: str) -> Optional[dict]:
+    _, response = dynamodb.handle(
+        "GetItem", {"TableName": CACHE_TABLE_NAME, "Key": {"KEY": {"S": key}}}
+    )
+    return response.get("Item")
+
+
+def test_clearing_caches_is_one_write(
+    league, fpl_server, local_dynamodb: LocalDynamoDB, new_service
+):
+    service = new_service()
+    service.update_gameweek(fpl_server.fpl.current_gameweek)
+
+    async def compute():
+        await service.list_or_update_fpl_gameweek_tables(1, 2, LEAGUE_ID)
+
+    async def run():
+        try:
+            await compute()
+            requests = dict(local_dynamodb.requests)
+            generation = service.clear_league_result_caches(LEAGUE_ID)
+            writes = {
+                operation: count - requests.get(operation, 0)
+                for operation, count in local_dynamodb.requests.items()
+                if count != requests.get(operation, 0)
+            }
+            await compute()
+            return generation, writes
+        finally:
+            await service.close()
+
+    generation, writes = asyncio.run(run())
+
+    assert generation == 1
+    assert writes == {"UpdateItem": 1}
+    expires_at = time.time() + RESULT_CACHE_EXPIRY
+    for gameweek in (1, 2):
+        old = _item(local_dynamodb, f"{LEAGUE_ID}-gameweek-{gameweek}")
+        new = _item(local_dynamodb, f"{LEAGUE_ID}-g1-gameweek-{gameweek}")
+        # the replaced generation ages out with the expiry it was written with
+        assert old["DATA"] != {}
+        assert float(new[DynamoDB.EXPIRES_AT]["N"]) == pytest.approx(expires_at, abs=60)
+    # the replaced generation was recomputed instead of read
+    assert fpl_server.count("/history/") == 2 * len(fpl_server.fpl.entry_ids)
+
+
+def test_expiry_of_read_results_is_refreshed(
+    league, fpl_server, local_dynamodb: LocalDynamoDB, new_service
+):
+    async def run():
+        service = new_service()
+        service.update_gameweek(fpl_server.fpl.current_gameweek)
+        try:
+            return await service.list_or_update_fpl_gameweek_tables(1, 3, LEAGUE_ID)
+        finally:
+            await service.close()
+
+    first = asyncio.run(run())
+    expiring = _item(local_dynamodb, f"{LEAGUE_ID}-gameweek-1")
+    expiring[DynamoDB.EXPIRES_AT] = {"N": str(int(time.time() + 3600))}
+    legacy = _item(local_dynamodb, f"{LEAGUE_ID}-gameweek-2")
+    del legacy[DynamoDB.EXPIRES_AT]
+    fresh = _item(local_dynamodb, f"{LEAGUE_ID}-gameweek-3")
+    for item in (expiring, legacy):
+        local_dynamodb.handle("PutItem", {"TableName": CACHE_TABLE_NAME, "Item": item})
+    updates = local_dynamodb.requests.get("UpdateItem", 0)
+
+    second = asyncio.run(run())
+
+    assert first == second
+    expires_at = time.time() + RESULT_CACHE_EXPIRY
+    for gameweek in (1, 2):
+        item = _item(local_dynamodb, f"{LEAGUE_ID}-gameweek-{gameweek}")
+        assert float(item[DynamoDB.EXPIRES_AT]["N"]) == pytest.approx(
+            expires_at, abs=60
+        )
+    assert _item(local_dynamodb, f"{LEAGUE_ID}-gameweek-3") == fresh
+    assert local_dynamodb.requests["UpdateItem"] - updates == 2
+
+
+def test_cached_gameweeks_are_not_recomputed(
+    league, fpl_server, local_dynamodb: LocalDynamoDB, new_service
+):
+    async def run():
+        service = new_service()
+        service.update_gameweek(fpl_server.fpl.current_gameweek)
+        try:
+            return await service.list_or_update_fpl_gameweek_tables(1, 2, LEAGUE_ID)
+        finally:
+            await service.close()
+
+    first = asyncio.run(run())
+    # a new service reads the other instance's results from DynamoDB
+    second = asyncio.run(run())
+
+    assert first == second
+    assert fpl_server.count("/history/") == len(fpl_server.fpl.entry_ids)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"\x01corrupt", [{"player_id": 1}], [[1, 2]]],
+    ids=["corrupt", "legacy missing field", "legacy row not an object"],
+)
+def test_corrupt_cached_gameweek_is_recomputed(
+    league, fpl_server, local_dynamodb: LocalDynamoDB, new_service, data
+):
+    service = new_service()
+    service.update_gameweek(fpl_server.fpl.current_gameweek)
+    key = f"{LEAGUE_ID}-gameweek-1"
+    if isinstance(data, bytes):
+        service.dynamodb.put_binary_item(key, data)
+    else:
+        service.dynamodb.put_json_item(key, data)
+
+    async def run():
+        try:
+            return await service.list_or_update_fpl_gameweek_tables(1, 1, LEAGUE_ID)
+        finally:
+            await service.close()
+
+    (players,) = asyncio.run(run())
+
+    assert len(players) == len(fpl_server.fpl.entry_ids)
+    assert fpl_server.count("/history/") == len(fpl_server.fpl.entry_ids)
+
+
+def test_expiry_of_missing_items_is_not_refreshed(local_dynamodb: LocalDynamoDB):
+    dynamodb = DynamoDB(
+        CACHE_TABLE_NAME, endpoint_url=os.environ["DYNAMODB_ENDPOINT_URL"]
+    )
+    async_dynamodb = AsyncDynamoDB(
+        CACHE_TABLE_NAME, endpoint_url=os.environ["DYNAMODB_ENDPOINT_URL"]
+    )
+
+    async def refresh():
+        try:
+            return await async_dynamodb.refresh_expiry("deleted", 60)
+        finally:
+            await async_dynamodb.close()
+
+    assert dynamodb.refresh_expiry("deleted", 60) is False
+    assert asyncio.run(refresh()) is False
+    # no item was created by the update
+    assert _item(local_dynamodb, "deleted") is None
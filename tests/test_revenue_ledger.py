@@ -0,0 +1,88 @@
+import asyncio
+from services import FirebaseRepo
+from tests.conftest import LEAGUE_ID
+
+LEDGER_PATH = f"league_revenue_ledgers/{LEAGUE_ID}"
+
+
+def _cumulative_revenues(service, from_gameweek: int, to_gameweek: int):
+    async def run():
+        try:
+            return await service.list_players_cumulative_revenues(
+                from_gameweek, to_gameweek, LEAGUE_ID
+            )
+        finally:
+            await service.close()
+
+    return asyncio.run(run())
+
+
+def test_gameweeks_in_the_ledger_are_not_recomputed(
+    league, fpl_server, firebase_db, new_service
+):
+    service = new_service()
+    service.update_gameweek(fpl_server.fpl.current_gameweek)
+
+    first = _cumulative_revenues(service, 1, 3)
+    writes = firebase_db.writes.count(LEDGER_PATH)
+    requests = len(fpl_server.paths)
+    second = _cumulative_revenues(service, 2, 3)
+
+    assert second == {
+        player_id: [round(r - revenues[0], 2) for r in revenues[1:]]
+        for player_id, revenues in first.items()
+    }
+    assert sum(revenues[-1] for revenues in first.values()) == 0
+    assert firebase_db.writes.count(LEDGER_PATH) == writes == 1
+    assert len(fpl_server.paths) == requests
+
+
+def test_clearing_caches_recomputes_revenues(
+    league, fpl_server, firebase_repo: FirebaseRepo, new_service
+):
+    service = new_service()
+    service.update_gameweek(fpl_server.fpl.current_gameweek)
+    rewards = firebase_repo.list_league_gameweek_rewards(LEAGUE_ID)
+
+    before = _cumulative_revenues(service, 1, 2)
+    firebase_repo.put_league_rewards(LEAGUE_ID, [-reward for reward in rewards])
+    service.clear_league_result_caches(LEAGUE_ID)
+    after = _cumulative_revenues(service, 1, 2)
+
+    assert after == {
+        player_id: [-revenue for revenue in revenues]
+        for player_id, revenues in before.items()
+    }
+    assert before != after
+
+
+def test_revenues_of_a_league_without_rewards_are_empty(
+    league, fpl_server, firebase_db, firebase_repo: FirebaseRepo, new_service
+):
+    firebase_repo.put_league_rewards(LEAGUE_ID, [])
+    service = new_service()
+    service.update_gameweek(fpl_server.fpl.current_gameweek)
+
+    assert _cumulative_revenues(service, 1, 3) == {}
+    assert fpl_server.paths == []
+    assert firebase_db.writes.count(LEDGER_PATH) == 0
+
+
+def test_revenues_are_totals_of_the_season(league, fpl_server, new_service):
+    service = new_service()
+    service.update_gameweek(fpl_server.fpl.current_gameweek)
+
+    async def run():
+        try:
+            revenues = await service.list_players_revenues(LEAGUE_ID)
+            cumulative = await service.list_players_cumulative_revenues(
+                1, fpl_server.fpl.current_gameweek, LEAGUE_ID
+            )
+            return revenues, cumulative
+        finally:
+            await service.close()
+
+    revenues, cumulative = asyncio.run(run())
+
+    totals = {f"Manager {i}": revenues[-1] for i, revenues in cumulative.items()}
+    assert {p.name: p.revenue for p in revenues} == totals
@@ -0,0 +1,79 @@
+import asyncio
+from adapter import RequestPriority, RequestScheduler, request_priority
+from adapter.scheduler import SharedPriority, shared_request_priority
+from tests.conftest import FPLServer
+
+HOST = "fpl.local"
+
+
+def test_raised_shared_priority_requeues_a_waiting_request():
+    scheduler = RequestScheduler(max_concurrency=1, rate=1000, burst=1000)
+    order = []
+
+    async def request(name: str, priority: RequestPriority):
+        async with scheduler.slot(HOST, priority):
+            order.append(name)
+
+    async def shared_request(name: str, shared: SharedPriority):
+        with shared_request_priority(shared):
+            async with scheduler.slot(HOST):
+                order.append(name)
+
+    async def run():
+        shared = SharedPriority(RequestPriority.BACKGROUND)
+        async with scheduler.slot(HOST):
+            tasks = [
+                asyncio.ensure_future(
+                    request("background", RequestPriority.BACKGROUND)
+                ),
+                asyncio.ensure_future(shared_request("shared", shared)),
+            ]
+            await asyncio.sleep(0)
+            shared.raise_to(RequestPriority.INTERACTIVE)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ["shared", "background"]
+
+
+def test_interactive_caller_raises_the_priority_of_a_joined_request(
+    fpl_server: FPLServer, new_adapter
+):
+    scheduler = RequestScheduler(max_concurrency=1, rate=1000, burst=1000)
+    adapter = new_adapter(scheduler=scheduler)
+
+    async def run():
+        try:
+            async with scheduler.slot(HOST):
+                with request_priority(RequestPriority.BACKGROUND):
+                    background = asyncio.ensure_future(
+                        adapter.get_gameweek_live_event(1)
+                    )
+                    await asyncio.sleep(0)
+                    joined = asyncio.ensure_future(adapter.get_gameweek_event_status())
+                    await asyncio.sleep(0)
+                # joins the background request of event-status
+                interactive = asyncio.ensure_future(adapter.get_gameweek_event_status())
+                await asyncio.sleep(0)
+            await asyncio.gather(background, joined, interactive)
+        finally:
+            await adapter.close()
+
+    asyncio.run(run())
+
+    assert fpl_server.paths == ["/api/event-status", "/api/event/1/live"]
+
+
+def test_limits_are_read_from_the_environment(monkeypatch):
+    monkeypatch.setenv("FPL_REQUEST_RATE", "1000")
+    monkeypatch.setenv("FPL_REQUEST_BURST", "1")
+    scheduler = RequestScheduler.from_env()
+
+    async def run():
+        for _ in range(50):
+            async with scheduler.slot(HOST):
+                pass
+
+    # 50 requests take 5 seconds at the default rate
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
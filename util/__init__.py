@@ -1,6 +1,5 @@
 import time
 import asyncio
-import random
 import functools
 import pytz
 from loguru import logger
@@ -44,18 +43,6 @@ def time_track(func=None, description: str = ""):
     return decorator
 
 
-def add_noise(value, noise_factor=0.0000000099):
-    noise = random.uniform(0, noise_factor)
-    noisy_value = value + noise
-    return noisy_value
-
-
-def is_equal_float(a: float, b: float, precision=6):
-    difference = abs(a - b)
-    threshold = 10**-precision
-    return difference < threshold
-
-
 def convert_to_a1_notation(row, col):
     """
     Convert row and column indices to A1 notation.
@@ -79,8 +66,6 @@ def convert_to_a1_notation(row, col):
 
 __all__ = [
     "time_track",
-    "add_noise",
-    "is_equal_float",
     "convert_to_a1_notation",
     "RFC3339_FORMAT",
     "TIMEZONE",